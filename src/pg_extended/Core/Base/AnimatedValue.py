@@ -1,6 +1,9 @@
 from typing import Literal
-import time
+from math import comb
 from pg_extended.Core.Base.DynamicValue import DynamicValue
+from pg_extended.Core.Base.AnimationClock import AnimationClock
+from pg_extended.Core.Base.FrameEpoch import FrameEpoch
+from pg_extended.Core.Base.Expression import Expression, ExpressionOperators
 from pg_extended.Types import CallableLike
 
 class InterpolationAlgos:
@@ -117,6 +120,79 @@ class InterpolationAlgos:
 
 		return val
 
+	# --- precomputed forms, rebuilt only when the raw values change ---
+	# deCasteljau with an easing curve is the bezier polynomial evaluated at eased t, these are its bernstein weights
+	@staticmethod
+	def bernsteinWeights(vals: list[int | float]) -> list[float]:
+		n = len(vals) - 1
+
+		return [comb(n, i) * v for i, v in enumerate(vals)]
+
+	# horner evaluation of the bernstein form, split at .5 so the ratio stays <= 1
+	@staticmethod
+	def bernstein(weights: list[float], s: float) -> float:
+		n = len(weights) - 1
+		acc = 0.0
+
+		if s <= 0.5:
+			u = s / (1 - s)
+
+			for i in range(n, -1, -1):
+				acc = acc * u + weights[i]
+
+			return acc * (1 - s) ** n
+
+		u = (1 - s) / s
+
+		for weight in weights:
+			acc = acc * u + weight
+
+		return acc * s ** n
+
+	# per segment cubic coefficients of the catmull-rom spline through vals
+	@staticmethod
+	def catmullRomSegments(vals: list[int | float]) -> list[tuple[float, float, float, float]]:
+		padded = [vals[0]] + list(vals) + [vals[-1]]
+		segments = []
+
+		for seg in range(len(padded) - 3):
+			p0, p1, p2, p3 = padded[seg:seg + 4]
+
+			segments.append((
+				p1,
+				0.5 * (-p0 + p2),
+				0.5 * (2*p0 - 5*p1 + 4*p2 - p3),
+				0.5 * (-p0 + 3*p1 - 3*p2 + p3)
+			))
+
+		return segments
+
+	@staticmethod
+	def catmullRomSegment(segments: list[tuple[float, float, float, float]], t: float) -> float:
+		n = len(segments)
+
+		seg = min(int(t * n), n - 1)
+		local_t = (t - seg / n) * n
+
+		c0, c1, c2, c3 = segments[seg]
+
+		return c0 + local_t * (c1 + local_t * (c2 + local_t * c3))
+
+	# samples an easing curve (t -> eased t) at a fixed resolution
+	@staticmethod
+	def easingTable(easing: CallableLike, resolution: int) -> list[float]:
+		return [easing(i / resolution) for i in range(resolution + 1)]
+
+	@staticmethod
+	def sampleTable(table: list[float], t: float) -> float:
+		x = t * (len(table) - 1)
+		i = int(x)
+
+		if i >= len(table) - 1:
+			return table[-1]
+
+		return table[i] + (table[i + 1] - table[i]) * (x - i)
+
 INTERPOLATION_TYPES = ['linear', 'easeIn', 'easeOut', 'easeInOut', 'custom']
 INTERPOLATION_TYPES_TYPE = Literal['linear', 'easeIn', 'easeOut', 'easeInOut', 'custom']
 
@@ -135,6 +211,14 @@ INTERPOLATION_MAP = {
 	'easeInOut': InterpolationAlgos.easeInOut
 }
 
+# the curves behind the interpolation functions, t -> eased t
+EASING_MAP = {
+	'linear': lambda t: t,
+	'easeIn': lambda t: t ** 2,
+	'easeOut': lambda t: 1 - (1 - t) ** 2,
+	'easeInOut': lambda t: t**3 * (t * (t * 6 - 15) + 10)
+}
+
 REDUCER_MAP = {
 	'deCasteljau': InterpolationAlgos.deCasteljau,
 	'linearChain': InterpolationAlgos.linearChain,
@@ -143,8 +227,14 @@ REDUCER_MAP = {
 	'catmullRom': InterpolationAlgos.catmullRom
 }
 
-class AnimatedValue:
-	def __init__(self, values: valuesType, duration: float, defaultPos: DEFAULT_POS_VALS_TYPE = 'start', interpolation: INTERPOLATION_TYPES_TYPE = 'linear', reducer: REDUCER_TYPES_TYPE = 'deCasteljau', callback: CallableLike = None, customInterpolation: CallableLike = None, customReducer: CallableLike = None, resolveNow: bool = True):
+class AnimatedValue(ExpressionOperators):
+	__slots__ = (
+		'values', 'rawValues', 'duration', 'interpolation', 'reducer', 'callback', 'defaultPos', 'value', 'dependants', 'volatile',
+		'resolvedEpoch', 'animStart', 'reverse', 'repeats', 'alternate', 'hasPlayedOnce', 'delay', 'interpolationStep', 'clock',
+		'easing', 'easingLUT', 'weights', 'segments'
+	)
+
+	def __init__(self, values: valuesType, duration: float, defaultPos: DEFAULT_POS_VALS_TYPE = 'start', interpolation: INTERPOLATION_TYPES_TYPE = 'linear', reducer: REDUCER_TYPES_TYPE = 'deCasteljau', callback: CallableLike = None, customInterpolation: CallableLike = None, customReducer: CallableLike = None, resolveNow: bool = True, volatile: bool = False, clock: AnimationClock = None, easingResolution: int | None = None):
 		if len(values) < 2:
 			raise ValueError("Animator requires a minimum of two values to animate between.")
 
@@ -166,6 +256,12 @@ class AnimatedValue:
 		if reducer == 'custom' and customReducer is None:
 			raise ValueError('Custom reducer function must be provided when using "custom" reducer type.')
 
+		if easingResolution is not None and easingResolution < 1:
+			raise ValueError('easingResolution must be at least 1.')
+
+		if any(isinstance(value, Expression) for value in values):
+			values = [DynamicValue.wrap(value) for value in values]
+
 		self.values = values
 		self.rawValues: list[int | float] = []
 		self.duration = duration
@@ -174,14 +270,12 @@ class AnimatedValue:
 		self.callback = callback
 		self.defaultPos = defaultPos
 		self.value = None
-
-		if resolveNow:
-			self.updateValues()
-
-			if self.defaultPos == 'start':
-				self.value = self.rawValues[0]
-			else:
-				self.value = self.rawValues[-1]
+		self.dependants: list[DynamicValue] | tuple = ()
+		self.volatile = volatile
+		self.resolvedEpoch = 0
+		# None follows the default clock, bound on the first trigger() so AnimationClock.setDefault() still works after
+		# creating values
+		self.clock: AnimationClock | None = clock
 
 		self.animStart: float = None
 		self.reverse: bool = False
@@ -200,16 +294,73 @@ class AnimatedValue:
 		elif self.reducer == 'custom':
 			self.reducer = customReducer
 
-	# get raw values from animated / dynamic values
+		# easing curve as a function of t, used by the precomputed bezier path.
+		# with easingResolution the curve (custom ones included) is sampled once into a lookup table
+		self.easing: CallableLike = EASING_MAP.get(self.interpolation)
+		self.easingLUT: list[float] | None = None
+
+		if easingResolution is not None:
+			if self.easing is None:
+				self.easingLUT = InterpolationAlgos.easingTable(lambda t: customInterpolation(0, 1, t) if 0 < t < 1 else t, easingResolution)
+			else:
+				self.easingLUT = InterpolationAlgos.easingTable(self.easing, easingResolution)
+
+			self.easing = self._sampleEasing
+			self.interpolationStep = self._tableInterpolation
+
+		self.weights: list[float] | None = None
+		self.segments: list[tuple[float, float, float, float]] | None = None
+
+		if resolveNow:
+			self.updateValues()
+
+			if self.defaultPos == 'start':
+				self.value = self.rawValues[0]
+			else:
+				self.value = self.rawValues[-1]
+
+	def _sampleEasing(self, t: float) -> float:
+		return InterpolationAlgos.sampleTable(self.easingLUT, t)
+
+	def _tableInterpolation(self, start: float, end: float, t: float) -> float:
+		if t <= 0:
+			return start
+		elif t >= 1:
+			return end
+
+		return start + (end - start) * InterpolationAlgos.sampleTable(self.easingLUT, t)
+
+	# get raw values from animated / dynamic values, updated in place and precomputed again only when one changed
 	def updateValues(self):
-		self.rawValues = []
+		rawValues = self.rawValues
+
+		if len(rawValues) != len(self.values):
+			rawValues.clear()
+			rawValues.extend([None] * len(self.values))
+
+		changed = False
 
-		for value in self.values:
+		for i, value in enumerate(self.values):
 			if isinstance(value, (DynamicValue, AnimatedValue)):
 				value.resolveValue()
-				self.rawValues.append(value.value)
-			else:
-				self.rawValues.append(value)
+				value = value.value
+
+			if rawValues[i] is None or rawValues[i] != value:
+				rawValues[i] = value
+				changed = True
+
+		if changed:
+			self.precompute()
+
+	# builds the bernstein weights / catmull-rom coefficients for the current raw values
+	def precompute(self):
+		self.weights = None
+		self.segments = None
+
+		if self.reducer is InterpolationAlgos.deCasteljau and self.easing is not None:
+			self.weights = InterpolationAlgos.bernsteinWeights(self.rawValues)
+		elif self.reducer is InterpolationAlgos.catmullRom:
+			self.segments = InterpolationAlgos.catmullRomSegments(self.rawValues)
 
 	# get an interpolated value from normalized t
 	def interpolate(self, t: float):
@@ -221,7 +372,15 @@ class AnimatedValue:
 			self.value = self.rawValues[-1]
 			return
 
-		self.value = self.reducer(list(self.rawValues), t, self.interpolationStep)
+		if self.weights is not None:
+			self.value = InterpolationAlgos.bernstein(self.weights, self.easing(t))
+		elif self.segments is not None:
+			self.value = InterpolationAlgos.catmullRomSegment(self.segments, t)
+		elif self.reducer in REDUCER_MAP.values():
+			self.value = self.reducer(self.rawValues, t, self.interpolationStep)
+		else:
+			# custom reducers get their own copy in case they modify it
+			self.value = self.reducer(list(self.rawValues), t, self.interpolationStep)
 
 	def _getNormalizedT(self, elapsedTime: float) -> float:
 		return 1 - (elapsedTime / self.duration) if self.reverse else (elapsedTime / self.duration)
@@ -229,18 +388,46 @@ class AnimatedValue:
 	# calculate current animation time, get normalized t, call .interpolate() etc..
 	# most importantly this is the function you need to call to update the animated value
 	def resolveValue(self):
+		epoch = FrameEpoch.current
+
+		if epoch and not self.volatile and self.resolvedEpoch == epoch:
+			return None
+
+		# stamped before resolving so callbacks fired by finishAnim() can't re-enter this frame
+		self.resolvedEpoch = epoch
+
+		previous = self.value
+
 		if self.animStart is None:
 			self.updateRestingPos()
-			return
+		else:
+			elapsedTime = (self.clock.time() - self.animStart) - self.delay
 
-		elapsedTime = ((time.perf_counter() * 1000) - self.animStart) - self.delay
+			self.updateValues()
 
-		self.updateValues()
+			if elapsedTime >= self.duration:
+				self.finishAnim()
+			else:
+				self.interpolate(self._getNormalizedT(elapsedTime))
 
-		if elapsedTime >= self.duration:
-			self.finishAnim()
-		else:
-			self.interpolate(self._getNormalizedT(elapsedTime))
+		if self.dependants and self.value != previous:
+			self.notifyDependants()
+
+	# reactive DynamicValues that read this value register themselves here
+	def addDependant(self, dependant: DynamicValue):
+		if not self.dependants:
+			self.dependants = []
+
+		if not dependant in self.dependants:
+			self.dependants.append(dependant)
+
+	def removeDependant(self, dependant: DynamicValue):
+		if dependant in self.dependants:
+			self.dependants.remove(dependant)
+
+	def notifyDependants(self):
+		for dependant in self.dependants:
+			dependant.invalidate()
 
 	# handle animation ends, repeats, callbacks used by .resolveValue()
 	def finishAnim(self):
@@ -262,13 +449,13 @@ class AnimatedValue:
 			self.trigger(self.reverse, self.repeats, self.alternate)
 			return None
 
+		self.clock.remove(self)
+
 		if self.callback is not None:
 			self.callback()
 
-	# updates the value to a default idle position when no animation is playing
-	def updateRestingPos(self):
-		self.updateValues()
-
+	# index of the endpoint the value rests on while no animation is playing
+	def _restingIndex(self) -> int:
 		A = self.hasPlayedOnce
 		B = self.defaultPos == 'start'
 		C = self.reverse
@@ -305,11 +492,35 @@ class AnimatedValue:
 
 		pickStart = (B and not A) or (A and (B == C))
 
-		self.value = self.rawValues[0] if pickStart else self.rawValues[-1]
+		return 0 if pickStart else -1
+
+	# updates the value to a default idle position when no animation is playing.
+	# only the endpoint it rests on gets resolved, constant endpoints cost nothing
+	def updateRestingPos(self):
+		if not self.rawValues:
+			self.updateValues()
+
+		index = self._restingIndex()
+		endpoint = self.values[index]
+
+		if isinstance(endpoint, (DynamicValue, AnimatedValue)):
+			endpoint.resolveValue()
+
+			if self.rawValues[index] != endpoint.value:
+				self.rawValues[index] = endpoint.value
+				self.precompute()
+
+		self.value = self.rawValues[index]
 
 	# triggers animation
 	def trigger(self, reverse: bool = False, repeats: int = 0, alternate: bool = False, delay: int = 0):
-		self.animStart = time.perf_counter() * 1000
+		if self.clock is None:
+			self.clock = AnimationClock.getDefault()
+
+		self.animStart = self.clock.time()
+		self.resolvedEpoch = 0
+
+		self.clock.add(self)
 
 		self.repeats = repeats
 		self.alternate = alternate
@@ -330,8 +541,13 @@ class AnimatedValue:
 
 		self.animStart = None
 		self.repeats = 0
+		self.resolvedEpoch = 0
+
+		self.clock.remove(self)
 
 		if self.reverse:
 			self.value = self.rawValues[0]
 		else:
 			self.value = self.rawValues[-1]
+
+		self.notifyDependants()
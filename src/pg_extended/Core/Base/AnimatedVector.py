@@ -0,0 +1,189 @@
+from __future__ import annotations
+from typing import Any, Sequence
+from math import comb
+import numpy as np
+import pygame as pg
+from pg_extended.Types import CallableLike
+from pg_extended.Core.Base.DynamicValue import DynamicValue
+from pg_extended.Core.Base.AnimatedValue import AnimatedValue, InterpolationAlgos, REDUCER_MAP
+from pg_extended.Core.Base.AnimationClock import AnimationClock
+
+type VectorLike = Sequence[DynamicValue | AnimatedValue | int | float] | pg.Color
+
+# DynamicValue compatible view of one channel of an AnimatedVector, e.g. the 'width' of an animated rect
+class AnimatedChannel(DynamicValue):
+	__slots__ = ('vector', 'index')
+
+	def __init__(self, vector: AnimatedVector, index: int):
+		self.vector = vector
+		self.index = index
+
+		super().__init__(vector, resolveNow=False, volatile=True)
+
+		self._resolveRaw = self._channel
+		self.resolveValue = self._channel
+
+		if vector.value is not None:
+			self.value = vector.value[index]
+
+	# the vector caches per frame, so reading all four channels of a rect only interpolates once
+	def _channel(self):
+		self.vector.resolveValue()
+		self.value = self.vector.value[self.index]
+
+# animates N channels (x, y, width, height / r, g, b, a...) with one clock, one updateValues() and one reducer call.
+# takes the same interpolation / reducer names as AnimatedValue, .value is a tuple with one float per channel
+class AnimatedVector(AnimatedValue):
+	__slots__ = ('size', 'matrix', 'channels', 'dynamicVectors')
+
+	def __init__(self, values: list[VectorLike], duration: float, defaultPos: str = 'start', interpolation: str = 'linear', reducer: str = 'deCasteljau', callback: CallableLike = None, customInterpolation: CallableLike = None, customReducer: CallableLike = None, resolveNow: bool = True, volatile: bool = False, clock: AnimationClock = None, easingResolution: int | None = None):
+		if len(values) < 2:
+			raise ValueError("Animator requires a minimum of two values to animate between.")
+
+		self.size = len(values[0])
+
+		if self.size == 0 or any(len(value) != self.size for value in values):
+			raise ValueError('All values of an AnimatedVector must have the same, non zero number of channels.')
+
+		self.matrix: np.ndarray | None = None
+		self.channels: dict[int, AnimatedChannel] = {}
+
+		# only vectors with dynamic channels are read again on later frames
+		self.dynamicVectors = [
+			i for i, vector in enumerate(values) if any(isinstance(channel, (DynamicValue, AnimatedValue)) for channel in vector)
+		]
+
+		super().__init__(values, duration, defaultPos, interpolation, reducer, callback, customInterpolation, customReducer, resolveNow, volatile, clock, easingResolution)
+
+	# DynamicValue compatible view of a single channel
+	def channel(self, index: int) -> AnimatedChannel:
+		if not -self.size <= index < self.size:
+			raise ValueError(f'Invalid channel index: {index}, the vector has {self.size} channels.')
+
+		index %= self.size
+
+		if not index in self.channels:
+			self.channels[index] = AnimatedChannel(self, index)
+
+		return self.channels[index]
+
+	# channel views keyed by name, e.g. RectArea(AnimatedVector([...]).asDimensions())
+	def asDimensions(self, keys: Sequence[str] = ('x', 'y', 'width', 'height')) -> dict[str, AnimatedChannel]:
+		if len(keys) != self.size:
+			raise ValueError(f'Expected {self.size} keys, received: {len(keys)}')
+
+		return {key: self.channel(i) for i, key in enumerate(keys)}
+
+	def _channelValue(self, channel: Any) -> int | float:
+		if isinstance(channel, (DynamicValue, AnimatedValue)):
+			channel.resolveValue()
+			return channel.value
+
+		return channel
+
+	def _rawVector(self, vector: VectorLike) -> tuple:
+		return tuple(self._channelValue(channel) for channel in vector)
+
+	# converts an interpolated row to the public value
+	def _output(self, row: np.ndarray) -> tuple:
+		return tuple(row.tolist())
+
+	def updateValues(self):
+		rawValues = self.rawValues
+
+		if len(rawValues) != len(self.values):
+			rawValues.clear()
+			rawValues.extend(self._rawVector(vector) for vector in self.values)
+
+			self.precompute()
+			return None
+
+		changed = False
+
+		for i in self.dynamicVectors:
+			raw = self._rawVector(self.values[i])
+
+			if rawValues[i] != raw:
+				rawValues[i] = raw
+				changed = True
+
+		if changed:
+			self.precompute()
+
+	# the raw vectors as one (values x channels) matrix, with the bezier / catmull-rom forms as matrices on top of it
+	def precompute(self):
+		self.matrix = np.array(self.rawValues, dtype=np.float64)
+		self.weights = None
+		self.segments = None
+
+		if self.reducer is InterpolationAlgos.deCasteljau and self.easing is not None:
+			n = len(self.rawValues) - 1
+
+			self.weights = np.array([comb(n, i) for i in range(n + 1)], dtype=np.float64)[:, None] * self.matrix
+		elif self.reducer is InterpolationAlgos.catmullRom:
+			self.segments = np.array(InterpolationAlgos.catmullRomSegments(list(self.matrix)), dtype=np.float64)
+
+	def interpolate(self, t: float):
+		if t <= 0:
+			self.value = self.rawValues[0]
+			return
+
+		if t >= 1:
+			self.value = self.rawValues[-1]
+			return
+
+		if self.weights is not None:
+			# the basis is a handful of scalars, building it in python beats a numpy round trip per term
+			s = self.easing(t)
+			r = 1 - s
+			n = len(self.weights) - 1
+
+			row = np.dot([s ** i * r ** (n - i) for i in range(n + 1)], self.weights)
+		elif self.segments is not None:
+			n = len(self.segments)
+
+			seg = min(int(t * n), n - 1)
+			local_t = (t - seg / n) * n
+
+			row = np.dot((1, local_t, local_t * local_t, local_t ** 3), self.segments[seg])
+		elif self.reducer in REDUCER_MAP.values():
+			row = self.reducer(list(self.matrix), t, self.interpolationStep)
+		else:
+			row = self.reducer(list(self.matrix.copy()), t, self.interpolationStep)
+
+		self.value = self._output(np.asarray(row))
+
+	def updateRestingPos(self):
+		if not self.rawValues:
+			self.updateValues()
+
+		index = self._restingIndex()
+		raw = self._rawVector(self.values[index])
+
+		if self.rawValues[index] != raw:
+			self.rawValues[index] = raw
+			self.precompute()
+
+		self.value = self.rawValues[index]
+
+# AnimatedVector over rgba, accepts anything pg.Color does (names, hex strings, tuples) and
+# gives .value as a clamped integer (r, g, b, a) tuple that can be passed straight to pg.Color / Section backgrounds
+class AnimatedColor(AnimatedVector):
+	__slots__ = ()
+
+	def __init__(self, values: list[VectorLike | str], duration: float, *args, **kwargs):
+		super().__init__([AnimatedColor._toRGBA(value) for value in values], duration, *args, **kwargs)
+
+	@staticmethod
+	def _toRGBA(value: Any) -> VectorLike:
+		# per channel dynamic values are kept as they are, missing alpha is treated as opaque
+		if isinstance(value, (tuple, list)) and any(isinstance(channel, (DynamicValue, AnimatedValue)) for channel in value):
+			return tuple(value) + (255,) * (4 - len(value))
+
+		return tuple(pg.Color(value))
+
+	def _output(self, row: np.ndarray) -> tuple:
+		return tuple(np.clip(np.rint(row), 0, 255).astype(np.int64).tolist())
+
+	def _rawVector(self, vector: VectorLike) -> tuple:
+		return tuple(int(self._channelValue(channel)) for channel in vector)
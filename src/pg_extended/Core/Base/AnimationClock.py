@@ -0,0 +1,113 @@
+from __future__ import annotations
+from typing import Any, Literal
+import time
+
+CLOCK_MODES = ('real', 'fixed', 'manual')
+
+type CLOCK_MODES_TYPE = Literal['real', 'fixed', 'manual']
+
+class AnimationClock:
+	# shared clock used by AnimatedValues that aren't given one, every Window drives it. bind to it through getDefault()
+	default: AnimationClock = None
+
+	# real: wall time, sampled once per frame by tick()
+	# fixed: every tick() moves time forward by exactly `stepSize` ms, frames are reproducible no matter how long they take
+	# manual: time only moves through advance() / setTime(), for tests and benchmarks
+	def __init__(self, mode: CLOCK_MODES_TYPE = 'real', stepSize: float = 1000 / 60):
+		self.now: float = 0
+		self.ticking = False
+
+		self.mode: CLOCK_MODES_TYPE
+		self.stepSize: float
+
+		self.setMode(mode, stepSize)
+
+		# running AnimatedValues, a dict keeps them in trigger order
+		self.active: dict[Any, None] = {}
+
+		# values that bound to this clock as the default, see setDefault()
+		self.dependents = 0
+
+	# the default clock for something that keeps it from now on, a default that's been handed out can't be replaced
+	# anymore. values without a clock only bind once they start animating, creating them doesn't count
+	@staticmethod
+	def getDefault() -> AnimationClock:
+		AnimationClock.default.dependents += 1
+
+		return AnimationClock.default
+
+	# replaces the default clock (a fixed step / manual one for benchmarks and headless runs), only before an animation
+	# started on it since values keep the clock they bound to. switching the current default with setMode() always works
+	@staticmethod
+	def setDefault(clock: AnimationClock):
+		if clock is AnimationClock.default:
+			return None
+
+		if AnimationClock.default.dependents:
+			raise ValueError('The default animation clock is already in use, set the default clock before starting any animations, or change its mode with setMode() instead.')
+
+		AnimationClock.default = clock
+
+	def setMode(self, mode: CLOCK_MODES_TYPE, stepSize: float | None = None):
+		if not mode in CLOCK_MODES:
+			raise ValueError(f'Invalid clock mode: {mode}. Must be one of: {CLOCK_MODES}')
+
+		if stepSize is not None and stepSize <= 0:
+			raise ValueError('Clock step must be greater than 0.')
+
+		# simulated time carries on from wherever the clock currently is
+		if mode != 'real' and getattr(self, 'mode', None) == 'real':
+			self.now = self.time()
+
+		self.mode = mode
+
+		if stepSize is not None:
+			self.stepSize = stepSize
+
+	# current time in milliseconds, frozen for the whole frame while a window is ticking the clock
+	def time(self) -> float:
+		if self.ticking or self.mode != 'real':
+			return self.now
+
+		return time.perf_counter() * 1000
+
+	# current time in seconds, for code that used to read time.perf_counter()
+	def seconds(self) -> float:
+		return self.time() / 1000
+
+	# samples the time once for this frame
+	def tick(self):
+		self.ticking = True
+
+		if self.mode == 'real':
+			self.now = time.perf_counter() * 1000
+		elif self.mode == 'fixed':
+			self.now += self.stepSize
+
+	def advance(self, milliseconds: float):
+		if self.mode == 'real':
+			raise ValueError('A real time clock can not be advanced manually, switch it to "fixed" or "manual" mode first.')
+
+		self.now += milliseconds
+
+	def setTime(self, milliseconds: float):
+		if self.mode == 'real':
+			raise ValueError('A real time clock can not be set manually, switch it to "fixed" or "manual" mode first.')
+
+		self.now = milliseconds
+
+	# advances only the animations that are actually running, idle values are left alone
+	def step(self):
+		for animatedValue in tuple(self.active):
+			animatedValue.resolveValue()
+
+	def stop(self):
+		self.ticking = False
+
+	def add(self, animatedValue: Any):
+		self.active[animatedValue] = None
+
+	def remove(self, animatedValue: Any):
+		self.active.pop(animatedValue, None)
+
+AnimationClock.default = AnimationClock()
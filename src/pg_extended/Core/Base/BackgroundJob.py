@@ -0,0 +1,58 @@
+from __future__ import annotations
+from typing import Any
+from pg_extended.Core.Base.CallbackQueue import CallbackQueue, EXECUTOR_TYPES_TYPE
+from pg_extended.Types import CallableLike
+
+# runs the latest request of something on a CallbackQueue pool, at most one job at a time. requests made while a
+# job is running replace each other, so a resize drag only processes the size it was at when the last job finished.
+# apply(key, result) is called on the main thread by the queue's flush()
+class BackgroundJob:
+	__slots__ = ('apply', 'executor', 'queue', 'runningKey', 'pending', '__weakref__')
+
+	def __init__(self, apply: CallableLike, executor: EXECUTOR_TYPES_TYPE = 'thread', queue: CallbackQueue = None):
+		self.apply = apply
+		self.executor = executor
+		self.queue = queue if queue is not None else CallbackQueue.default
+
+		self.runningKey: Any = None
+		# (key, func, args) waiting for the running job
+		self.pending: tuple[Any, CallableLike, dict[str, Any]] | None = None
+
+		self.queue.jobs.add(self)
+
+	@property
+	def running(self) -> bool:
+		return self.runningKey is not None
+
+	# key identifies what the job makes, requesting what is already being made does nothing
+	def request(self, key: Any, func: CallableLike, args: dict[str, Any]):
+		if self.runningKey is None:
+			self._submit(key, func, args)
+		elif key == self.runningKey:
+			self.pending = None
+		else:
+			self.pending = (key, func, args)
+
+	def cancel(self):
+		self.pending = None
+
+	# forgets the running and pending job, called by CallbackQueue.shutdown() since their results never arrive
+	def reset(self):
+		self.runningKey = None
+		self.pending = None
+
+	def _submit(self, key: Any, func: CallableLike, args: dict[str, Any]):
+		self.runningKey = key
+		self.queue.submit(self.executor, func, args, lambda result: self._finish(key, result), lambda error: self._finish(key, None, False))
+
+	# a failed job is reported by the queue and not applied, the next request still runs
+	def _finish(self, key: Any, result: Any, succeeded: bool = True):
+		self.runningKey = None
+
+		pending, self.pending = self.pending, None
+
+		if pending is not None:
+			self._submit(*pending)
+
+		if succeeded:
+			self.apply(key, result)
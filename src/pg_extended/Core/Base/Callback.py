@@ -1,65 +1,164 @@
 from typing import Any
 from traceback import print_exc
-from pg_extended.Core.Base import DynamicValue, AnimatedValue
+from pg_extended.Core.Base import DynamicValue, AnimatedValue, FrameEpoch
+from pg_extended.Core.Base.CallbackQueue import CallbackQueue, EXECUTOR_TYPES, EXECUTOR_TYPES_TYPE
 from pg_extended.Types import CallableLike
 
+# trigger name -> small int id, shared by every CallbackSet so elements can look their triggers up once at import time
+TRIGGER_IDS: dict[str, int] = {}
+
+_MISSING = object()
+
+def triggerID(trigger: str | int) -> int:
+	if isinstance(trigger, int):
+		return trigger
+
+	if not trigger in TRIGGER_IDS:
+		TRIGGER_IDS[trigger] = len(TRIGGER_IDS)
+
+	return TRIGGER_IDS[trigger]
+
 class Callback:
-	def __init__(self, triggers: list[str] | tuple[str] | str, func: CallableLike, staticArgs: dict[str, Any] = None, extraArgKeys: dict[str, str] = None):
+	__slots__ = (
+		'triggers', 'func', 'staticArgs', 'resolvedArgs', 'extraArgKeys', 'dynamicArgs', 'extraDefaults',
+		'deferred', 'coalesce', 'executor', 'onResult', 'queue'
+	)
+
+	# deferred callbacks are posted to a CallbackQueue and run at the start of the next frame, coalesce keeps only the
+	# latest post per trigger until then. an executor ('thread' / 'process') runs func on a pool and hands its return
+	# value to onResult on the main thread, process pools need a picklable func
+	def __init__(self, triggers: list[str] | tuple[str] | str, func: CallableLike, staticArgs: dict[str, Any] = None, extraArgKeys: dict[str, str] = None, deferred: bool = False, coalesce: bool = False, executor: EXECUTOR_TYPES_TYPE | None = None, onResult: CallableLike = None, queue: CallbackQueue = None):
+		if executor is not None and not executor in EXECUTOR_TYPES:
+			raise ValueError(f'Invalid executor type: {executor}. Must be one of: {EXECUTOR_TYPES}')
+
+		if coalesce and not deferred:
+			raise ValueError('Only deferred callbacks can be coalesced.')
+
 		self.triggers = triggers
 		self.func = func
 		self.staticArgs = staticArgs or {}
-		self.resolvedArgs = {}
 		self.extraArgKeys = extraArgKeys or {}
-		self.totalArgs = {}
 
 		if isinstance(self.triggers, str):
 			self.triggers = (self.triggers,)
 
-	def _setExtraArgs(self, args: dict[str, Any] = None):
-		args = args or {}
+		self.deferred = deferred
+		self.coalesce = coalesce
+		self.executor = executor
+		self.onResult = onResult
+		self.queue = queue if queue is not None else CallbackQueue.default
 
-		self.totalArgs = self.staticArgs.copy()
+		# filled by bind()
+		self.resolvedArgs: dict[str, Any] = {}
+		self.dynamicArgs: tuple[tuple[str, DynamicValue | AnimatedValue], ...] = ()
+		self.extraDefaults: tuple[tuple[str, Any], ...] = ()
 
-		for key, value in args.items():
-			if key in self.extraArgKeys:
-				self.totalArgs[self.extraArgKeys[key]] = value
+		self.bind()
 
-	def resolveArgs(self):
+	# splits the arguments into constants, which are written into resolvedArgs once, and dynamic values that get
+	# resolved on every call. call it again after changing staticArgs / extraArgKeys
+	def bind(self):
 		self.resolvedArgs = {}
+		dynamicArgs = []
+
+		for key, value in self.staticArgs.items():
+			if isinstance(value, (DynamicValue, AnimatedValue)):
+				dynamicArgs.append((key, value))
+				self.resolvedArgs[key] = None
+			else:
+				self.resolvedArgs[key] = value
+
+		self.dynamicArgs = tuple(dynamicArgs)
 
-		for key in self.totalArgs:
-			val = self.totalArgs[key]
+		# what each extra argument target goes back to after a call that provided it
+		self.extraDefaults = tuple((target, self.resolvedArgs.get(target, _MISSING)) for target in self.extraArgKeys.values())
+
+	# callbacks can fire several times in one frame (a drag event per motion), each call starts a new epoch so its
+	# arguments aren't the values memoized for an earlier call
+	def resolveArgs(self):
+		FrameEpoch.advance()
 
-			if isinstance(val, (DynamicValue, AnimatedValue)):
-				val.resolveValue()
-				self.resolvedArgs[key] = val.value
+		resolvedArgs = self.resolvedArgs
+
+		for key, value in self.dynamicArgs:
+			value.resolveValue()
+			resolvedArgs[key] = value.value
+
+	def _applyExtraArgs(self, args: dict[str, Any]) -> bool:
+		applied = False
+
+		for key, value in args.items():
+			target = self.extraArgKeys.get(key)
+
+			if target is None:
+				continue
+
+			if isinstance(value, (DynamicValue, AnimatedValue)):
+				value.resolveValue()
+				value = value.value
+
+			self.resolvedArgs[target] = value
+			applied = True
+
+		return applied
+
+	def _restoreExtraArgs(self):
+		resolvedArgs = self.resolvedArgs
+
+		for target, default in self.extraDefaults:
+			if default is _MISSING:
+				resolvedArgs.pop(target, None)
 			else:
-				self.resolvedArgs[key] = val
+				resolvedArgs[target] = default
 
-	def call(self, extraArgs: dict[str, Any] = None):
-		extraArgs = extraArgs or {}
+	# reuses resolvedArgs between calls, only dynamic values and provided extra arguments are written.
+	# arguments are always resolved right away, deferred callbacks post a copy of them
+	def call(self, extraArgs: dict[str, Any] = None, trigger: str | int | None = None):
+		if self.dynamicArgs:
+			self.resolveArgs()
 
-		self._setExtraArgs(extraArgs)
+		applied = extraArgs is not None and self.extraArgKeys and self._applyExtraArgs(extraArgs)
 
-		self.resolveArgs()
+		try:
+			if self.deferred:
+				self.queue.post(self, dict(self.resolvedArgs), (self, trigger) if self.coalesce else None)
+			else:
+				self.invoke(self.resolvedArgs)
+		finally:
+			if applied:
+				self._restoreExtraArgs()
+
+	# runs the function with already resolved arguments, or hands it to the queue's pool
+	def invoke(self, args: dict[str, Any]):
+		if self.executor is not None:
+			self.queue.submit(self.executor, self.func, dict(args), self.onResult)
+			return None
 
 		try:
-			self.func(**self.resolvedArgs)
+			self.func(**args)
 		except Exception as e:
 			print(f'Error calling callback function: {e}')
 			print_exc()
 
 class CallbackSet:
+	__slots__ = ('callbacks', 'callbacksDict')
+
 	def __init__(self, callbacks: list[Callback] | tuple[Callback]):
 		self.callbacks = callbacks
-		self.callbacksDict: dict[str, list[Callback]] = {}
+		# trigger id -> callbacks, see triggerID()
+		self.callbacksDict: dict[int, tuple[Callback, ...]] = {}
 
 		for callback in self.callbacks:
 			for tgr in callback.triggers:
-				self.callbacksDict.setdefault(tgr, []).append(callback)
+				tgrID = triggerID(tgr)
+				self.callbacksDict[tgrID] = self.callbacksDict.get(tgrID, ()) + (callback,)
+
+	# trigger can be the name or the id returned by triggerID()
+	def call(self, trigger: str | int, extraArgs: dict[str, Any] = None):
+		tgrID = trigger if isinstance(trigger, int) else TRIGGER_IDS.get(trigger)
+		callbacks = self.callbacksDict.get(tgrID)
 
-	def call(self, trigger: str, extraArgs: dict[str, Any] = None):
-		if trigger not in self.callbacksDict: return None
+		if callbacks is None: return None
 
-		for callback in self.callbacksDict[trigger]:
-			callback.call(extraArgs)
+		for callback in callbacks:
+			callback.call(extraArgs, tgrID)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+from typing import Any, Literal
+from collections import deque
+from weakref import WeakSet
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+from traceback import print_exception
+from pg_extended.Types import CallableLike
+
+EXECUTOR_TYPES = ('thread', 'process')
+
+type EXECUTOR_TYPES_TYPE = Literal['thread', 'process']
+
+# collects callbacks posted during a frame and runs them at the start of the next one, so a slow handler
+# can't stall event handling. callbacks with an executor run on a thread / process pool instead and their
+# results are handed back on the main thread by the flush() after they finish
+class CallbackQueue:
+	# shared queue used by Callbacks that aren't given one, the Window flushes it every frame
+	default: CallbackQueue = None
+
+	def __init__(self, workers: int | None = None):
+		self.workers = workers
+
+		# coalesce key / post counter -> (callback, args), dicts keep post order and let a newer post replace an older one
+		self.pending: dict[Any, tuple[Any, dict[str, Any]]] = {}
+		self.postCount = 0
+
+		# finished pool jobs, appended from worker threads and drained on the main thread
+		self.results: deque[tuple[int, Any, Any, Future]] = deque()
+		self.running = 0
+
+		# bumped by shutdown(), results of jobs submitted before it are dropped when they come in
+		self.generation = 0
+		# BackgroundJobs submitting to this queue, shutdown() resets them
+		self.jobs: WeakSet = WeakSet()
+
+		self.executors: dict[str, Executor] = {}
+
+	def __len__(self) -> int:
+		return len(self.pending) + self.running
+
+	# queues callback.invoke(args) for the next flush. posts sharing a coalesceKey replace each other,
+	# so a drag that fires 20 motion events in one frame only runs its handler once with the latest value
+	def post(self, callback: Any, args: dict[str, Any], coalesceKey: Any = None):
+		if coalesceKey is None:
+			coalesceKey = self.postCount
+			self.postCount += 1
+		else:
+			# keeps the position of the latest post instead of the first one
+			self.pending.pop(coalesceKey, None)
+
+		self.pending[coalesceKey] = (callback, args)
+
+	def getExecutor(self, executorType: EXECUTOR_TYPES_TYPE) -> Executor:
+		if not executorType in EXECUTOR_TYPES:
+			raise ValueError(f'Invalid executor type: {executorType}. Must be one of: {EXECUTOR_TYPES}')
+
+		if not executorType in self.executors:
+			if executorType == 'thread':
+				self.executors[executorType] = ThreadPoolExecutor(self.workers, thread_name_prefix='pgx-callback')
+			else:
+				self.executors[executorType] = ProcessPoolExecutor(self.workers)
+
+		return self.executors[executorType]
+
+	# runs func(**args) on a pool, onResult(result) is called on the main thread by a later flush().
+	# errors are printed and passed to onError(error) if given
+	def submit(self, executorType: EXECUTOR_TYPES_TYPE, func: CallableLike, args: dict[str, Any], onResult: CallableLike = None, onError: CallableLike = None):
+		future = self.getExecutor(executorType).submit(func, **args)
+		self.running += 1
+
+		generation = self.generation
+		future.add_done_callback(lambda done: self.results.append((generation, onResult, onError, done)))
+
+	# delivers finished pool results, then runs everything posted since the last flush.
+	# callbacks posted while flushing wait for the next frame
+	def flush(self):
+		while self.results:
+			generation, onResult, onError, future = self.results.popleft()
+
+			# a job that outlived a shutdown() was already taken off the count
+			if generation != self.generation:
+				continue
+
+			self.running -= 1
+
+			error = future.exception()
+
+			if error is not None:
+				print(f'Error calling callback function: {error}')
+				print_exception(error)
+
+				handler, value = onError, error
+			else:
+				handler, value = onResult, future.result()
+
+			if handler is not None:
+				try:
+					handler(value)
+				except Exception as e:
+					print(f'Error calling callback result handler: {e}')
+					print_exception(e)
+
+		if not self.pending:
+			return None
+
+		pending = self.pending
+		self.pending = {}
+
+		for callback, args in pending.values():
+			callback.invoke(args)
+
+	# drops everything still queued and stops the pools, running jobs are allowed to finish but their results are dropped
+	def shutdown(self, wait: bool = False):
+		self.pending.clear()
+		self.generation += 1
+
+		for job in tuple(self.jobs):
+			job.reset()
+
+		for executor in self.executors.values():
+			executor.shutdown(wait=wait, cancel_futures=True)
+
+		self.executors.clear()
+		self.results.clear()
+		self.running = 0
+
+CallbackQueue.default = CallbackQueue()
@@ -0,0 +1,333 @@
+from __future__ import annotations
+from typing import Any
+import numpy as np
+from pg_extended.Core.Base.DynamicValue import DynamicValue
+from pg_extended.Core.Base.FrameEpoch import FrameEpoch
+
+# DynamicValue compatible view of one entry in a DimensionStore
+class StoreDimension(DynamicValue):
+	__slots__ = ('store', 'index', 'original')
+
+	def __init__(self, store: DimensionStore, index: int, original: DynamicValue | None = None):
+		self.store = store
+		self.index = index
+		# the DynamicValue this entry replaced, put back when the entry is removed from the store
+		self.original = original
+
+		super().__init__(store, resolveNow=False, volatile=original.volatile if original is not None else False)
+
+		# keeps the flags of the replaced value, a reactive view is pulled by its dependants since the store
+		# doesn't push changes (tracked stays False)
+		if original is not None:
+			self.reactive = original.reactive
+
+		# the store already caches per frame, resolving a view just makes sure the store is fresh. volatile
+		# views skip that cache and compare the sources on every resolve
+		self._resolveRaw = store.refresh if self.volatile else store.resolveIfStale
+		self.resolveValue = self._resolveRaw
+
+	# read from the store when needed, so a resolve doesn't have to write every view.
+	# a view whose entry was dropped from the store (see DimensionStore.compact()) reads its original value
+	@property
+	def value(self) -> Any:
+		if self.index is None:
+			return self.original.value
+
+		return self.store.values[self.index]
+
+	@value.setter
+	def value(self, value: Any):
+		# DynamicValue.__init__ assigns it, the store owns the value
+		pass
+
+	def setPercent(self, percent: int | float):
+		self.store.percents[self.index] = percent
+		self.store.invalidate()
+
+	def setOffset(self, offset: int | float):
+		self.store.offsets[self.index] = offset
+		self.store.invalidate()
+
+	# what the entry is a percent of, another view in the store or an (object, attribute) pair
+	def source(self) -> StoreDimension | tuple[Any, str]:
+		store = self.store
+		sourceIndex = store.sourceIndex[self.index]
+
+		if store.sourceIsEntry[self.index]:
+			return store.views[sourceIndex]
+
+		return store.sources[sourceIndex]
+
+# keeps percent based dimensions (percent of window.screenWidth, of another section's width...) as flat arrays
+# and resolves all of them with one numpy expression per dependency level instead of one DynamicValue at a time
+class DimensionStore:
+	def __init__(self):
+		# external (object, attribute) sources, read once per resolve
+		self.sources: list[tuple[Any, str]] = []
+		self.sourceIDs: dict[tuple[int, str], int] = {}
+
+		# struct of arrays, one slot per entry. sourceIndex points into the resolve buffer which holds
+		# the external source values first and the entry values after them
+		self.sourceIndex: list[int] = []
+		self.sourceIsEntry: list[bool] = []
+		self.percents: list[float] = []
+		self.offsets: list[float] = []
+
+		self.views: list[StoreDimension] = []
+		self.values: list[float] = []
+		# entries of removed areas, dropped by compact() once enough of them pile up
+		self.alive: list[bool] = []
+		self.freed = 0
+
+		self.levels: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+		self.built = False
+		self.stale = False
+		self.lastSourceValues: list = []
+		self.resolvedEpoch = 0
+
+	def __len__(self) -> int:
+		return len(self.views)
+
+	# adds obj.lookup / 100 * percent + offset to the store. if obj.lookup is itself a dimension in this store
+	# (e.g. section.dimensions['width']), the new entry reads it from the store directly
+	def add(self, obj: Any, lookup: str, percent: int | float = 100, offset: int | float = 0, original: DynamicValue | None = None) -> StoreDimension:
+		entry = self._findEntry(obj, lookup)
+
+		if entry is not None:
+			self.sourceIndex.append(entry)
+			self.sourceIsEntry.append(True)
+			sourceValue = self.values[entry]
+		else:
+			key = (id(obj), lookup)
+
+			if not key in self.sourceIDs:
+				self.sourceIDs[key] = len(self.sources)
+				self.sources.append((obj, lookup))
+				self.lastSourceValues.append(getattr(obj, lookup))
+
+			self.sourceIndex.append(self.sourceIDs[key])
+			self.sourceIsEntry.append(False)
+			sourceValue = self.lastSourceValues[self.sourceIDs[key]]
+
+		self.percents.append(percent)
+		self.offsets.append(offset)
+
+		# computed right away so adding thousands of entries doesn't trigger thousands of full resolves
+		self.values.append(sourceValue / 100 * percent + offset)
+
+		view = StoreDimension(self, len(self.views), original)
+		self.views.append(view)
+		self.alive.append(True)
+
+		self.built = False
+
+		return view
+
+	# moves a DynamicValue(obj, 'attr', percent=N) into the store, anything else is returned unchanged
+	def convert(self, value: Any) -> Any:
+		if not isinstance(value, DynamicValue) or isinstance(value, StoreDimension):
+			return value
+
+		method = value._resolveRaw.__func__
+
+		if method is DynamicValue._objLookupPer:
+			return self.add(value.reference, value.lookup, value.percent, original=value)
+
+		if method is DynamicValue._objLookup:
+			return self.add(value.reference, value.lookup, original=value)
+
+		return value
+
+	def convertDimensions(self, dimensions: dict[str, Any]) -> dict[str, Any]:
+		for key in dimensions:
+			dimensions[key] = self.convert(dimensions[key])
+
+		return dimensions
+
+	# moves the dimensions of an area the store can resolve on its own: percents of `owner` (the window) and of
+	# dimensions already in the store. percents of other areas are left alone, those areas change during the frame
+	# after the store has resolved. returns whether anything moved
+	def convertArea(self, area: Any, owner: Any) -> bool:
+		moved = False
+
+		for key, value in area.dimensions.items():
+			if not isinstance(value, DynamicValue) or isinstance(value, StoreDimension):
+				continue
+
+			if value.reference is not owner and self._findEntry(value.reference, value.lookup) is None:
+				continue
+
+			converted = self.convert(value)
+
+			if converted is not value:
+				area.dimensions[key] = converted
+				moved = True
+
+		return moved
+
+	# undoes convertArea() for an area that is being removed: its dimensions go back to the values they replaced
+	# and their entries are freed
+	def releaseArea(self, area: Any):
+		for key, value in area.dimensions.items():
+			if not (isinstance(value, StoreDimension) and value.store is self and value.index is not None and value.original is not None):
+				continue
+
+			area.dimensions[key] = value.original
+
+			if self.alive[value.index]:
+				self.alive[value.index] = False
+				self.freed += 1
+
+		if self.freed * 2 >= len(self.views):
+			self.compact()
+
+	# drops freed entries and the external sources only they read. freed entries other entries are still a
+	# percent of are kept until those go too
+	def compact(self):
+		count = len(self.views)
+		keep = list(self.alive)
+
+		# sources always come before the entries reading them
+		for i in range(count - 1, -1, -1):
+			if keep[i] and self.sourceIsEntry[i]:
+				keep[self.sourceIndex[i]] = True
+
+		newIndex: list[int | None] = [None] * count
+		kept = 0
+
+		for i in range(count):
+			if keep[i]:
+				newIndex[i] = kept
+				kept += 1
+
+		sources: list[tuple[Any, str]] = []
+		sourceIDs: dict[tuple[int, str], int] = {}
+		lastSourceValues: list = []
+		sourceIndex: list[int] = []
+
+		for i in range(count):
+			if not keep[i]:
+				continue
+
+			if self.sourceIsEntry[i]:
+				sourceIndex.append(newIndex[self.sourceIndex[i]])
+				continue
+
+			obj, lookup = self.sources[self.sourceIndex[i]]
+			key = (id(obj), lookup)
+
+			if not key in sourceIDs:
+				sourceIDs[key] = len(sources)
+				sources.append((obj, lookup))
+				lastSourceValues.append(self.lastSourceValues[self.sourceIndex[i]])
+
+			sourceIndex.append(sourceIDs[key])
+
+		for i, view in enumerate(self.views):
+			if not keep[i]:
+				# dropped views keep working off the value they replaced
+				view.index = None
+
+				if view.original is not None:
+					view.resolveValue = view.original.resolveValue
+				continue
+
+			view.index = newIndex[i]
+
+		self.sources = sources
+		self.sourceIDs = sourceIDs
+		self.lastSourceValues = lastSourceValues
+		self.sourceIndex = sourceIndex
+		self.sourceIsEntry = [isEntry for isEntry, k in zip(self.sourceIsEntry, keep) if k]
+		self.percents = [percent for percent, k in zip(self.percents, keep) if k]
+		self.offsets = [offset for offset, k in zip(self.offsets, keep) if k]
+		self.views = [view for view, k in zip(self.views, keep) if k]
+		self.values = [value for value, k in zip(self.values, keep) if k]
+		self.alive = [alive for alive, k in zip(self.alive, keep) if k]
+		self.freed = self.alive.count(False)
+
+		self.built = False
+
+	def _findEntry(self, obj: Any, lookup: str) -> int | None:
+		if isinstance(obj, StoreDimension) and obj.store is self:
+			return obj.index
+
+		dimensions = getattr(obj, 'dimensions', None)
+
+		if isinstance(dimensions, dict) and lookup in dimensions:
+			dimension = dimensions[lookup]
+
+			if isinstance(dimension, StoreDimension) and dimension.store is self:
+				return dimension.index
+
+		return None
+
+	# groups entries by dependency depth, entries can only reference earlier entries so insertion order is a valid order
+	def build(self):
+		sourceCount = len(self.sources)
+		depth = [0] * len(self.views)
+		levels: dict[int, list[int]] = {}
+
+		for i in range(len(self.views)):
+			if self.sourceIsEntry[i]:
+				depth[i] = depth[self.sourceIndex[i]] + 1
+
+			levels.setdefault(depth[i], []).append(i)
+
+		sourceIndex = np.array([index + sourceCount if isEntry else index for index, isEntry in zip(self.sourceIndex, self.sourceIsEntry)], dtype=np.intp)
+		percents = np.array(self.percents, dtype=np.float64)
+		offsets = np.array(self.offsets, dtype=np.float64)
+
+		self.levels = []
+
+		for level in sorted(levels):
+			entries = np.array(levels[level], dtype=np.intp)
+
+			self.levels.append((entries + sourceCount, sourceIndex[entries], percents[entries], offsets[entries]))
+
+		self.buffer = np.zeros(sourceCount + len(self.views), dtype=np.float64)
+		self.built = True
+
+	def resolve(self, sourceValues: list | None = None):
+		if not self.built:
+			self.build()
+
+		if sourceValues is None:
+			sourceValues = [getattr(obj, lookup) for obj, lookup in self.sources]
+
+		buffer = self.buffer
+		sourceCount = len(self.sources)
+
+		buffer[:sourceCount] = sourceValues
+
+		for targets, sources, percents, offsets in self.levels:
+			buffer[targets] = buffer[sources] / 100 * percents + offsets
+
+		# views read their value from this list, see StoreDimension.value
+		self.values = buffer[sourceCount:].tolist()
+		self.lastSourceValues = sourceValues
+		self.stale = False
+
+	# cheap enough to call from every view: once per frame epoch it compares the external sources with the last
+	# resolve and only runs the vectorized pass when something changed
+	def resolveIfStale(self):
+		epoch = FrameEpoch.current
+
+		if epoch and self.resolvedEpoch == epoch:
+			return None
+
+		self.resolvedEpoch = epoch
+
+		self.refresh()
+
+	# the comparison without the per frame cache, used by volatile views
+	def refresh(self):
+		sourceValues = [getattr(obj, lookup) for obj, lookup in self.sources]
+
+		if self.stale or sourceValues != self.lastSourceValues:
+			self.resolve(sourceValues)
+
+	def invalidate(self):
+		self.built = False
+		self.stale = True
+		self.resolvedEpoch = 0
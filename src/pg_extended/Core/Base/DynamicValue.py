@@ -1,21 +1,60 @@
 from __future__ import annotations
 from typing import Any
 from pg_extended.Types import CallableLike
+from pg_extended.Core.Base.Observable import Observable
+from pg_extended.Core.Base.FrameEpoch import FrameEpoch
+from pg_extended.Core.Base.Expression import Expression, ExpressionOperators
 import types
 
-class DynamicValue:
-	def __init__(self, ref: Any, lookup: str | None = None, args: dict[str, Any] | None = None, percent: int | float | None = None, resolveNow: bool = True):
+class DynamicValue(ExpressionOperators):
+	__slots__ = (
+		'reference', 'lookup', 'args', 'percent', 'value', 'resolveValue', '_resolveRaw', 'compiled',
+		'volatile', 'resolvedEpoch', 'reactive', 'dependsOn', 'dirty', 'tracked', 'sources', 'volatileSources', 'dependants',
+		'watched'
+	)
+
+	def __init__(self, ref: Any, lookup: str | None = None, args: dict[str, Any] | None = None, percent: int | float | None = None, resolveNow: bool = True, reactive: bool = False, dependsOn: list | tuple | None = None, volatile: bool = False):
 		self.reference = ref
 		self.lookup = lookup
 		self.args = args
 		self.percent = percent
 		self.value: Any = None
 		self.resolveValue: CallableLike = None
+		self._resolveRaw: CallableLike = None
+		self.compiled: CallableLike = None
+
+		# per frame memoization, volatile values are recomputed on every resolve
+		self.volatile = volatile
+		self.resolvedEpoch = 0
+
+		# reactive mode, see setupDependencies()
+		self.reactive = reactive
+		self.dependsOn = dependsOn
+		self.dirty = True
+		self.tracked = False
+		# shared empty tuples until something actually registers, keeps plain values small
+		self.sources: list[DynamicValue] | tuple = ()
+		self.volatileSources: list | tuple = ()
+		self.dependants: list[DynamicValue] | tuple = ()
+		# (observable, attribute) pairs this value is registered with, see release()
+		self.watched: list[tuple[Observable, str]] | tuple = ()
 
 		self.assignResolveMethod()
 
+		if self.reactive:
+			self.setupDependencies()
+
 		if resolveNow: self.resolveValue()
 
+	# operator expressions (DynamicValue(section, 'width') + 10) are wrapped so they can go anywhere a DynamicValue is
+	# accepted, anything else is returned as is
+	@staticmethod
+	def wrap(value: Any) -> Any:
+		if isinstance(value, Expression):
+			return DynamicValue(value)
+
+		return value
+
 	def _IFPer(self):
 		self.value = self.reference / 100 * self.percent
 
@@ -51,50 +90,210 @@ class DynamicValue:
 	def _objLookupPer(self):
 		self.value = getattr(self.reference, self.lookup) / 100 * self.percent
 
+	def _expression(self):
+		self.value = self.compiled()
+
+	def _expressionPer(self):
+		self.value = self.compiled() / 100 * self.percent
+
 	def _direct(self):
 		self.value = self.reference
 
+	def _memoResolve(self):
+		epoch = FrameEpoch.current
+
+		if epoch and self.resolvedEpoch == epoch:
+			return None
+
+		self._resolveRaw()
+
+		self.resolvedEpoch = epoch
+
+	def _reactiveResolve(self):
+		# values that can change without telling us (animations, untracked values) are always pulled
+		for source in self.volatileSources:
+			source.resolveValue()
+
+		if not self.dirty:
+			return None
+
+		for source in self.sources:
+			source.resolveValue()
+
+		previous = self.value
+
+		self._resolveRaw()
+
+		self.dirty = not self.tracked
+
+		if self.value != previous:
+			self.notifyDependants()
+
+	def addDependant(self, dependant: DynamicValue):
+		if not self.dependants:
+			self.dependants = []
+
+		if not dependant in self.dependants:
+			self.dependants.append(dependant)
+
+	def removeDependant(self, dependant: DynamicValue):
+		if dependant in self.dependants:
+			self.dependants.remove(dependant)
+
+	def notifyDependants(self):
+		for dependant in self.dependants:
+			dependant.invalidate()
+
+	# drops the cached value for this frame and marks everything downstream of it as dirty
+	def invalidate(self):
+		self.resolvedEpoch = 0
+
+		if self.dirty and self.tracked:
+			return None
+
+		self.dirty = True
+
+		self.notifyDependants()
+
+	# records what this value reads so that it only recomputes when one of those sources changes.
+	# a value counts as tracked when every source can push changes to it: reactive DynamicValues,
+	# AnimatedValues and the NOTIFIED_ATTRIBUTES of Observable objects (Window, RectArea, CircleArea...).
+	# anything else (dict lookups, callables without dependsOn, other attributes) is recomputed on every resolve.
+	def setupDependencies(self):
+		from pg_extended.Core.Base.AnimatedValue import AnimatedValue
+
+		self._unregister()
+
+		if self.dependsOn is not None:
+			dependencies = list(self.dependsOn)
+		elif self._resolveRaw in (self._CV, self._CVPer):
+			dependencies = [self.reference]
+		elif self._resolveRaw in (self._objLookup, self._objLookupPer):
+			dependencies = [(self.reference, self.lookup)]
+		elif self._resolveRaw in (self._expression, self._expressionPer):
+			dependencies = self.reference.dependencies()
+		elif self._resolveRaw in (self._IFPer, self._direct):
+			dependencies = []
+		else:
+			dependencies = None
+
+		self.tracked = dependencies is not None
+		self.sources = []
+		self.volatileSources = []
+
+		for dependency in dependencies or ():
+			if isinstance(dependency, AnimatedValue):
+				dependency.addDependant(self)
+				self.volatileSources.append(dependency)
+
+			elif isinstance(dependency, DynamicValue):
+				if dependency.reactive:
+					dependency.addDependant(self)
+
+					if dependency.tracked:
+						self.sources.append(dependency)
+					else:
+						self.volatileSources.append(dependency)
+				else:
+					self.tracked = False
+
+			elif isinstance(dependency, (tuple, list)) and len(dependency) == 2 and isinstance(dependency[0], Observable) and dependency[1] in dependency[0].NOTIFIED_ATTRIBUTES:
+				dependency[0].watchAttribute(dependency[1], self)
+
+				if not self.watched:
+					self.watched = []
+
+				self.watched.append((dependency[0], dependency[1]))
+
+			else:
+				self.tracked = False
+
+	def _unregister(self):
+		for observable, name in self.watched:
+			observable.unwatchAttribute(name, self)
+
+		for source in self.sources:
+			source.removeDependant(self)
+
+		for source in self.volatileSources:
+			source.removeDependant(self)
+
+		self.watched = ()
+
+	# unregisters a reactive value from everything it subscribed to, so a replaced value or one of a removed element
+	# isn't kept alive by its sources. it keeps working, recomputing on every resolve like an untracked value
+	def release(self):
+		if not self.reactive:
+			return None
+
+		self._unregister()
+
+		self.tracked = False
+		self.dirty = True
+
+		# values that counted on this one pushing changes now have to pull it
+		for dependant in self.dependants:
+			if isinstance(dependant, DynamicValue) and self in dependant.sources:
+				dependant.sources.remove(self)
+				dependant.volatileSources.append(self)
+
 	def assignResolveMethod(self):
 		from pg_extended.Core.Base.AnimatedValue import AnimatedValue
 
 		# numbers with a percent value given
 		if isinstance(self.reference, (int, float)) and self.percent is not None:
-			self.resolveValue = self._IFPer
+			self._resolveRaw = self._IFPer
 
 		# dicts
 		elif isinstance(self.reference, dict) and self.lookup is not None:
 			if self.percent is None:
-				self.resolveValue = self._dictLookup
+				self._resolveRaw = self._dictLookup
 			else:
-				self.resolveValue = self._dictLookupPer
+				self._resolveRaw = self._dictLookupPer
 
 		# DV or AV
 		elif isinstance(self.reference, DynamicValue) or isinstance(self.reference, AnimatedValue):
 			if self.percent is None:
-				self.resolveValue = self._CV
+				self._resolveRaw = self._CV
 			else:
-				self.resolveValue = self._CVPer
+				self._resolveRaw = self._CVPer
+
+		# operator expressions like DynamicValue(section, 'x') + DynamicValue(section, 'width') / 20
+		elif isinstance(self.reference, Expression):
+			self.compiled = self.reference.compile()
+
+			if self.percent is None:
+				self._resolveRaw = self._expression
+			else:
+				self._resolveRaw = self._expressionPer
 
 		# callable
 		elif isinstance(self.reference, (types.FunctionType | types.BuiltinFunctionType | types.MethodType)):
 			if self.args is None:
 				if self.percent is None:
-					self.resolveValue = self._call
+					self._resolveRaw = self._call
 				else:
-					self.resolveValue = self._callPer
+					self._resolveRaw = self._callPer
 			else:
 				if self.percent is None:
-					self.resolveValue = self._callArgs
+					self._resolveRaw = self._callArgs
 				else:
-					self.resolveValue = self._callArgsPer
+					self._resolveRaw = self._callArgsPer
 
 		# none of the above and lookup is provided, assume it's a class + attribute
 		elif isinstance(self.lookup, str):
 			if self.percent is None:
-				self.resolveValue = self._objLookup
+				self._resolveRaw = self._objLookup
 			else:
-				self.resolveValue = self._objLookupPer
+				self._resolveRaw = self._objLookupPer
 
 		# dump everything else into direct
 		else:
-			self.resolveValue = self._direct
+			self._resolveRaw = self._direct
+
+		if self.reactive:
+			self.resolveValue = self._reactiveResolve
+		elif self.volatile:
+			self.resolveValue = self._resolveRaw
+		else:
+			self.resolveValue = self._memoResolve
@@ -0,0 +1,266 @@
+from __future__ import annotations
+from typing import Any
+from keyword import iskeyword
+from pg_extended.Types import CallableLike
+
+BINARY_OPERATORS = ('+', '-', '*', '/', '//', '%')
+VALID_OPERATORS = BINARY_OPERATORS + ('neg', 'min', 'max', 'clamp', 'attr')
+
+CONSTANT_OPERATIONS = {
+	'+': lambda a, b: a + b,
+	'-': lambda a, b: a - b,
+	'*': lambda a, b: a * b,
+	'/': lambda a, b: a / b,
+	'//': lambda a, b: a // b,
+	'%': lambda a, b: a % b,
+	'neg': lambda a: -a,
+	'min': min,
+	'max': max,
+	'clamp': lambda x, low, high: min(max(x, low), high)
+}
+
+# arithmetic on DynamicValue / AnimatedValue / Expression objects builds an Expression tree instead of a number
+class ExpressionOperators:
+	__slots__ = ()
+
+	def __add__(self, other: Any) -> Expression:
+		return Expression('+', self, other)
+
+	def __radd__(self, other: Any) -> Expression:
+		return Expression('+', other, self)
+
+	def __sub__(self, other: Any) -> Expression:
+		return Expression('-', self, other)
+
+	def __rsub__(self, other: Any) -> Expression:
+		return Expression('-', other, self)
+
+	def __mul__(self, other: Any) -> Expression:
+		return Expression('*', self, other)
+
+	def __rmul__(self, other: Any) -> Expression:
+		return Expression('*', other, self)
+
+	def __truediv__(self, other: Any) -> Expression:
+		return Expression('/', self, other)
+
+	def __rtruediv__(self, other: Any) -> Expression:
+		return Expression('/', other, self)
+
+	def __floordiv__(self, other: Any) -> Expression:
+		return Expression('//', self, other)
+
+	def __rfloordiv__(self, other: Any) -> Expression:
+		return Expression('//', other, self)
+
+	def __mod__(self, other: Any) -> Expression:
+		return Expression('%', self, other)
+
+	def __rmod__(self, other: Any) -> Expression:
+		return Expression('%', other, self)
+
+	def __neg__(self) -> Expression:
+		return Expression('neg', self)
+
+	def min(self, *others: Any) -> Expression:
+		return Expression('min', self, *others)
+
+	def max(self, *others: Any) -> Expression:
+		return Expression('max', self, *others)
+
+	def clamp(self, low: Any, high: Any) -> Expression:
+		return Expression('clamp', self, low, high)
+
+class Expression(ExpressionOperators):
+	__slots__ = ('operator', 'operands', 'source')
+
+	def __init__(self, operator: str, *operands: Any):
+		if not operator in VALID_OPERATORS:
+			raise ValueError(f'Invalid expression operator: {operator}. Must be one of: {VALID_OPERATORS}')
+
+		if operator == 'attr' and not (len(operands) == 2 and isinstance(operands[1], str)):
+			raise ValueError('"attr" expressions take exactly an object and an attribute name.')
+
+		self.operator = operator
+		self.operands = operands
+
+		# generated code of the last compile() call, useful for debugging layouts
+		self.source: str | None = None
+
+	# leaf that reads obj.name every time the compiled expression runs, e.g. Expression.attr(section, 'width') / 20
+	@staticmethod
+	def attr(obj: Any, name: str) -> Expression:
+		return Expression('attr', obj, name)
+
+	def __repr__(self) -> str:
+		return f'Expression({self.operator!r}, {", ".join(repr(operand) for operand in self.operands)})'
+
+	# flattens the whole tree into one generated function, nested DynamicValues with attribute / percent lookups
+	# and nested expressions get inlined, constant sub trees get folded
+	def compile(self) -> CallableLike:
+		env = {'_min': min, '_max': max}
+		names: dict[int, str] = {}
+		prelude: list[str] = []
+
+		code, isConstant, constant = self._emit(env, names, prelude)
+
+		if isConstant:
+			code = repr(constant)
+
+		lines = ['def _compiled():']
+		lines.extend(f'\t{line}' for line in prelude)
+		lines.append(f'\treturn {code}')
+
+		self.source = '\n'.join(lines)
+
+		exec(self.source, env)
+
+		return env['_compiled']
+
+	# returns everything this expression reads: (object, attribute) pairs and values that have to be resolved
+	def dependencies(self) -> list:
+		dependencies = []
+
+		self._collectDependencies(dependencies)
+
+		return dependencies
+
+	def _emit(self, env: dict, names: dict[int, str], prelude: list[str]) -> tuple[str, bool, Any]:
+		if self.operator == 'attr':
+			obj, name = self.operands
+
+			return Expression._attrCode(Expression._nameFor(obj, env, names), name), False, None
+
+		emitted = [Expression._emitOperand(operand, env, names, prelude) for operand in self.operands]
+
+		if all(isConstant for _, isConstant, _ in emitted):
+			return '', True, CONSTANT_OPERATIONS[self.operator](*(constant for _, _, constant in emitted))
+
+		codes = [repr(constant) if isConstant else code for code, isConstant, constant in emitted]
+
+		if self.operator in BINARY_OPERATORS:
+			return f'({codes[0]} {self.operator} {codes[1]})', False, None
+
+		if self.operator == 'neg':
+			return f'(-{codes[0]})', False, None
+
+		if self.operator == 'clamp':
+			return f'_min(_max({codes[0]}, {codes[1]}), {codes[2]})', False, None
+
+		return f'_{self.operator}({", ".join(codes)})', False, None
+
+	@staticmethod
+	def _emitOperand(operand: Any, env: dict, names: dict[int, str], prelude: list[str]) -> tuple[str, bool, Any]:
+		from pg_extended.Core.Base.DynamicValue import DynamicValue
+		from pg_extended.Core.Base.AnimatedValue import AnimatedValue
+
+		if isinstance(operand, Expression):
+			return operand._emit(env, names, prelude)
+
+		if isinstance(operand, (int, float)):
+			return '', True, operand
+
+		if isinstance(operand, DynamicValue):
+			method = operand._resolveRaw.__func__
+			percent = operand.percent
+
+			if method is DynamicValue._IFPer:
+				return '', True, operand.reference / 100 * percent
+
+			if method is DynamicValue._direct and isinstance(operand.reference, (int, float)):
+				return '', True, operand.reference
+
+			if method in (DynamicValue._objLookup, DynamicValue._objLookupPer):
+				result = Expression._attrCode(Expression._nameFor(operand.reference, env, names), operand.lookup), False, None
+			elif method in (DynamicValue._CV, DynamicValue._CVPer):
+				result = Expression._emitOperand(operand.reference, env, names, prelude)
+			elif method in (DynamicValue._expression, DynamicValue._expressionPer):
+				result = operand.reference._emit(env, names, prelude)
+			else:
+				# anything else is resolved as is, its .value already has the percent applied
+				return Expression._resolvedCode(operand, env, names, prelude), False, None
+
+			if percent is None:
+				return result
+
+			code, isConstant, constant = result
+
+			if isConstant:
+				return '', True, constant / 100 * percent
+
+			return f'({code} / 100 * {percent!r})', False, None
+
+		if isinstance(operand, AnimatedValue):
+			return Expression._resolvedCode(operand, env, names, prelude), False, None
+
+		raise ValueError(f'Unsupported operand in expression: {operand!r}')
+
+	@staticmethod
+	def _nameFor(obj: Any, env: dict, names: dict[int, str]) -> str:
+		if not id(obj) in names:
+			names[id(obj)] = f'r{len(names)}'
+			env[names[id(obj)]] = obj
+
+		return names[id(obj)]
+
+	# values that can't be inlined get resolved once at the top of the generated function
+	@staticmethod
+	def _resolvedCode(value: Any, env: dict, names: dict[int, str], prelude: list[str]) -> str:
+		name = Expression._nameFor(value, env, names)
+		statement = f'{name}.resolveValue()'
+
+		if not statement in prelude:
+			prelude.append(statement)
+
+		return f'{name}.value'
+
+	@staticmethod
+	def _attrCode(name: str, attribute: str) -> str:
+		if attribute.isidentifier() and not iskeyword(attribute):
+			return f'{name}.{attribute}'
+
+		return f'getattr({name}, {attribute!r})'
+
+	def _collectDependencies(self, dependencies: list):
+		if self.operator == 'attr':
+			Expression._addDependency((self.operands[0], self.operands[1]), dependencies)
+			return None
+
+		for operand in self.operands:
+			Expression._collectOperand(operand, dependencies)
+
+	@staticmethod
+	def _collectOperand(operand: Any, dependencies: list):
+		from pg_extended.Core.Base.DynamicValue import DynamicValue
+
+		if isinstance(operand, Expression):
+			operand._collectDependencies(dependencies)
+
+		elif isinstance(operand, DynamicValue):
+			method = operand._resolveRaw.__func__
+
+			if method in (DynamicValue._IFPer, DynamicValue._direct) and isinstance(operand.reference, (int, float)):
+				return None
+
+			if method in (DynamicValue._objLookup, DynamicValue._objLookupPer):
+				Expression._addDependency((operand.reference, operand.lookup), dependencies)
+			elif method in (DynamicValue._CV, DynamicValue._CVPer):
+				Expression._collectOperand(operand.reference, dependencies)
+			elif method in (DynamicValue._expression, DynamicValue._expressionPer):
+				operand.reference._collectDependencies(dependencies)
+			else:
+				Expression._addDependency(operand, dependencies)
+
+		elif not isinstance(operand, (int, float)):
+			Expression._addDependency(operand, dependencies)
+
+	@staticmethod
+	def _addDependency(dependency: Any, dependencies: list):
+		for existing in dependencies:
+			if isinstance(dependency, tuple) and isinstance(existing, tuple):
+				if dependency[0] is existing[0] and dependency[1] == existing[1]:
+					return None
+			elif dependency is existing:
+				return None
+
+		dependencies.append(dependency)
@@ -0,0 +1,10 @@
+class FrameEpoch:
+	# id of the current frame pass, 0 means no window is running and memoization is disabled
+	current: int = 0
+
+	# called by the main loop, every value resolved after this gets recomputed once and then cached until the next advance
+	@staticmethod
+	def advance() -> int:
+		FrameEpoch.current += 1
+
+		return FrameEpoch.current
@@ -0,0 +1,38 @@
+from typing import Any
+
+class Observable:
+	# name -> list of reactive values that read that attribute, subclasses set it to None in __init__
+	__slots__ = ('attributeWatchers',)
+
+	# attributes the subclass calls notifyAttribute() for, reactive values only subscribe to these and poll the rest
+	NOTIFIED_ATTRIBUTES: tuple[str, ...] = ()
+
+	def watchAttribute(self, name: str, watcher: Any):
+		if getattr(self, 'attributeWatchers', None) is None:
+			self.attributeWatchers = {}
+
+		watchers = self.attributeWatchers.setdefault(name, [])
+
+		if not watcher in watchers:
+			watchers.append(watcher)
+
+	def unwatchAttribute(self, name: str, watcher: Any):
+		if getattr(self, 'attributeWatchers', None) is None or not name in self.attributeWatchers:
+			return None
+
+		if watcher in self.attributeWatchers[name]:
+			self.attributeWatchers[name].remove(watcher)
+
+	# call this after changing a watched attribute, marks everything that reads it as dirty
+	def notifyAttribute(self, name: str):
+		if getattr(self, 'attributeWatchers', None) is None or not name in self.attributeWatchers:
+			return None
+
+		for watcher in self.attributeWatchers[name]:
+			watcher.invalidate()
+
+	# compares the given old values with the current ones and notifies only the ones that changed
+	def notifyChangedAttributes(self, previous: dict[str, Any]):
+		for name in previous:
+			if previous[name] != getattr(self, name):
+				self.notifyAttribute(name)
@@ -0,0 +1,290 @@
+from __future__ import annotations
+from typing import Sequence
+import numpy as np
+from pg_extended.Types import CallableLike
+from pg_extended.Core.Base.DynamicValue import DynamicValue
+from pg_extended.Core.Base.AnimatedValue import EASING_MAP
+from pg_extended.Core.Base.AnimationClock import AnimationClock
+from pg_extended.Core.Base.FrameEpoch import FrameEpoch
+
+EASING_TYPES = tuple(EASING_MAP)
+EASING_IDS = {name: i for i, name in enumerate(EASING_TYPES)}
+
+# DynamicValue compatible view of one tween in a TweenBatch
+class TweenValue(DynamicValue):
+	__slots__ = ('batch', 'index')
+
+	def __init__(self, batch: TweenBatch, index: int):
+		self.batch = batch
+		self.index = index
+
+		super().__init__(batch, resolveNow=False, volatile=True)
+
+		self._resolveRaw = self._tween
+		self.resolveValue = self._tween
+
+		self.value = batch.values[index]
+
+	# the batch steps at most once per frame, a view only reads its slot afterwards
+	def _tween(self):
+		self.batch.resolveValue()
+		self.value = self.batch.values[self.index]
+
+	def tweenTo(self, end: int | float, duration: float | None = None, easing: str | None = None, delay: float = 0, callback: CallableLike = None):
+		self.batch.tweenTo(self.index, end, duration, easing, delay, callback)
+
+# thousands of simultaneous tweens (chart bars growing to new heights...) kept as flat numpy arrays and advanced
+# with one vectorized pass per frame. while anything is running the batch sits in its AnimationClock like an AnimatedValue
+class TweenBatch:
+	def __init__(self, duration: float = 300, easing: str = 'linear', callback: CallableLike = None, clock: AnimationClock = None):
+		if duration <= 0:
+			raise ValueError("Invalid duration for animation.")
+
+		TweenBatch._checkEasing(easing)
+
+		# defaults for tweens that don't specify their own
+		self.duration = duration
+		self.easing = easing
+
+		# called once per step with an array of every index that finished during it
+		self.callback = callback
+		# index -> [callback, unfinished count, finished count] shared by every tween of one tweenTo() call
+		self.callbacks: dict[int, list] = {}
+
+		# None follows the default clock, bound by the first tweenTo(), see AnimatedValue
+		self.clock: AnimationClock | None = clock
+
+		self.count = 0
+		self.starts = np.zeros(0, dtype=np.float64)
+		self.ends = np.zeros(0, dtype=np.float64)
+		self.durations = np.ones(0, dtype=np.float64)
+		self.delays = np.zeros(0, dtype=np.float64)
+		self.startTimes = np.zeros(0, dtype=np.float64)
+		self.easings = np.zeros(0, dtype=np.int8)
+		self.running = np.zeros(0, dtype=bool)
+
+		self.current = np.zeros(0, dtype=np.float64)
+		self.values: list[float] = []
+		self.views: list[TweenValue] = []
+
+		self.resolvedEpoch = 0
+
+	def __len__(self) -> int:
+		return self.count
+
+	@staticmethod
+	def _checkEasing(easing: str):
+		if not easing in EASING_IDS:
+			raise ValueError(f'Invalid easing type: {easing}. Must be one of: {EASING_TYPES}')
+
+	# grows every array to hold at least `size` entries, doubling so adding one at a time stays cheap
+	def _reserve(self, size: int):
+		capacity = len(self.starts)
+
+		if size <= capacity:
+			return None
+
+		capacity = max(size, capacity * 2, 16)
+
+		for name in ('starts', 'ends', 'durations', 'delays', 'startTimes', 'easings', 'running', 'current'):
+			old = getattr(self, name)
+			new = np.zeros(capacity, dtype=old.dtype)
+			new[:self.count] = old[:self.count]
+
+			setattr(self, name, new)
+
+	# adds one resting tween at `value`, use tweenTo() to start it
+	def add(self, value: int | float) -> TweenValue:
+		return self.addMany([value])[0]
+
+	def addMany(self, values: Sequence[int | float] | np.ndarray) -> list[TweenValue]:
+		values = np.asarray(values, dtype=np.float64)
+		first = self.count
+		last = first + len(values)
+
+		self._reserve(last)
+
+		self.starts[first:last] = values
+		self.ends[first:last] = values
+		self.current[first:last] = values
+		self.durations[first:last] = self.duration
+		self.easings[first:last] = EASING_IDS[self.easing]
+
+		self.count = last
+		self.values.extend(values.tolist())
+
+		views = [TweenValue(self, index) for index in range(first, last)]
+		self.views.extend(views)
+
+		return views
+
+	# retargets the given tweens from wherever they are right now, indices / ends can be single values or arrays
+	def tweenTo(self, indices: int | Sequence[int] | np.ndarray, ends: int | float | Sequence[int | float] | np.ndarray, duration: float | Sequence[float] | np.ndarray | None = None, easing: str | None = None, delay: float | Sequence[float] | np.ndarray = 0, callback: CallableLike = None):
+		indices = np.atleast_1d(np.asarray(indices, dtype=np.intp))
+
+		if len(indices) and (indices.min() < 0 or indices.max() >= self.count):
+			raise ValueError(f'Invalid tween index, the batch holds {self.count} tweens.')
+
+		if easing is not None:
+			TweenBatch._checkEasing(easing)
+
+		if duration is not None and np.any(np.asarray(duration) <= 0):
+			raise ValueError("Invalid duration for animation.")
+
+		# in flight tweens continue from their current value
+		self.resolveValue()
+
+		self.starts[indices] = self.current[indices]
+		self.ends[indices] = ends
+		self.durations[indices] = self.duration if duration is None else duration
+		self.delays[indices] = delay
+		if self.clock is None:
+			self.clock = AnimationClock.getDefault()
+
+		self.startTimes[indices] = self.clock.time()
+		self.easings[indices] = EASING_IDS[easing or self.easing]
+		self.running[indices] = True
+
+		# retargeted tweens leave their previous group, that group's callback fires when its remaining tweens finish,
+		# right away if the retargeted ones were all it was still waiting for
+		completed = self._release(indices)
+
+		if callback is not None:
+			# a repeated index is one tween
+			group = [callback, len(np.unique(indices)), 0]
+
+			for index in indices.tolist():
+				self.callbacks[index] = group
+
+		self.resolvedEpoch = 0
+		self.clock.add(self)
+
+		for groupCallback in completed:
+			groupCallback()
+
+	# snaps the given tweens (all of them by default) to their end values without firing callbacks, groups emptied by it
+	# don't fire either
+	def finish(self, indices: Sequence[int] | np.ndarray | None = None):
+		if indices is None:
+			indices = np.arange(self.count)
+		else:
+			indices = np.atleast_1d(np.asarray(indices, dtype=np.intp))
+
+		self.current[indices] = self.ends[indices]
+		self.running[indices] = False
+
+		self._release(indices)
+
+		self.values = self.current[:self.count].tolist()
+
+		if not self.running[:self.count].any() and self.clock is not None:
+			self.clock.remove(self)
+
+	# advances every running tween at most once per frame epoch, called by the AnimationClock and the views
+	def resolveValue(self):
+		epoch = FrameEpoch.current
+
+		if epoch and self.resolvedEpoch == epoch:
+			return None
+
+		self.resolvedEpoch = epoch
+
+		count = self.count
+		running = np.flatnonzero(self.running[:count])
+
+		if not len(running):
+			if self.clock is not None:
+				self.clock.remove(self)
+
+			return None
+
+		# plain slices when everything is running, fancy indexing costs more than the math itself
+		if len(running) == count:
+			running = slice(0, count)
+
+		elapsed = self.clock.time() - self.startTimes[running] - self.delays[running]
+		t = np.clip(elapsed / self.durations[running], 0, 1)
+
+		easings = self.easings[running]
+		eased = t
+
+		# one pass per easing curve actually in use, all of them are plain arithmetic and work on arrays as is
+		for easing, easingID in EASING_IDS.items():
+			if easing == 'linear':
+				continue
+
+			mask = easings == easingID
+
+			if mask.any():
+				if eased is t:
+					eased = t.copy()
+
+				eased[mask] = EASING_MAP[easing](t[mask])
+
+		starts = self.starts[running]
+
+		self.current[running] = starts + (self.ends[running] - starts) * eased
+		self.values = self.current[:count].tolist()
+
+		finished = np.flatnonzero(t >= 1)
+
+		if not isinstance(running, slice):
+			finished = running[finished]
+
+		if len(finished):
+			self.running[finished] = False
+			self._dispatch(finished)
+
+		if not self.running[:count].any():
+			self.clock.remove(self)
+
+	# drops the given tweens from their callback groups without counting them as finished, returns the callbacks of
+	# groups left with nothing to wait for that had at least one tween finish
+	def _release(self, indices: np.ndarray) -> list[CallableLike]:
+		completed = []
+
+		if not self.callbacks:
+			return completed
+
+		for index in indices.tolist():
+			group = self.callbacks.pop(index, None)
+
+			if group is not None:
+				group[1] -= 1
+
+				if group[1] == 0 and group[2] > 0:
+					completed.append(group[0])
+
+		return completed
+
+	# group callbacks fire once, when the last tween of their tweenTo() call finishes
+	def _dispatch(self, finished: np.ndarray):
+		if self.callbacks:
+			completed = []
+
+			for index in finished.tolist():
+				group = self.callbacks.pop(index, None)
+
+				if group is None:
+					continue
+
+				group[1] -= 1
+				group[2] += 1
+
+				if group[1] == 0:
+					completed.append(group[0])
+
+			for callback in completed:
+				callback()
+
+		if self.callback is not None:
+			self.callback(finished)
+
+	def isRunning(self, index: int | None = None) -> bool:
+		if index is None:
+			return bool(self.running[:self.count].any())
+
+		return bool(self.running[index])
+
+	def getValues(self) -> np.ndarray:
+		return self.current[:self.count]
@@ -1,3 +1,12 @@
+from pg_extended.Core.Base.FrameEpoch import FrameEpoch
+from pg_extended.Core.Base.Observable import Observable
+from pg_extended.Core.Base.AnimationClock import AnimationClock
+from pg_extended.Core.Base.Expression import Expression
 from pg_extended.Core.Base.DynamicValue import DynamicValue
 from pg_extended.Core.Base.AnimatedValue import AnimatedValue
-from pg_extended.Core.Base.Callback import Callback, CallbackSet
+from pg_extended.Core.Base.AnimatedVector import AnimatedVector, AnimatedColor, AnimatedChannel
+from pg_extended.Core.Base.TweenBatch import TweenBatch, TweenValue
+from pg_extended.Core.Base.DimensionStore import DimensionStore, StoreDimension
+from pg_extended.Core.Base.CallbackQueue import CallbackQueue
+from pg_extended.Core.Base.BackgroundJob import BackgroundJob
+from pg_extended.Core.Base.Callback import Callback, CallbackSet, triggerID
@@ -1,10 +1,20 @@
 from pg_extended.Core.Base.DynamicValue import DynamicValue
 from pg_extended.Core.Base.AnimatedValue import AnimatedValue
+from pg_extended.Core.Base.Observable import Observable
 
 type NumValue = DynamicValue | AnimatedValue | int | float
 
-class CircleArea:
+class CircleArea(Observable):
+	__slots__ = ('dimensions', 'x', 'y', 'radius', 'moved', 'resized', 'dimensionOrder')
+
+	NOTIFIED_ATTRIBUTES = ('x', 'y', 'radius')
+
 	def __init__(self, dimensions: dict[str, NumValue]):
+		self.attributeWatchers = None
+
+		for key in dimensions:
+			dimensions[key] = DynamicValue.wrap(dimensions[key])
+
 		self.dimensions = dimensions
 
 		if not len(self.dimensions) == 3:
@@ -14,9 +24,16 @@ class CircleArea:
 			if not key in self.dimensions:
 				raise ValueError('dimensions must contain all of the following keys: \'x\', \'y\', \'radius\'')
 
-		self.x: int | float
-		self.y: int | float
-		self.radius: int | float
+		self.x: int | float = None
+		self.y: int | float = None
+		self.radius: int | float = None
+
+		# what the last update() changed, see RectArea
+		self.moved = True
+		self.resized = True
+
+		# set by System.buildUpdateOrder() when a dimension reads another dimension of this area
+		self.dimensionOrder: tuple[str, ...] | None = None
 
 		self.update()
 
@@ -24,10 +41,51 @@ class CircleArea:
 		return self.dimensions[key].value if isinstance(self.dimensions[key], (DynamicValue, AnimatedValue)) else self.dimensions[key]
 
 	def update(self):
+		if self.dimensionOrder is not None:
+			return self.updateOrdered()
+
 		for key in self.dimensions:
 			if isinstance(self.dimensions[key], (DynamicValue, AnimatedValue)):
 				self.dimensions[key].resolveValue()
 
-		self.x = self.getDimValue("x")
-		self.y = self.getDimValue("y")
-		self.radius = self.getDimValue("radius")
+		x = self.getDimValue("x")
+		y = self.getDimValue("y")
+		radius = self.getDimValue("radius")
+
+		self.moved = x != self.x or y != self.y
+		self.resized = radius != self.radius
+
+		if not (self.moved or self.resized):
+			return None
+
+		watched = self.attributeWatchers is not None
+
+		if watched:
+			previous = {'x': self.x, 'y': self.y, 'radius': self.radius}
+
+		self.x = x
+		self.y = y
+		self.radius = radius
+
+		if watched:
+			self.notifyChangedAttributes(previous)
+
+	# resolves the dimensions in dependency order and sets each attribute as soon as it's known, so a dimension
+	# reading another one of this area (through the attribute) sees this frame's value
+	def updateOrdered(self):
+		previous = {'x': self.x, 'y': self.y, 'radius': self.radius}
+
+		for key in self.dimensionOrder:
+			dimension = self.dimensions[key]
+
+			if isinstance(dimension, (DynamicValue, AnimatedValue)):
+				dimension.resolveValue()
+
+			value = self.getDimValue(key)
+
+			if value != getattr(self, key):
+				setattr(self, key, value)
+				self.notifyAttribute(key)
+
+		self.moved = self.x != previous['x'] or self.y != previous['y']
+		self.resized = self.radius != previous['radius']
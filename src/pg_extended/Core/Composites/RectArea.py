@@ -1,11 +1,21 @@
 import pygame as pg
 from pg_extended.Core.Base.DynamicValue import DynamicValue
 from pg_extended.Core.Base.AnimatedValue import AnimatedValue
+from pg_extended.Core.Base.Observable import Observable
 
 type NumValue = DynamicValue | AnimatedValue | int | float
 
-class RectArea:
+class RectArea(Observable):
+	__slots__ = ('dimensions', 'x', 'y', 'width', 'height', 'rect', 'moved', 'resized', 'dimensionOrder')
+
+	NOTIFIED_ATTRIBUTES = ('x', 'y', 'width', 'height')
+
 	def __init__(self, dimensions: dict[str, NumValue]):
+		self.attributeWatchers = None
+
+		for key in dimensions:
+			dimensions[key] = DynamicValue.wrap(dimensions[key])
+
 		self.dimensions: dict[str, NumValue] = dimensions
 
 		if not len(self.dimensions) == 4:
@@ -15,26 +25,78 @@ class RectArea:
 			if not key in self.dimensions:
 				raise ValueError('dimensions must contain all of the following keys: \'x\', \'y\', \'width\' \'height\'')
 
-		self.x: int | float
-		self.y: int | float
-		self.width: int | float
-		self.height: int | float
+		self.x: int | float = None
+		self.y: int | float = None
+		self.width: int | float = None
+		self.height: int | float = None
 
 		self.rect: pg.Rect = pg.Rect(0, 0, 0, 0)
 
+		# what the last update() changed, lets subclasses skip re-rasterizing when only the position moved or nothing did
+		self.moved = True
+		self.resized = True
+
+		# set by System.buildUpdateOrder() when a dimension reads another dimension of this area
+		self.dimensionOrder: tuple[str, ...] | None = None
+
 		self.update()
 
 	def getDimValue(self, key: str) -> int | float:
 		return self.dimensions[key].value if isinstance(self.dimensions[key], (DynamicValue, AnimatedValue)) else self.dimensions[key]
 
 	def update(self):
+		if self.dimensionOrder is not None:
+			return self.updateOrdered()
+
 		for key in self.dimensions:
 			if isinstance(self.dimensions[key], (DynamicValue, AnimatedValue)):
 				self.dimensions[key].resolveValue()
 
-		self.x = self.getDimValue("x")
-		self.y = self.getDimValue("y")
-		self.width = self.getDimValue("width")
-		self.height = self.getDimValue("height")
-		
+		x = self.getDimValue("x")
+		y = self.getDimValue("y")
+		width = self.getDimValue("width")
+		height = self.getDimValue("height")
+
+		self.moved = x != self.x or y != self.y
+		self.resized = width != self.width or height != self.height
+
+		if not (self.moved or self.resized):
+			return None
+
+		watched = self.attributeWatchers is not None
+
+		if watched:
+			previous = {'x': self.x, 'y': self.y, 'width': self.width, 'height': self.height}
+
+		self.x = x
+		self.y = y
+		self.width = width
+		self.height = height
+
 		self.rect.update(self.x, self.y, self.width, self.height)
+
+		if watched:
+			self.notifyChangedAttributes(previous)
+
+	# resolves the dimensions in dependency order and sets each attribute as soon as it's known, so a dimension
+	# reading another one of this area (through the attribute) sees this frame's value
+	def updateOrdered(self):
+		previous = {'x': self.x, 'y': self.y, 'width': self.width, 'height': self.height}
+
+		for key in self.dimensionOrder:
+			dimension = self.dimensions[key]
+
+			if isinstance(dimension, (DynamicValue, AnimatedValue)):
+				dimension.resolveValue()
+
+			value = self.getDimValue(key)
+
+			if value != getattr(self, key):
+				setattr(self, key, value)
+				self.notifyAttribute(key)
+
+		self.moved = self.x != previous['x'] or self.y != previous['y']
+		self.resized = self.width != previous['width'] or self.height != previous['height']
+
+		if self.resized or self.moved:
+			self.rect.update(self.x, self.y, self.width, self.height)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+from typing import Any
+import pygame as pg
+from pg_extended.Core.Composites.RectArea import RectArea
+
+# registered as an attribute watcher on an area, marks its entry for re-indexing when the area moves or resizes
+class GridWatcher:
+	__slots__ = ('grid', 'key')
+
+	def __init__(self, grid: SpatialGrid, key: Any):
+		self.grid = grid
+		self.key = key
+
+	def invalidate(self):
+		self.grid.dirty.add(self.key)
+
+# uniform grid over rects for point queries, e.g. finding the few elements under the cursor out of thousands.
+# entries hold the live pg.Rect, moved entries are re-indexed lazily on the next query
+class SpatialGrid:
+	def __init__(self, cellSize: int = 64):
+		if cellSize <= 0:
+			raise ValueError('cellSize must be greater than 0.')
+
+		self.cellSize = cellSize
+
+		self.cells: dict[tuple[int, int], list[Any]] = {}
+		self.rects: dict[Any, pg.Rect] = {}
+		self.indexed: dict[Any, tuple[tuple[int, int, int, int], list[tuple[int, int]]]] = {}
+		self.watchers: dict[Any, tuple[RectArea, GridWatcher]] = {}
+		self.dirty: set[Any] = set()
+
+	def __len__(self) -> int:
+		return len(self.rects)
+
+	def __contains__(self, key: Any) -> bool:
+		return key in self.rects
+
+	# indexes area.rect under key and watches the area so moves are picked up without polling
+	def addArea(self, key: Any, area: RectArea):
+		self.add(key, area.rect)
+
+		watcher = GridWatcher(self, key)
+
+		for attr in ('x', 'y', 'width', 'height'):
+			area.watchAttribute(attr, watcher)
+
+		self.watchers[key] = (area, watcher)
+
+	def add(self, key: Any, rect: pg.Rect):
+		if key in self.rects:
+			self.remove(key)
+
+		self.rects[key] = rect
+		self._index(key)
+
+	def remove(self, key: Any):
+		if not key in self.rects:
+			return None
+
+		self._unindex(key)
+
+		del self.rects[key]
+		self.dirty.discard(key)
+
+		if key in self.watchers:
+			area, watcher = self.watchers.pop(key)
+
+			for attr in ('x', 'y', 'width', 'height'):
+				area.unwatchAttribute(attr, watcher)
+
+	def clear(self):
+		for key in tuple(self.rects):
+			self.remove(key)
+
+	# re-indexes every entry, for rects changed without going through their area's update()
+	def rebuild(self):
+		self.dirty.update(self.rects)
+		self.sync()
+
+	def sync(self):
+		while self.dirty:
+			key = self.dirty.pop()
+
+			if key in self.rects:
+				self._index(key)
+
+	def _cellsFor(self, rect: pg.Rect) -> list[tuple[int, int]]:
+		if rect.width <= 0 or rect.height <= 0:
+			return []
+
+		size = self.cellSize
+
+		return [
+			(cx, cy)
+			for cx in range(rect.left // size, (rect.right - 1) // size + 1)
+			for cy in range(rect.top // size, (rect.bottom - 1) // size + 1)
+		]
+
+	def _index(self, key: Any):
+		rect = self.rects[key]
+		bounds = (rect.x, rect.y, rect.w, rect.h)
+
+		if key in self.indexed:
+			if self.indexed[key][0] == bounds:
+				return None
+
+			self._unindex(key)
+
+		cells = self._cellsFor(rect)
+
+		for cell in cells:
+			self.cells.setdefault(cell, []).append(key)
+
+		self.indexed[key] = (bounds, cells)
+
+	def _unindex(self, key: Any):
+		if not key in self.indexed:
+			return None
+
+		for cell in self.indexed.pop(key)[1]:
+			bucket = self.cells[cell]
+			bucket.remove(key)
+
+			if not bucket:
+				del self.cells[cell]
+
+	# keys whose rect contains the point
+	def query(self, point: tuple[int, int]) -> list[Any]:
+		if self.dirty:
+			self.sync()
+
+		x, y = point
+		bucket = self.cells.get((int(x) // self.cellSize, int(y) // self.cellSize))
+
+		if bucket is None:
+			return []
+
+		return [key for key in bucket if self.rects[key].collidepoint(x, y)]
@@ -0,0 +1,198 @@
+from __future__ import annotations
+from typing import Any
+import dis
+from pg_extended.Core.Base.DynamicValue import DynamicValue
+from pg_extended.Core.Base.AnimatedValue import AnimatedValue
+from pg_extended.Core.Base.AnimatedVector import AnimatedVector, AnimatedChannel
+from pg_extended.Core.Base.DimensionStore import StoreDimension
+from pg_extended.Core.Composites.RectArea import RectArea
+from pg_extended.Core.Composites.CircleArea import CircleArea
+
+VAR_LOAD_OPS = ('LOAD_FAST', 'LOAD_DEREF', 'LOAD_GLOBAL', 'LOAD_NAME', 'LOAD_CLOSURE', 'LOAD_FAST_CHECK')
+ATTR_LOAD_OPS = ('LOAD_ATTR', 'LOAD_METHOD')
+
+# dependency graph over DynamicValues, AnimatedValues and the individual dimensions of RectAreas / CircleAreas.
+# nodes are the value objects themselves and (area, 'x') style pairs, an edge points from a node to what it reads.
+# lambdas are inspected through their args, closure cells and bytecode (`section.width` -> (section, 'width'))
+class ValueGraph:
+	def __init__(self, labels: dict[int, str] | None = None):
+		# id(area) -> readable name used in cycle reports
+		self.labels = labels or {}
+
+		self.nodes: dict[Any, Any] = {}
+		self.edges: dict[Any, list] = {}
+
+	@staticmethod
+	def key(node: Any) -> Any:
+		if isinstance(node, tuple):
+			return (id(node[0]), node[1])
+
+		return id(node)
+
+	def addArea(self, area: RectArea | CircleArea):
+		for attr in area.dimensions:
+			self.addNode((area, attr))
+
+	def addNode(self, node: Any):
+		stack = [node]
+
+		while stack:
+			current = stack.pop()
+			key = ValueGraph.key(current)
+
+			if key in self.nodes:
+				continue
+
+			self.nodes[key] = current
+			self.edges[key] = ValueGraph.dependenciesOf(current)
+
+			stack.extend(self.edges[key])
+
+	# topological order of every node added so far, dependencies first. raises ValueError on cycles
+	def order(self) -> list:
+		state: dict[Any, int] = {}
+		result = []
+
+		for root in self.nodes:
+			if root in state:
+				continue
+
+			path = [root]
+			iterators = [iter(self.edges[root])]
+			state[root] = 1
+
+			while iterators:
+				dependency = next(iterators[-1], None)
+
+				if dependency is None:
+					finished = path.pop()
+					iterators.pop()
+					state[finished] = 2
+					result.append(self.nodes[finished])
+					continue
+
+				key = ValueGraph.key(dependency)
+
+				if state.get(key) == 1:
+					cycle = path[path.index(key):] + [key]
+					raise ValueError(f'Dependency cycle detected: {" -> ".join(self.describe(self.nodes[k]) for k in cycle)}')
+
+				if key in state:
+					continue
+
+				state[key] = 1
+				path.append(key)
+				iterators.append(iter(self.edges[key]))
+
+		return result
+
+	def describe(self, node: Any) -> str:
+		if isinstance(node, tuple):
+			area, attr = node
+			return f'{self.labels.get(id(area), type(area).__name__)}.{attr}'
+
+		if isinstance(node, AnimatedValue):
+			return f'{type(node).__name__}({node.values!r})'
+
+		if isinstance(node, AnimatedChannel):
+			return f'{self.describe(node.vector)}[{node.index}]'
+
+		return f'DynamicValue({node.reference!r}{", " + repr(node.lookup) if node.lookup else ""})'
+
+	@staticmethod
+	def dependenciesOf(node: Any) -> list:
+		if isinstance(node, tuple):
+			area, attr = node
+			dimension = area.dimensions.get(attr)
+
+			return [dimension] if isinstance(dimension, (DynamicValue, AnimatedValue)) else []
+
+		if isinstance(node, AnimatedVector):
+			return [channel for vector in node.values for channel in vector if isinstance(channel, (DynamicValue, AnimatedValue))]
+
+		if isinstance(node, AnimatedValue):
+			return [value for value in node.values if isinstance(value, (DynamicValue, AnimatedValue))]
+
+		if isinstance(node, AnimatedChannel):
+			return [node.vector]
+
+		if isinstance(node, StoreDimension):
+			dependency = ValueGraph.asNode(node.source())
+
+			return [dependency] if dependency is not None else []
+
+		if node.dependsOn is not None:
+			dependencies = node.dependsOn
+		else:
+			method = node._resolveRaw.__func__
+
+			if method in (DynamicValue._CV, DynamicValue._CVPer):
+				dependencies = [node.reference]
+			elif method in (DynamicValue._objLookup, DynamicValue._objLookupPer):
+				dependencies = [(node.reference, node.lookup)]
+			elif method in (DynamicValue._expression, DynamicValue._expressionPer):
+				dependencies = node.reference.dependencies()
+			elif method in (DynamicValue._call, DynamicValue._callPer, DynamicValue._callArgs, DynamicValue._callArgsPer):
+				dependencies = ValueGraph.callableDependencies(node.reference, node.args)
+			else:
+				dependencies = []
+
+		return [dependency for dependency in map(ValueGraph.asNode, dependencies) if dependency is not None]
+
+	# maps DynamicValue / AnimatedValue / (object, attribute) dependencies to graph nodes, drops anything else
+	@staticmethod
+	def asNode(dependency: Any) -> Any:
+		if isinstance(dependency, (DynamicValue, AnimatedValue)):
+			return dependency
+
+		if isinstance(dependency, tuple) and len(dependency) == 2:
+			obj, attr = dependency
+
+			if isinstance(obj, (RectArea, CircleArea)) and attr in obj.dimensions:
+				return (obj, attr)
+
+			if isinstance(obj, (DynamicValue, AnimatedValue)) and attr == 'value':
+				return obj
+
+		return None
+
+	# finds `name.attr` reads in a function's bytecode where name is an argument, closure variable, global or bound self
+	@staticmethod
+	def callableDependencies(func: Any, args: dict[str, Any] | None = None) -> list:
+		scope: dict[str, Any] = {}
+
+		if hasattr(func, '__self__') and hasattr(func, '__func__'):
+			scope['self'] = func.__self__
+			func = func.__func__
+
+		code = getattr(func, '__code__', None)
+
+		if code is None:
+			return []
+
+		scope.update(getattr(func, '__globals__', {}))
+
+		for name, cell in zip(code.co_freevars, func.__closure__ or ()):
+			try:
+				scope[name] = cell.cell_contents
+			except ValueError:
+				pass
+
+		scope.update(args or {})
+
+		dependencies = []
+		previous = None
+
+		for instruction in dis.get_instructions(func):
+			if instruction.opname in ATTR_LOAD_OPS and previous is not None:
+				dependencies.append((scope.get(previous), instruction.argval))
+
+			if instruction.opname in VAR_LOAD_OPS and isinstance(instruction.argval, str):
+				previous = instruction.argval
+
+				if isinstance(scope.get(previous), (DynamicValue, AnimatedValue)):
+					dependencies.append(scope[previous])
+			else:
+				previous = None
+
+		return dependencies
@@ -1,2 +1,4 @@
 from pg_extended.Core.Composites.RectArea import RectArea
 from pg_extended.Core.Composites.CircleArea import CircleArea
+from pg_extended.Core.Composites.ValueGraph import ValueGraph
+from pg_extended.Core.Composites.SpatialGrid import SpatialGrid, GridWatcher
@@ -1,7 +1,5 @@
 from pg_extended.Core import Composites
 from pg_extended.Core import Base
-from pg_extended.Core import Renderer
 
 from pg_extended.Core.Composites import *
 from pg_extended.Core.Base import *
-from pg_extended.Core.Renderer import *
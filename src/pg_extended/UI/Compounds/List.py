@@ -18,12 +18,19 @@ class List:
 		for i in range(length):
 			newElement = CopyElement.copyElement(listElement)
 
+			# each row reads the one above it, dependsOn lets the system order updates accordingly
+			if i > 0:
+				prevArea = self.elements[i - 1].section if hasattr(self.elements[i - 1], 'section') else self.elements[i - 1]
+				dependsOn = [(prevArea, 'y'), (prevArea, 'height'), self.spacing]
+			else:
+				dependsOn = [self.listPos['y']]
+
 			if hasattr(newElement, 'section'):
 				newElement.section.dimensions['x'] = self.listPos['x']
-				newElement.section.dimensions['y'] = DynamicValue(self.getElementY, args={'index': i})
+				newElement.section.dimensions['y'] = DynamicValue(self.getElementY, args={'index': i}, dependsOn=dependsOn)
 			elif hasattr(newElement, 'dimensions'):
 				newElement.dimensions['x'] = self.listPos['x']
-				newElement.dimensions['y'] = DynamicValue(self.getElementY, args={'index': i})
+				newElement.dimensions['y'] = DynamicValue(self.getElementY, args={'index': i}, dependsOn=dependsOn)
 
 			self.elements.append(newElement)
 
@@ -25,24 +25,36 @@ class CopyElement:
 
 	@staticmethod
 	def copySection(section: Section) -> Section:
-		return Section(
+		element = Section(
 			copy(section.dimensions),
-			section.background,
+			section.backgroundAnimation or section.background,
 			section.borderRadius,
 			section.backgroundSizeType,
 			section.backgroundPosition,
-			section.backgroundSizePercent
+			section.backgroundSizePercent,
+			section.nineSliceInsets
 		)
 
+		element.nineSliceTile = section.nineSliceTile
+		element.asyncBackground = section.asyncBackground
+		element.backgroundMipmap = section.backgroundMipmap
+
+		return element
+
 	@staticmethod
 	def copyCircle(circle: Circle) -> Circle:
-		return Circle(
+		element = Circle(
 			copy(circle.dimensions),
 			circle.background,
 			circle.backgroundSizeType,
 			circle.backgroundSizePercent
 		)
 
+		element.asyncBackground = circle.asyncBackground
+		element.backgroundMipmap = circle.backgroundMipmap
+
+		return element
+
 	@staticmethod
 	def copyTextBox(textBox: TextBox) -> TextBox:
 		element = TextBox(
@@ -50,7 +62,8 @@ class CopyElement:
 			textBox.text,
 			textBox.fontPath,
 			textBox.textColor,
-			textBox.fontSize
+			textBox.fontSize,
+			textBox.renderMode
 		)
 
 		element.drawSectionDefault = textBox.drawSectionDefault
@@ -58,12 +71,18 @@ class CopyElement:
 		element.alignTextVertical = textBox.alignTextVertical
 		element.paddingLeft = textBox.paddingLeft
 		element.paddingRight = textBox.paddingRight
+		element.multiline = textBox.multiline
+		element.wrap = textBox.wrap
+		element.lineSpacing = textBox.lineSpacing
 		element.active = textBox.active
 		element.activeDraw = textBox.activeDraw
 		element.activeUpdate = textBox.activeUpdate
 		element.lazyUpdate = textBox.lazyUpdate
 		element.lazyUpdateOverride = textBox.lazyUpdateOverride
 
+		# lays the text out again with the copied settings
+		element.update()
+
 		return element
 
 	@staticmethod
@@ -8,6 +8,9 @@ from pg_extended.UI.Elements.Section import Section
 from pg_extended.UI.Elements.TextBox import TextBox
 
 class Button:
+	# event types checkEvent() reacts to, System only routes these to it
+	HANDLED_EVENTS = (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP)
+
 	def __init__(self, textBox: TextBox, callback: CallbackSet = None, border: int = 0, borderCol: Background = None, pressedBG: Background = None, pressedBorderBG: Background = None):
 		self.textBox = textBox
 		self.callback = callback
@@ -2,22 +2,36 @@ from math import sqrt
 import pygame as pg
 from pg_extended.Types import Background
 from pg_extended.Util import ImgManipulation
-from pg_extended.Core import DynamicValue, CircleArea
+from pg_extended.Core import DynamicValue, CircleArea, BackgroundJob
 
 VALID_SIZE_TYPES = ('fit', 'fill', 'squish', 'none')
 
 type NumValue = DynamicValue | int | float
 
 class Circle(CircleArea):
+	__slots__ = (
+		'background', 'backgroundSizeType', 'backgroundSizePercent', 'drawImage', 'backgroundWidth', 'backgroundHeight', 'renderKey', 'asyncBackground', 'backgroundJob', 'backgroundMipmap',
+		'active', 'activeDraw', 'activeUpdate', 'lazyUpdate', 'lazyUpdateOverride'
+	)
+
+	sqrt2 = sqrt(2)
+
 	def __init__(self, dimensions: dict[str, NumValue], background: Background, backgroundSizeType: str | None = 'fit', backgroundSizePercent: int | None = 100):
 		self.background = background
 		self.backgroundSizeType = backgroundSizeType
 		self.backgroundSizePercent = backgroundSizePercent
 
-		self.sqrt2 = sqrt(2)
 		self.drawImage = None
 		self.backgroundWidth = 0
 		self.backgroundHeight = 0
+		self.renderKey = None
+
+		# smoothscaled image backgrounds are processed on a worker thread, a nearest neighbour scaled version is drawn meanwhile
+		self.asyncBackground = False
+		self.backgroundJob: BackgroundJob | None = None
+		# smoothscales image backgrounds from the nearest larger level of a shared Mipmap instead of the full image
+		self.backgroundMipmap = True
+
 		self.active = True
 		self.activeDraw = True
 		self.activeUpdate = True
@@ -31,22 +45,56 @@ class Circle(CircleArea):
 
 		self.update()
 
+	# the background scaling as a pure function, safe to run on a worker thread
+	@staticmethod
+	def renderBackground(image: pg.Surface, radius: float, sizeType: str, sizePercent: int, smoothscale: bool = True, mipmap: bool = False) -> pg.Surface:
+		if sizeType == 'fit':
+			return ImgManipulation.fit(image, (radius * Circle.sqrt2, radius * Circle.sqrt2), smoothscale, sizePercent, mipmap)
+		elif sizeType == 'fill':
+			return ImgManipulation.fill(image, (radius * 2, radius * 2), smoothscale, sizePercent, mipmap)
+
+		return ImgManipulation.squish(image, (radius * 2, radius * 2), smoothscale, sizePercent, mipmap)
+
+	def setDrawImage(self, image: pg.Surface):
+		self.drawImage = image
+		self.backgroundWidth = image.get_width()
+		self.backgroundHeight = image.get_height()
+
+	# swaps a finished background in unless the radius or background changed while it was processed
+	def applyBackground(self, key: tuple, result: pg.Surface):
+		if key == (self.background, self.radius, self.backgroundSizeType, self.backgroundSizePercent):
+			self.setDrawImage(result)
+
 	def update(self):
 		if not (self.active and self.activeUpdate):
 			return None
 
 		super().update()
 
-		if isinstance(self.background, pg.Surface):
-			if self.backgroundSizeType == 'fit':
-				self.drawImage = ImgManipulation.fit(self.background, (self.radius * self.sqrt2, self.radius * self.sqrt2), self.backgroundSizePercent)
-			elif self.backgroundSizeType == 'fill':
-				self.drawImage = ImgManipulation.fill(self.background, (self.radius * 2, self.radius * 2), self.backgroundSizePercent)
-			else:
-				self.drawImage = ImgManipulation.squish(self.background, (self.radius * 2, self.radius * 2), self.backgroundSizePercent)
+		# drawImage is positioned at draw time, so only a new radius or background needs a new one
+		background = self.background if isinstance(self.background, pg.Surface) else tuple(self.background)
+		renderKey = (background, self.backgroundSizeType, self.backgroundSizePercent, self.backgroundMipmap)
+
+		if not self.resized and renderKey == self.renderKey:
+			return None
+
+		self.renderKey = renderKey
+
+		if isinstance(self.background, pg.Surface) and self.asyncBackground:
+			self.setDrawImage(self.renderBackground(self.background, self.radius, self.backgroundSizeType, self.backgroundSizePercent, False))
+
+			if self.backgroundJob is None:
+				self.backgroundJob = BackgroundJob(self.applyBackground)
 
-			self.backgroundWidth = self.drawImage.get_width()
-			self.backgroundHeight = self.drawImage.get_height()
+			self.backgroundJob.request((self.background, self.radius, self.backgroundSizeType, self.backgroundSizePercent), self.renderBackground, {
+				'image': self.background,
+				'radius': self.radius,
+				'sizeType': self.backgroundSizeType,
+				'sizePercent': self.backgroundSizePercent,
+				'mipmap': self.backgroundMipmap
+			})
+		elif isinstance(self.background, pg.Surface):
+			self.setDrawImage(self.renderBackground(self.background, self.radius, self.backgroundSizeType, self.backgroundSizePercent, True, self.backgroundMipmap))
 		elif isinstance(self.background, pg.Color) and self.background.a < 255:
 			self.drawImage = pg.Surface((self.radius * 2, self.radius * 2), pg.SRCALPHA)
 
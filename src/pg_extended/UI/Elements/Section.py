@@ -1,15 +1,27 @@
 from typing import Literal
 import pygame as pg
 from pg_extended.Types import Background
-from pg_extended.Util import ImgManipulation
-from pg_extended.Core import DynamicValue, AnimatedValue, RectArea
+from pg_extended.Util import ImgManipulation, SurfaceCache, ShapeCache
+from pg_extended.Core import DynamicValue, AnimatedValue, AnimatedColor, RectArea, BackgroundJob
 
-VALID_SIZE_TYPES = ('fit', 'fill', 'squish', 'none')
+VALID_SIZE_TYPES = ('fit', 'fill', 'squish', 'none', 'nineSlice')
 
 type NumValue = DynamicValue | AnimatedValue | int | float
 
 class Section(RectArea):
-	def __init__(self, dimensions: dict[str, NumValue], background: Background, borderRadius: float | None = 0, backgroundSizeType: str | None = 'fit', backgroundPosition: str | None = 'center', backgroundSizePercent: int | None = 100):
+	__slots__ = (
+		'background', 'midProcessBG', 'drawReady', 'backgroundSizeType', 'backgroundSizePercent', 'backgroundPosition', 'backgroundOffset',
+		'borderRadius', 'backgroundSmoothScale', 'imageX', 'imageY', 'backgroundAnimation', 'renderKey', 'backgroundCache', 'shapeCache', 'nineSliceInsets', 'nineSliceTile', 'nineSlicePieces', 'asyncBackground', 'backgroundJob', 'backgroundMipmap', 'active', 'activeDraw', 'activeUpdate', 'lazyUpdate', 'lazyUpdateOverride'
+	)
+
+	def __init__(self, dimensions: dict[str, NumValue], background: Background | AnimatedColor, borderRadius: float | None = 0, backgroundSizeType: str | None = 'fit', backgroundPosition: str | None = 'center', backgroundSizePercent: int | None = 100, nineSliceInsets: tuple[int, int, int, int] | int | None = None):
+		# an AnimatedColor background is resolved into a plain pg.Color on every update
+		self.backgroundAnimation: AnimatedColor | None = None
+
+		if isinstance(background, AnimatedColor):
+			self.backgroundAnimation = background
+			background = pg.Color(background.value)
+
 		self.background = background
 		self.midProcessBG = None
 		self.drawReady = None
@@ -18,10 +30,35 @@ class Section(RectArea):
 		self.backgroundSizePercent = backgroundSizePercent
 		self.backgroundPosition = backgroundPosition
 		self.backgroundOffset = [0, 0]
+		self.imageX = 0
+		self.imageY = 0
+
+		# background and settings the current drawReady was made from, see needsRaster()
+		self.renderKey = None
 
 		self.borderRadius = borderRadius
 
 		self.backgroundSmoothScale = True
+		# smoothscales image backgrounds from the nearest larger level of a shared Mipmap instead of the full image
+		self.backgroundMipmap = True
+
+		# processed image backgrounds are shared through this cache, None processes every raster again
+		self.backgroundCache: SurfaceCache | None = SurfaceCache.default
+		# colour backgrounds are blitted from pre-rendered shapes, None draws them with pg.draw every frame
+		self.shapeCache: ShapeCache | None = ShapeCache.default
+
+		# 'nineSlice' backgrounds keep their corners at (left, top, right, bottom) source pixels and only stretch the edges
+		# and centre, or tile them with nineSliceTile. the percent, position and radius settings don't apply to them
+		if isinstance(nineSliceInsets, int):
+			nineSliceInsets = (nineSliceInsets,) * 4
+
+		self.nineSliceInsets = nineSliceInsets
+		self.nineSliceTile = False
+		self.nineSlicePieces: list[tuple[pg.Surface, tuple[int, int]]] = []
+
+		# smoothscaled image backgrounds are processed on a worker thread, a nearest neighbour scaled version is drawn meanwhile
+		self.asyncBackground = False
+		self.backgroundJob: BackgroundJob | None = None
 
 		self.active = True
 		self.activeDraw = True
@@ -32,10 +69,36 @@ class Section(RectArea):
 		if not self.backgroundSizeType in VALID_SIZE_TYPES:
 			raise ValueError(f'Invalid \"backgroundSizeType\" value, must be one of the following values: {VALID_SIZE_TYPES}')
 
+		if self.backgroundSizeType == 'nineSlice' and (self.nineSliceInsets is None or len(self.nineSliceInsets) != 4):
+			raise ValueError('A \"nineSlice\" background needs \"nineSliceInsets\" as an int or a (left, top, right, bottom) tuple.')
+
 		super().__init__(dimensions)
 
 		self.update()
 
+	@staticmethod
+	def scaleBackground(image: pg.Surface, size: tuple[float, float], naturalSize: tuple[int, int], sizeType: str, smoothscale: bool, sizePercent: int, mipmap: bool = False) -> pg.Surface:
+		if sizeType == 'fit':
+			return ImgManipulation.fit(image, size, smoothscale, sizePercent, mipmap)
+		elif sizeType == 'fill':
+			return ImgManipulation.fill(image, size, smoothscale, sizePercent, mipmap)
+		elif sizeType == 'squish':
+			return ImgManipulation.squish(image, size, smoothscale, sizePercent, mipmap)
+		elif not sizePercent == 100:
+			return ImgManipulation.fit(image, naturalSize, smoothscale, sizePercent, mipmap)
+
+		return image
+
+	# the whole resize + rounding pipeline as a pure function, safe to run on a worker thread
+	@staticmethod
+	def renderBackground(image: pg.Surface, size: tuple[float, float], sizeType: str, smoothscale: bool, sizePercent: int, borderRadius: float | None, mipmap: bool = False) -> pg.Surface:
+		result = Section.scaleBackground(image, size, image.get_size(), sizeType, smoothscale, sizePercent, mipmap)
+
+		if borderRadius is None or borderRadius <= 0:
+			return result
+
+		return ImgManipulation.roundImage(result, borderRadius)
+
 	def resizeBackground(self, getFrom: Literal['raw', 'mid', 'final'], setTo: Literal['raw', 'mid', 'final']):
 		if not isinstance(self.background, pg.Surface):
 			return None
@@ -47,16 +110,7 @@ class Section(RectArea):
 		else:
 			sourceImage = self.drawReady
 
-		if self.backgroundSizeType == 'fit':
-			result = ImgManipulation.fit(sourceImage, (self.width, self.height), self.backgroundSmoothScale, self.backgroundSizePercent)
-		elif self.backgroundSizeType == 'fill':
-			result = ImgManipulation.fill(sourceImage, (self.width, self.height), self.backgroundSmoothScale, self.backgroundSizePercent)
-		elif self.backgroundSizeType == 'squish':
-			result = ImgManipulation.squish(sourceImage, (self.width, self.height), self.backgroundSmoothScale, self.backgroundSizePercent)
-		elif not self.backgroundSizePercent == 100:
-			result = ImgManipulation.fit(sourceImage, (self.background.get_width(), self.background.get_height()), self.backgroundSmoothScale, self.backgroundSizePercent)
-		else:
-			result = sourceImage
+		result = self.scaleBackground(sourceImage, (self.width, self.height), self.background.get_size(), self.backgroundSizeType, self.backgroundSmoothScale, self.backgroundSizePercent, self.backgroundMipmap and getFrom == 'raw')
 
 		if setTo == 'raw':
 			self.background = result
@@ -123,6 +177,18 @@ class Section(RectArea):
 		if not isinstance(self.background, pg.Color) or self.background.a == 255:
 			return None
 
+		if self.shapeCache is not None:
+			result = self.shapeCache.rect(self.rect.size, self.background, self.borderRadius)
+
+			if setTo == 'raw':
+				self.background = result
+			elif setTo == 'mid':
+				self.midProcessBG = result
+			else:
+				self.drawReady = result
+
+			return None
+
 		if setTo == 'raw':
 			self.background = pg.Surface(self.rect.size, pg.SRCALPHA)
 			pg.draw.rect(self.background, self.background, (0, 0, self.width, self.height), border_radius=self.borderRadius)
@@ -133,19 +199,110 @@ class Section(RectArea):
 			self.drawReady = pg.Surface(self.rect.size, pg.SRCALPHA)
 			pg.draw.rect(self.drawReady, self.background, (0, 0, self.width, self.height), border_radius=self.borderRadius)
 
+	# true when the size, the background or one of the settings it is processed with changed since the last raster
+	def needsRaster(self) -> bool:
+		background = self.background if isinstance(self.background, pg.Surface) else tuple(self.background)
+		renderKey = (background, self.borderRadius, self.backgroundSizeType, self.backgroundSizePercent, self.backgroundSmoothScale, self.backgroundMipmap, self.nineSliceInsets, self.nineSliceTile)
+
+		if self.resized or renderKey != self.renderKey:
+			self.renderKey = renderKey
+			return True
+
+		return False
+
+	# what the processed background is cached under, the size doesn't matter for unscaled images
+	def backgroundCacheKey(self) -> tuple:
+		size = None if self.backgroundSizeType == 'none' else (self.width, self.height)
+
+		return (self.background, size, self.backgroundSizeType, self.backgroundSizePercent, self.borderRadius, self.backgroundSmoothScale, self.backgroundMipmap)
+
+	# resizes and rounds the image background into drawReady, or reuses the result another section or an earlier size produced.
+	# midProcessBG is only kept when the image is processed synchronously
+	def processBackground(self):
+		key = self.backgroundCacheKey()
+
+		if self.backgroundCache is not None:
+			cached = self.backgroundCache.get(key)
+
+			if cached is not None:
+				self.midProcessBG = None
+				self.drawReady = cached
+				return None
+
+		if self.asyncBackground and self.backgroundSmoothScale:
+			return self.processBackgroundAsync(key)
+
+		self.resizeBackground('raw', 'mid')
+		self.applyRadiusToBackground('mid', 'final')
+
+		# an untouched background costs nothing to reuse
+		if self.backgroundCache is not None and not self.drawReady is self.background:
+			self.backgroundCache.put(key, self.drawReady)
+
+	def processBackgroundAsync(self, key: tuple):
+		size = (self.width, self.height)
+
+		self.midProcessBG = None
+		# nearest neighbour scaled and left square until the job is done, rounding allocates per pixel alpha surfaces
+		self.drawReady = self.scaleBackground(self.background, size, self.background.get_size(), self.backgroundSizeType, False, self.backgroundSizePercent)
+
+		if self.backgroundJob is None:
+			self.backgroundJob = BackgroundJob(self.applyBackground)
+
+		self.backgroundJob.request(key, self.renderBackground, {
+			'image': self.background,
+			'size': size,
+			'sizeType': self.backgroundSizeType,
+			'smoothscale': True,
+			'sizePercent': self.backgroundSizePercent,
+			'borderRadius': self.borderRadius,
+			'mipmap': self.backgroundMipmap
+		})
+
+	# swaps a finished background in, results for a size or background the section has since moved on from are only cached
+	def applyBackground(self, key: tuple, result: pg.Surface):
+		if self.backgroundCache is not None and not result is key[0]:
+			self.backgroundCache.put(key, result)
+
+		if isinstance(self.background, pg.Surface) and key == self.backgroundCacheKey():
+			self.drawReady = result
+			self.setBackgroundPos('final')
+
+	# forces the next update() to process the background again, e.g. after drawing onto the background surface
+	def invalidateBackground(self):
+		self.renderKey = None
+
+		if self.backgroundCache is not None and isinstance(self.background, pg.Surface):
+			background = self.background
+			self.backgroundCache.discardWhere(lambda key: key[0] is background)
+
 	def update(self):
 		if not (self.active and self.activeUpdate):
 			return None
 
 		super().update()
 
-		if isinstance(self.background, pg.Surface):
-			self.resizeBackground('raw', 'mid')
-			self.applyRadiusToBackground('mid', 'final')
+		if self.backgroundAnimation is not None:
+			self.backgroundAnimation.resolveValue()
+			self.background = pg.Color(self.backgroundAnimation.value)
+
+		# a pure position change only moves the already processed image
+		if isinstance(self.background, pg.Surface) and self.backgroundSizeType == 'nineSlice':
+			if self.needsRaster():
+				self.nineSlicePieces = ImgManipulation.nineSlice(self.background, self.rect.size, self.nineSliceInsets, self.backgroundSmoothScale, self.nineSliceTile)
+
+			self.imageX = self.rect.x + self.backgroundOffset[0]
+			self.imageY = self.rect.y + self.backgroundOffset[1]
+
+		elif isinstance(self.background, pg.Surface):
+			if self.needsRaster():
+				self.processBackground()
+
 			self.setBackgroundPos('final')
 
 		elif isinstance(self.background, pg.Color) and self.background.a < 255:
-			self.createTransparentSurface('final')
+			if self.needsRaster():
+				self.createTransparentSurface('final')
 
 		elif isinstance(self.background, pg.Color):
 			self.drawReady = self.background
@@ -154,10 +311,32 @@ class Section(RectArea):
 		if not (self.active and self.activeDraw):
 			return None
 
-		if isinstance(self.background, pg.Surface):
+		if isinstance(self.background, pg.Surface) and self.backgroundSizeType == 'nineSlice':
+			x, y = self.imageX, self.imageY
+			surface.blits([(piece, (x + dx, y + dy)) for piece, (dx, dy) in self.nineSlicePieces], False)
+		elif isinstance(self.background, pg.Surface):
 			surface.blit(self.drawReady, (self.imageX, self.imageY))
 		elif isinstance(self.background, pg.Color):
 			if self.background.a < 255:
 				surface.blit(self.drawReady, self.rect.topleft)
+			elif self.shapeCache is not None and self.borderRadius is not None and self.borderRadius > 0:
+				surface.blit(self.shapeCache.rect(self.rect.size, self.background, self.borderRadius), self.rect.topleft)
 			else:
 				pg.draw.rect(surface, self.background, self.rect, border_radius=self.borderRadius)
+
+	# draws a border ring around the section, used by elements with a border. a colour background and its border
+	# are blitted as one pre-rendered shape when borderRect is the section rect grown by border on every side
+	def drawWithBorder(self, surface: pg.Surface, borderRect: pg.Rect, border: int, borderColor: pg.Color):
+		if border <= 0:
+			return self.draw(surface)
+
+		if (
+			self.shapeCache is not None and self.active and self.activeDraw and isinstance(self.background, pg.Color)
+			and borderRect == self.rect.inflate(border * 2, border * 2)
+		):
+			surface.blit(self.shapeCache.rect(borderRect.size, self.background, self.borderRadius, border, borderColor), borderRect.topleft)
+			return None
+
+		pg.draw.rect(surface, borderColor, borderRect, border_radius = self.borderRadius)
+
+		self.draw(surface)
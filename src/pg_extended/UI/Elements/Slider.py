@@ -1,11 +1,19 @@
 import pygame as pg
 from pg_extended.Types import Background
 from pg_extended.Util import Misc
-from pg_extended.Core import DynamicValue, CallbackSet
+from pg_extended.Core import DynamicValue, CallbackSet, triggerID
 from pg_extended.UI.Elements.Section import Section
 from pg_extended.UI.Elements.Circle import Circle
 
+MOUSE_DOWN = triggerID('mouseDown')
+MOUSE_UP = triggerID('mouseUp')
+MOUSE_DRAG = triggerID('mouseDrag')
+SCROLL = triggerID('scroll')
+
 class Slider():
+	# event types checkEvent() reacts to, System only routes these to it
+	HANDLED_EVENTS = (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP, pg.MOUSEMOTION, pg.MOUSEWHEEL)
+
 	def __init__(
 		self,
 		orientation: str,
@@ -27,6 +35,9 @@ class Slider():
 		self.callback = callback
 		self.hoverToScroll = hoverToScroll
 
+		# reused for every callback, mouseDrag fires on each motion event
+		self.callbackArgs = {'value': None}
+
 		self.value = self.valueRange[0]
 		self.pressed = False
 		self.active = True
@@ -73,11 +84,25 @@ class Slider():
 			elif returnValue > valueMappingCoords[1]: return valueMappingCoords[1]
 			else: return returnValue
 
+		# getDragElementPos reads these through the slider, listed so the value graph orders the drag element's
+		# position after them (a circle's x after its own radius)
+		def dragElementPosDependencies(axis: str, elementType: str) -> list:
+			start, length = ('x', 'width') if axis == 'x' else ('y', 'height')
+			size = 'radius' if elementType == 'circle' else length
+
+			return [(self.section, start), (self.section, length), (self.dragElement, size)]
+
+		# the drag element's position is replaced below, its given one stops listening to what it reads
+		for key in ('x', 'y'):
+			if isinstance(self.dragElement.dimensions[key], DynamicValue):
+				self.dragElement.dimensions[key].release()
+
 		if self.dragElementType == 'circle':
 			if self.orientation == 'horizontal':
 				self.dragElement.dimensions['x'] = DynamicValue(
 					getDragElementPos,
-					args={'axis': 'x', 'elementType': 'circle', 'slider': self}
+					args={'axis': 'x', 'elementType': 'circle', 'slider': self},
+					dependsOn=dragElementPosDependencies('x', 'circle')
 				)
 
 				self.dragElement.dimensions['y'] = DynamicValue(
@@ -93,14 +118,16 @@ class Slider():
 
 				self.dragElement.dimensions['y'] = DynamicValue(
 					getDragElementPos,
-					args={'axis': 'y', 'elementType': 'circle', 'slider': self}
+					args={'axis': 'y', 'elementType': 'circle', 'slider': self},
+					dependsOn=dragElementPosDependencies('y', 'circle')
 				)
 
 		else:
 			if self.orientation == 'horizontal':
 				self.dragElement.dimensions['x'] = DynamicValue(
 					getDragElementPos,
-					args={'axis': 'x', 'elementType': 'section', 'slider': self}
+					args={'axis': 'x', 'elementType': 'section', 'slider': self},
+					dependsOn=dragElementPosDependencies('x', 'section')
 				)
 
 				self.dragElement.dimensions['y'] = DynamicValue(
@@ -116,7 +143,8 @@ class Slider():
 
 				self.dragElement.dimensions['y'] = DynamicValue(
 					getDragElementPos,
-					args={'axis': 'y', 'elementType': 'section', 'slider': self}
+					args={'axis': 'y', 'elementType': 'section', 'slider': self},
+					dependsOn=dragElementPosDependencies('y', 'section')
 				)
 
 		if self.dragElementType == 'section':
@@ -174,6 +202,17 @@ class Slider():
 		self.mapPosition.resolveValue()
 		self.filledSlider.update()
 
+	# the slider value changed mid-frame, drop the cached positions that were resolved from the old value
+	def _invalidatePosition(self):
+		if self.orientation == 'horizontal':
+			self.dragElement.dimensions['x'].invalidate()
+			self.filledSlider.dimensions['width'].invalidate()
+		else:
+			self.dragElement.dimensions['y'].invalidate()
+			self.filledSlider.dimensions['height'].invalidate()
+
+		self.mapPosition.invalidate()
+
 	def updateValue(self):
 		if not self.active:
 			return None
@@ -196,6 +235,8 @@ class Slider():
 
 		self.value = Misc.mapRange(relativePos, start, end, self.valueRange[0], self.valueRange[1])
 
+		self._invalidatePosition()
+
 		self.dragElement.update()
 		self.mapPosition.resolveValue()
 		self.filledSlider.update()
@@ -208,9 +249,10 @@ class Slider():
 		self.filledSlider.draw(surface)
 		self.dragElement.draw(surface)
 
-	def handleCallback(self, trigger):
+	def handleCallback(self, trigger: str | int):
 		if self.callback is not None:
-			self.callback.call(trigger, {'value': self.value})
+			self.callbackArgs['value'] = self.value
+			self.callback.call(trigger, self.callbackArgs)
 
 	def checkEvent(self, event: pg.Event) -> bool:
 		if not (self.active and self.activeEvents):
@@ -221,13 +263,13 @@ class Slider():
 
 			self.updateValue()
 
-			self.handleCallback('mouseDown')
+			self.handleCallback(MOUSE_DOWN)
 
 		if event.type == pg.MOUSEBUTTONUP and event.button == 1:
 			if self.pressed:
 				self.pressed = False
 
-				self.handleCallback('mouseUp')
+				self.handleCallback(MOUSE_UP)
 
 				return True
 
@@ -236,7 +278,7 @@ class Slider():
 		if self.pressed and event.type == pg.MOUSEMOTION:
 			self.updateValue()
 
-			self.handleCallback('mouseDrag')
+			self.handleCallback(MOUSE_DRAG)
 
 			return True
 
@@ -265,9 +307,11 @@ class Slider():
 				if self.value != updatedValue:
 					self.value = updatedValue
 
+					self._invalidatePosition()
+
 					self.update()
 
-					self.handleCallback('scroll')
+					self.handleCallback(SCROLL)
 
 					return True
 
@@ -1,6 +1,6 @@
-import os
 import pygame as pg
 from pg_extended.Core import DynamicValue
+from pg_extended.Util import FontRegistry, TextCache, GlyphAtlas, TextLayout
 from pg_extended.UI.Elements.Section import Section
 
 ALIGNMENT_MAP = {
@@ -15,13 +15,18 @@ ALIGNMENT_MAP = {
 	'right-bottom': 'bottomright',
 }
 
+# 'surface' renders the whole string into one surface, 'glyphs' blits it glyph by glyph from a shared GlyphAtlas,
+# which avoids rendering / allocating anything for text that changes every frame
+VALID_RENDER_MODES = ('surface', 'glyphs')
+
 class TextBox:
-	def __init__(self, section: Section, text: str, fontPath: str, textColor: pg.Color, fontSize: DynamicValue = None):
+	def __init__(self, section: Section, text: str, fontPath: str, textColor: pg.Color, fontSize: DynamicValue = None, renderMode: str = 'surface'):
 		self.section = section
 		self.text = text
 		self.fontPath = fontPath
-		self.fontSize = fontSize
+		self.fontSize = DynamicValue.wrap(fontSize)
 		self.textColor = textColor
+		self.renderMode = renderMode
 
 		self.alignTextHorizontal = 'center'
 		self.alignTextVertical = 'center'
@@ -38,6 +43,37 @@ class TextBox:
 		self.textSurface: pg.Surface = None
 		self.textRect: pg.Rect = None
 
+		# fonts are looked up and shared through this registry instead of being loaded per text box
+		self.fontRegistry: FontRegistry = FontRegistry.default
+		self.font: pg.font.Font = None
+		# rendered strings are shared through this cache, None renders every change again
+		self.textCache: TextCache | None = TextCache.default
+
+		# renderMode 'glyphs' state, see GlyphAtlas
+		self.glyphAtlas: GlyphAtlas | None = None
+		self.glyphSequence: list[tuple[pg.Surface, tuple[int, int]]] = []
+		self.glyphOrigin = None
+		self.textSize = (0, 0)
+
+		# multiline splits the text at line breaks and, with wrap, at the section width minus the padding. lines are aligned
+		# inside textRect by alignTextHorizontal and lines outside the section aren't drawn. renderMode doesn't apply
+		self.multiline = False
+		self.wrap = True
+		self.lineSpacing = 1.0
+		self.lines: list[str] = []
+		self.lineWidths: list[int] = []
+		self.lineHeight = 0
+		self.layoutKey = None
+		# rendered lines by content, lines a re-flow didn't change keep their surface
+		self.lineSurfaces: dict[str, pg.Surface] = {}
+
+		if not self.renderMode in VALID_RENDER_MODES:
+			raise ValueError(f'Invalid \"renderMode\" value, must be one of the following values: {VALID_RENDER_MODES}')
+
+		# what the current font / textSurface were made from, a moved section only re-aligns textRect
+		self.fontKey = None
+		self.renderKey = None
+
 		self.update()
 
 	def update(self):
@@ -52,28 +88,133 @@ class TextBox:
 		else:
 			fontSize = .6 * self.section.height
 
-		if os.path.exists(self.fontPath):
-			self.font = pg.font.Font(self.fontPath, int(fontSize))
-		else:
-			matched = pg.font.match_font(self.fontPath)
-			if matched:
-				self.font = pg.font.Font(matched, int(fontSize))
-			else:
-				self.font = pg.font.Font(None, int(fontSize))
+		fontKey = (self.fontPath, int(fontSize))
+
+		if fontKey != self.fontKey:
+			self.fontKey = fontKey
+
+			self.font = self.fontRegistry.get(self.fontPath, int(fontSize))
 
 		self.paddingLeftStr = ' ' * self.paddingLeft
 		self.paddingRightStr = ' ' * self.paddingRight
+
+		if self.multiline:
+			return self.updateLines()
+
 		renderText = f'{self.paddingLeftStr}{self.text}{self.paddingRightStr}'
 
-		self.textSurface = self.font.render(renderText, True, self.textColor)
+		renderKey = (renderText, tuple(self.textColor), self.font, self.renderMode)
+
+		if renderKey != self.renderKey:
+			self.renderKey = renderKey
+			self.glyphOrigin = None
+
+			if self.renderMode == 'glyphs':
+				self.glyphAtlas = GlyphAtlas.of(self.font, self.textColor)
+				self.textSurface = None
+				self.textSize = self.glyphAtlas.size(renderText)
+			elif self.textCache is not None:
+				self.textSurface = self.textCache.render(self.font, renderText, self.textColor)
+			else:
+				self.textSurface = self.font.render(renderText, True, self.textColor)
 
-		if self.textColor.a < 255:
-			self.textSurface.set_alpha(self.textColor.a)
+				if self.textColor.a < 255:
+					self.textSurface.set_alpha(self.textColor.a)
 
 		key = f'{self.alignTextHorizontal}-{self.alignTextVertical}'
 		pos_attr = ALIGNMENT_MAP[key]
 
-		self.textRect = self.textSurface.get_rect(**{pos_attr: getattr(self.section.rect, pos_attr)})
+		if self.renderMode == 'glyphs':
+			self.textRect = pg.Rect((0, 0), self.textSize)
+			setattr(self.textRect, pos_attr, getattr(self.section.rect, pos_attr))
+
+			if self.textRect.topleft != self.glyphOrigin:
+				self.glyphOrigin = self.textRect.topleft
+				self.glyphSequence = self.glyphAtlas.layout(renderText, *self.glyphOrigin)
+		else:
+			self.textRect = self.textSurface.get_rect(**{pos_attr: getattr(self.section.rect, pos_attr)})
+
+	def updateLines(self):
+		layout = TextLayout.of(self.font)
+
+		paddingLeft = layout.spaceWidth * self.paddingLeft
+		paddingRight = layout.spaceWidth * self.paddingRight
+		wrapWidth = max(1, int(self.section.width - paddingLeft - paddingRight)) if self.wrap else None
+
+		layoutKey = (self.text, self.font, wrapWidth)
+
+		if layoutKey != self.layoutKey:
+			self.layoutKey = layoutKey
+
+			self.lines, self.lineWidths = layout.wrap(self.text or '', wrapWidth)
+
+			if len(self.lineSurfaces) > len(self.lines) * 2:
+				current = set(self.lines)
+				self.lineSurfaces = {line: lineSurface for line, lineSurface in self.lineSurfaces.items() if line in current}
+
+		if self.renderKey != (tuple(self.textColor), self.font):
+			self.renderKey = (tuple(self.textColor), self.font)
+			self.lineSurfaces = {}
+
+		self.lineHeight = max(1, round(self.font.get_linesize() * self.lineSpacing))
+
+		width = max(self.lineWidths, default=0) + paddingLeft + paddingRight
+		height = self.lineHeight * len(self.lines)
+
+		pos_attr = ALIGNMENT_MAP[f'{self.alignTextHorizontal}-{self.alignTextVertical}']
+
+		self.textRect = pg.Rect(0, 0, width, height)
+		setattr(self.textRect, pos_attr, getattr(self.section.rect, pos_attr))
+
+	def renderLine(self, line: str) -> pg.Surface:
+		lineSurface = self.lineSurfaces.get(line)
+
+		if lineSurface is None:
+			if self.textCache is not None:
+				lineSurface = self.textCache.render(self.font, line, self.textColor)
+			else:
+				lineSurface = self.font.render(line, True, self.textColor)
+
+				if self.textColor.a < 255:
+					lineSurface.set_alpha(self.textColor.a)
+
+			self.lineSurfaces[line] = lineSurface
+
+		return lineSurface
+
+	# only the lines inside both the section and the surface's clip area are rendered and drawn
+	def drawLines(self, surface: pg.Surface):
+		visible = self.section.rect.clip(surface.get_clip())
+
+		if visible.height <= 0 or not self.lines:
+			return None
+
+		top = self.textRect.top
+		first = max(0, (visible.top - top) // self.lineHeight)
+		last = min(len(self.lines), -(-(visible.bottom - top) // self.lineHeight))
+
+		spaceWidth = TextLayout.of(self.font).spaceWidth
+		left = self.textRect.left + (spaceWidth * self.paddingLeft)
+		right = self.textRect.right - (spaceWidth * self.paddingRight)
+
+		sequence = []
+
+		for i in range(first, last):
+			line = self.lines[i]
+
+			if not line:
+				continue
+
+			if self.alignTextHorizontal == 'left':
+				x = left
+			elif self.alignTextHorizontal == 'right':
+				x = right - self.lineWidths[i]
+			else:
+				x = left + ((right - left - self.lineWidths[i]) // 2)
+
+			sequence.append((self.renderLine(line), (x, top + (i * self.lineHeight))))
+
+		surface.blits(sequence, False)
 
 	def draw(self, surface: pg.Surface, drawSection: bool = None):
 		if not (self.active and self.activeDraw):
@@ -85,4 +226,9 @@ class TextBox:
 		if self.text == '' or self.text is None:
 			return None
 
-		surface.blit(self.textSurface, self.textRect)
+		if self.multiline:
+			self.drawLines(surface)
+		elif self.renderMode == 'glyphs':
+			surface.blits(self.glyphSequence, False)
+		else:
+			surface.blit(self.textSurface, self.textRect)
@@ -1,13 +1,15 @@
-import time
 import pyperclip
 import pygame as pg
-from pg_extended.Core import AnimatedValue, Callback
+from pg_extended.Core import AnimatedValue, AnimationClock, Callback
 from pg_extended.UI.Elements.Section import Section
 from pg_extended.UI.Elements.TextBox import TextBox
 
 LINE_SPLIT_UNICODES = ' \t\u00A0\u2000\u200A\u3000'+',.;:!?\'\"(){}[]/\\|-_\n\r\f\v'
 
 class TextInput:
+	# event types checkEvent() reacts to, System only routes these to it. key events only reach the focused input
+	HANDLED_EVENTS = (pg.MOUSEBUTTONDOWN, pg.KEYDOWN, pg.KEYUP)
+
 	def __init__(
 		self,
 		section: Section,
@@ -45,6 +47,9 @@ class TextInput:
 		self.autoInputInterval = 0.06
 		self.autoInputSpeedIncrease = 0.8
 
+		# time source for the auto input timing, the default animation clock (bound on the first key press) unless replaced
+		self.clock: AnimationClock | None = None
+
 		# things you probably shouldn't touch
 		self.lazyUpdateOverride = False
 		self.inFocus = False
@@ -170,7 +175,11 @@ class TextInput:
 	def _keyEvent(self, event: pg.Event):
 		if event.type == pg.KEYDOWN:
 			self.typing = True
-			self.typingStart = time.perf_counter()
+
+			if self.clock is None:
+				self.clock = AnimationClock.getDefault()
+
+			self.typingStart = self.clock.seconds()
 
 			eventTriggered = False
 
@@ -243,12 +252,12 @@ class TextInput:
 				self.cursorX = self.section.x + (self.section.width - rightPaddingWidth)
 
 		# auto rapid input on key hold
-		if self.typing and (time.perf_counter() - self.typingStart > self.autoInputDelay):
-			if time.perf_counter() - self.lastAutoInputTime > self.dynamicAutoInputInterval:
+		if self.typing and (self.clock.seconds() - self.typingStart > self.autoInputDelay):
+			if self.clock.seconds() - self.lastAutoInputTime > self.dynamicAutoInputInterval:
 				if self.dynamicAutoInputInterval > self.autoInputMinInterval:
 					self.dynamicAutoInputInterval *= self.autoInputSpeedIncrease
 
-				self.lastAutoInputTime = time.perf_counter()
+				self.lastAutoInputTime = self.clock.seconds()
 
 				self.events[self.lastEvent]()
 
@@ -264,12 +273,9 @@ class TextInput:
 			return None
 
 		if self.border > 0:
-			if self.inFocus:
-				pg.draw.rect(surface, self.focusBorderColor, self.borderRect, border_radius = self.section.borderRadius)
-			else:
-				pg.draw.rect(surface, self.borderColor, self.borderRect, border_radius = self.section.borderRadius)
-
-		self.section.draw(surface)
+			self.section.drawWithBorder(surface, self.borderRect, self.border, self.focusBorderColor if self.inFocus else self.borderColor)
+		else:
+			self.section.draw(surface)
 
 		self.textBox.draw(surface)
 
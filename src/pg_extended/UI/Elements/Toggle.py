@@ -3,6 +3,9 @@ from pg_extended.Core import DynamicValue, AnimatedValue, Callback
 from pg_extended.UI.Elements.Section import Section
 
 class Toggle:
+	# event types checkEvent() reacts to, System only routes these to it
+	HANDLED_EVENTS = (pg.MOUSEBUTTONDOWN,)
+
 	def __init__(self, section: Section, indicatorColor: pg.Color, borderColor: pg.Color, borderColorToggled: pg.Color, border: int = 0, callback: Callback = None):
 		self.section = section
 		self.defaultBackground = section.background
@@ -95,15 +98,11 @@ class Toggle:
 		if not (self.active and self.activeDraw):
 			return None
 
-		if self.border > 0:
-			if self.toggled:
-				pg.draw.rect(surface, self.borderColorToggled, self.borderRect, border_radius = self.section.borderRadius)
-			else:
-				pg.draw.rect(surface, self.borderColor, self.borderRect, border_radius = self.section.borderRadius)
+		self.section.drawWithBorder(surface, self.borderRect, self.border, self.borderColorToggled if self.toggled else self.borderColor)
 
-		self.section.draw(surface)
+		innerColor = self.defaultBackground if self.toggled else self.indicatorColor
 
-		if self.toggled:
-			pg.draw.rect(surface, self.defaultBackground, self.innerBox, border_radius = self.section.borderRadius)
+		if self.section.shapeCache is not None and isinstance(innerColor, pg.Color) and innerColor.a == 255 and self.section.borderRadius:
+			surface.blit(self.section.shapeCache.rect(self.innerBox.size, innerColor, self.section.borderRadius), self.innerBox.topleft)
 		else:
-			pg.draw.rect(surface, self.indicatorColor, self.innerBox, border_radius = self.section.borderRadius)
+			pg.draw.rect(surface, innerColor, self.innerBox, border_radius = self.section.borderRadius)
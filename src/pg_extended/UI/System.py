@@ -1,7 +1,16 @@
 import pygame as pg
+from typing import Any
 from pg_extended.Util import Misc
+from pg_extended.Core import DynamicValue, RectArea, CircleArea, ValueGraph, SpatialGrid, DimensionStore, StoreDimension
 from pg_extended.UI.Elements import *
 
+# attributes through which elements hold the areas they lay out
+AREA_ATTRIBUTES = ('section', 'textBox', 'borderSection', 'dragElement', 'filledSlider')
+
+# events routed through the hit index, keyboard events go to the focus owner only
+POINTER_EVENTS = (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP, pg.MOUSEMOTION, pg.MOUSEWHEEL)
+KEY_EVENTS = (pg.KEYDOWN, pg.KEYUP)
+
 class System:
 	def __init__(self, surface: pg.Surface = None, preLoadState: bool = False):
 		self.locked = preLoadState
@@ -24,11 +33,28 @@ class System:
 
 		self.firstDraw = True
 
+		# element ids sorted so that every element updates after the elements it reads, see buildUpdateOrder()
+		self.updateOrder: list[str] | None = None
+
+		# section rects of buttons, toggles, sliders and text inputs, pointer events only reach the ones under the pointer
+		# plus the ones that captured it (pressed / focused), see handleEvents()
+		self.hitIndex = SpatialGrid()
+		self.eventRank: dict[str, int] | None = None
+		self.captured: dict[str, None] = {}
+
+		# event type -> ids of the elements whose HANDLED_EVENTS include it, see getEventRoutes()
+		self.eventRoutes: dict[int, dict[str, None]] | None = None
+		# the text input keyboard events are sent to
+		self.focusOwner: str | None = None
+
 	def addElement(self, element: UIElement, elementID: str):
 		if elementID in self.elements:
 			raise ValueError(f'An element with id: {elementID} already exists, please enter a unique id.')
 
 		self.elements[elementID] = element
+		self.updateOrder = None
+		self.eventRank = None
+		self.eventRoutes = None
 
 		if isinstance(element, Section):
 			self.sections[elementID] = element
@@ -45,6 +71,9 @@ class System:
 		elif isinstance(element, TextInput):
 			self.textInputs[elementID] = element
 
+		if isinstance(element, (Button, Toggle, Slider, TextInput)):
+			self.hitIndex.addArea(elementID, element.section)
+
 	def addElements(self, elements: dict[str, UIElement]):
 		for elementID in elements:
 			self.addElement(elements[elementID], elementID)
@@ -71,6 +100,26 @@ class System:
 			del self.textInputs[elementID]
 
 		del self.elements[elementID]
+		self.updateOrder = None
+
+		# reactive dimensions of the removed element stop listening to the window and other areas, dimensions
+		# moved into a DimensionStore free their entries
+		for area in System.elementAreas(element):
+			for value in list(area.dimensions.values()):
+				if isinstance(value, StoreDimension):
+					value.store.releaseArea(area)
+
+			for value in area.dimensions.values():
+				if isinstance(value, DynamicValue):
+					value.release()
+		self.eventRank = None
+		self.eventRoutes = None
+
+		self.hitIndex.remove(elementID)
+		self.captured.pop(elementID, None)
+
+		if self.focusOwner == elementID:
+			self.focusOwner = None
 
 		return True
 
@@ -84,6 +133,133 @@ class System:
 
 		return elementIDs
 
+	@staticmethod
+	def elementAreas(element: UIElement) -> list[RectArea | CircleArea]:
+		areas = []
+		stack = [element]
+
+		while stack:
+			current = stack.pop()
+
+			if isinstance(current, (RectArea, CircleArea)) and not any(current is area for area in areas):
+				areas.append(current)
+
+			for attr in AREA_ATTRIBUTES:
+				child = getattr(current, attr, None)
+
+				if child is not None:
+					stack.append(child)
+
+		return areas
+
+	# builds the value graph of every element, reports dependency cycles and sorts the elements so that each one
+	# updates after the ones it reads from. areas reading their own dimensions get the order to resolve them in. call it again after swapping dimensions of elements already in the system
+	def buildUpdateOrder(self) -> list[str]:
+		owners: dict[int, str] = {}
+		elementAreas: dict[str, list] = {}
+
+		for elementID in self.elements:
+			elementAreas[elementID] = System.elementAreas(self.elements[elementID])
+
+			for area in elementAreas[elementID]:
+				owners.setdefault(id(area), elementID)
+
+		graph = ValueGraph(owners)
+
+		for elementID in elementAreas:
+			for area in elementAreas[elementID]:
+				graph.addArea(area)
+
+		# dimensions of each area in dependency order, only used by areas that read their own dimensions
+		dimensionOrders: dict[int, list[str]] = {}
+
+		for node in graph.order():
+			if isinstance(node, tuple):
+				dimensionOrders.setdefault(id(node[0]), []).append(node[1])
+
+		# walk each dimension's values until they reach an area owned by another element
+		requires: dict[str, list[str]] = {}
+
+		for elementID in elementAreas:
+			requires[elementID] = []
+
+			for area in elementAreas[elementID]:
+				selfDependent = False
+
+				for attr in area.dimensions:
+					stack = [ValueGraph.key((area, attr))]
+					visited = set(stack)
+
+					while stack:
+						for dependency in graph.edges[stack.pop()]:
+							key = ValueGraph.key(dependency)
+
+							if isinstance(dependency, tuple):
+								if dependency[0] is area:
+									selfDependent = True
+
+								owner = owners.get(id(dependency[0]))
+
+								if owner is not None and owner != elementID:
+									if not owner in requires[elementID]:
+										requires[elementID].append(owner)
+
+									continue
+
+							if not key in visited:
+								visited.add(key)
+								stack.append(key)
+
+				# a circle whose x reads its own radius has to resolve the radius first
+				area.dimensionOrder = tuple(dimensionOrders[id(area)]) if selfDependent else None
+
+		# depth first over the element graph, insertion order breaks ties. elements reading different dimensions of
+		# each other aren't a value cycle, for those the insertion order is kept
+		order = []
+		seen = set()
+
+		for rootID in self.elements:
+			if rootID in seen:
+				continue
+
+			seen.add(rootID)
+			stack = [(rootID, iter(requires[rootID]))]
+
+			while stack:
+				requiredID = next(stack[-1][1], None)
+
+				if requiredID is None:
+					order.append(stack.pop()[0])
+				elif not requiredID in seen:
+					seen.add(requiredID)
+					stack.append((requiredID, iter(requires[requiredID])))
+
+		self.updateOrder = order
+
+		return order
+
+	# moves the percent dimensions of every element into a DimensionStore (the window's, see
+	# Window.initiateActiveSystems()) so a resize resolves them in one vectorized pass. a child can only move after the
+	# dimension it reads did, so this repeats until nothing moves. call it again for elements added afterwards
+	def convertDimensions(self, store: DimensionStore, owner: Any):
+		areas = [area for elementID in self.getUpdateOrder() for area in System.elementAreas(self.elements[elementID])]
+		moved = True
+
+		while moved:
+			moved = False
+
+			for area in areas:
+				if store.convertArea(area, owner):
+					moved = True
+
+		self.updateOrder = None
+
+	def getUpdateOrder(self) -> list[str]:
+		if self.updateOrder is None:
+			self.buildUpdateOrder()
+
+		return self.updateOrder
+
 	def draw(self, elementIDs: list[str] | tuple[str] = None):
 		if self.locked:
 			print('System is currently locked')
@@ -102,7 +278,7 @@ class System:
 			print('System is currently locked')
 			return None
 
-		idList = self.__validateIDs(elementIDs)
+		idList = self.getUpdateOrder() if elementIDs is None else self.__validateIDs(elementIDs)
 
 		for elementID in idList:
 			element = self.elements[elementID]
@@ -115,7 +291,7 @@ class System:
 			print('System is currently locked')
 			return None
 
-		idList = self.__validateIDs(elementIDs)
+		idList = self.getUpdateOrder() if elementIDs is None else self.__validateIDs(elementIDs)
 
 		for elementID in idList:
 			if self.elements[elementID].active:
@@ -128,43 +304,103 @@ class System:
 
 		mousePos = pg.mouse.get_pos()
 
-		changeCursor = None
+		if event.type in POINTER_EVENTS:
+			return self.handlePointerEvent(event, mousePos)
+
+		if event.type in KEY_EVENTS:
+			focusOwner = self.getFocusOwner()
+
+			if focusOwner is not None and self.elements[focusOwner].active:
+				self.elements[focusOwner].checkEvent(event)
+		else:
+			for elementID in self.getEventRoutes().get(event.type, ()):
+				if self.elements[elementID].active:
+					self.elements[elementID].checkEvent(event)
+
+		return self.cursorAt(self.hitIndex.query(mousePos))
+
+	def getEventRoutes(self) -> dict[int, dict[str, None]]:
+		if self.eventRoutes is None:
+			self.eventRoutes = {}
 
-		for buttonID in self.buttons:
-			if self.buttons[buttonID].active:
-				self.buttons[buttonID].checkEvent(event)
+			for elementID in self.getEventRank():
+				for eventType in getattr(self.elements[elementID], 'HANDLED_EVENTS', ()):
+					self.eventRoutes.setdefault(eventType, {})[elementID] = None
 
-				if not changeCursor and self.buttons[buttonID].activeEvents:
-					if self.buttons[buttonID].section.rect.collidepoint(mousePos):
-						changeCursor = 'hand'
+		return self.eventRoutes
 
-		for toggleID in self.toggles:
-			if self.toggles[toggleID].active:
-				self.toggles[toggleID].checkEvent(event)
+	# focus only changes on clicks, which go through handlePointerEvent(). focused inputs are always captured,
+	# so an input focused some other way is found there
+	def getFocusOwner(self) -> str | None:
+		if self.focusOwner is not None and not self.elements[self.focusOwner].inFocus:
+			self.focusOwner = None
 
-				if not changeCursor and self.toggles[toggleID].activeEvents:
-					if self.toggles[toggleID].section.rect.collidepoint(mousePos):
-						changeCursor = 'hand'
+		if self.focusOwner is None:
+			for elementID in self.captured:
+				if getattr(self.elements[elementID], 'inFocus', False):
+					self.focusOwner = elementID
+					break
 
-		for sliderID in self.sliders:
-			if self.sliders[sliderID].active:
-				self.sliders[sliderID].checkEvent(event)
+		return self.focusOwner
 
-				if not changeCursor and self.sliders[sliderID].activeEvents:
-					if self.sliders[sliderID].section.rect.collidepoint(mousePos):
-						changeCursor = 'hand'
+	def cursorAt(self, hits: list[str]) -> str | None:
+		changeCursor = None
+
+		for elementID in hits:
+			element = self.elements[elementID]
 
-		for textInputID in self.textInputs:
-			if self.textInputs[textInputID].active:
-				self.textInputs[textInputID].checkEvent(event)
+			if element.active and element.activeEvents:
+				if not isinstance(element, TextInput):
+					return 'hand'
 
-				if not changeCursor and self.textInputs[textInputID].activeEvents:
-					if self.textInputs[textInputID].section.rect.collidepoint(mousePos):
-						changeCursor = 'ibeam'
+				changeCursor = 'ibeam'
 
 		return changeCursor
 
+	# interactive elements in the order handleEvents() has always visited them: buttons, toggles, sliders, text inputs
+	def getEventRank(self) -> dict[str, int]:
+		if self.eventRank is None:
+			self.eventRank = {elementID: i for i, elementID in enumerate((*self.buttons, *self.toggles, *self.sliders, *self.textInputs))}
+
+		return self.eventRank
+
+	def handlePointerEvent(self, event: pg.Event, mousePos: tuple[int, int]) -> str | None:
+		hits = self.hitIndex.query(mousePos)
+		targets = dict.fromkeys(hits)
+
+		# buttons check event.pos, sliders the current mouse position, the two can differ for queued events
+		if hasattr(event, 'pos') and event.pos != mousePos:
+			targets.update(dict.fromkeys(self.hitIndex.query(event.pos)))
+
+		# pressed buttons / sliders and focused inputs need releases, drags and outside clicks wherever they happen
+		targets.update(self.captured)
+
+		if event.type == pg.MOUSEWHEEL:
+			targets.update(dict.fromkeys(sliderID for sliderID in self.sliders if not self.sliders[sliderID].hoverToScroll))
+
+		rank = self.getEventRank()
+		# e.g. motion only reaches sliders, buttons and inputs under a dragged cursor are skipped
+		subscribers = self.getEventRoutes().get(event.type, {})
+
+		for elementID in sorted((elementID for elementID in targets if elementID in subscribers), key=rank.__getitem__):
+			element = self.elements[elementID]
+
+			if element.active:
+				element.checkEvent(event)
+
+			if getattr(element, 'pressed', False) or getattr(element, 'inFocus', False):
+				self.captured[elementID] = None
+			else:
+				self.captured.pop(elementID, None)
+
+			if getattr(element, 'inFocus', False):
+				self.focusOwner = elementID
+
+		return self.cursorAt(hits)
+
 	def initiate(self, surface: pg.Surface):
 		self.surface = surface
 
 		self.locked = False
+
+		self.buildUpdateOrder()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+import os
+from collections import OrderedDict
+import pygame as pg
+
+# resolves font names / paths once and shares pg.font.Font objects by (resolved path, size), least recently used
+# fonts are dropped past maxFonts. shared fonts must not have their style (bold, italic, ...) changed
+class FontRegistry:
+	# shared registry used by text elements that aren't given one
+	default: FontRegistry = None
+
+	def __init__(self, maxFonts: int = 64):
+		if maxFonts <= 0:
+			raise ValueError('maxFonts must be greater than 0.')
+
+		self.maxFonts = maxFonts
+
+		# font name or path -> font file, None for pygame's default font
+		self.paths: dict[str | None, str | None] = {}
+		self.fonts: OrderedDict[tuple[str | None, int], pg.font.Font] = OrderedDict()
+
+		self.hits = 0
+		self.misses = 0
+
+	def __len__(self) -> int:
+		return len(self.fonts)
+
+	# an existing file is used as is, anything else goes through pg.font.match_font(), which scans the system fonts
+	def resolve(self, name: str | None) -> str | None:
+		if name in self.paths:
+			return self.paths[name]
+
+		if name is None:
+			path = None
+		elif os.path.exists(name):
+			path = name
+		else:
+			path = pg.font.match_font(name) or None
+
+		self.paths[name] = path
+
+		return path
+
+	def get(self, name: str | None, size: int) -> pg.font.Font:
+		key = (self.resolve(name), int(size))
+		font = self.fonts.get(key)
+
+		if font is not None:
+			self.fonts.move_to_end(key)
+			self.hits += 1
+
+			return font
+
+		self.misses += 1
+
+		font = self.fonts[key] = pg.font.Font(key[0], key[1])
+
+		if len(self.fonts) > self.maxFonts:
+			self.fonts.popitem(last=False)
+
+		return font
+
+	def clear(self):
+		self.paths.clear()
+		self.fonts.clear()
+
+FontRegistry.default = FontRegistry()
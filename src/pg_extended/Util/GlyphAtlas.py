@@ -0,0 +1,135 @@
+from __future__ import annotations
+from collections import OrderedDict
+from itertools import accumulate
+import pygame as pg
+
+# glyphs of one font and colour rasterized once into shared pages, a string is drawn by blitting the glyph subsurfaces
+# with Surface.blits(). made for text that changes every frame (counters, timers, fps readouts) where caching whole
+# strings doesn't help. glyphs are placed by the font's advance widths, kerning pairs aren't applied
+class GlyphAtlas:
+	# (font, colour, antialias) -> atlas, least recently used atlases are dropped past maxAtlases
+	atlases: OrderedDict[tuple[pg.font.Font, int, bool], GlyphAtlas] = OrderedDict()
+	maxAtlases = 32
+
+	pageSize = 512
+
+	def __init__(self, font: pg.font.Font, color: pg.Color, antialias: bool = True):
+		self.font = font
+		self.color = pg.Color(color)
+		self.antialias = antialias
+
+		# char -> (glyph subsurface, advance), the two are also kept apart for the per string loops
+		self.glyphs: dict[str, tuple[pg.Surface, int]] = {}
+		self.surfaces: dict[str, pg.Surface] = {}
+		self.advances: dict[str, int] = {}
+		# where the glyph's surface starts relative to the pen (left of it when minx is negative) and how far right of
+		# the pen it reaches, the last glyph's reach decides the width of a string
+		self.offsets: dict[str, int] = {}
+		self.extents: dict[str, int] = {}
+		self.pages: list[pg.Surface] = []
+
+		self.lineHeight = self.font.render(' ', self.antialias, self.color).get_height()
+
+		# packing cursor on the last page
+		self.penX = 0
+		self.penY = 0
+
+	@staticmethod
+	def of(font: pg.font.Font, color: pg.Color, antialias: bool = True) -> GlyphAtlas:
+		key = (font, int(color), antialias)
+		atlas = GlyphAtlas.atlases.get(key)
+
+		if atlas is None:
+			atlas = GlyphAtlas.atlases[key] = GlyphAtlas(font, color, antialias)
+
+			if len(GlyphAtlas.atlases) > GlyphAtlas.maxAtlases:
+				GlyphAtlas.atlases.popitem(last=False)
+		else:
+			GlyphAtlas.atlases.move_to_end(key)
+
+		return atlas
+
+	def _addGlyph(self, char: str) -> tuple[pg.Surface, int]:
+		rendered = self.font.render(char, self.antialias, self.color)
+		width, height = rendered.get_size()
+
+		# metrics are None for characters the font doesn't have, those render as its replacement glyph
+		metrics = self.font.metrics(char)[0]
+
+		if metrics is None:
+			offset, advance = 0, width
+		else:
+			offset, advance = min(metrics[0], 0), metrics[4]
+
+		# glyphs wider than a page get a page of their own
+		pageWidth = max(self.pageSize, width)
+
+		if not self.pages or self.penX + width > self.pages[-1].get_width():
+			self.penX = 0
+			self.penY += self.lineHeight
+
+			if not self.pages or self.penY + height > self.pages[-1].get_height():
+				page = pg.Surface((pageWidth, max(self.pageSize, height)), pg.SRCALPHA)
+				page.fill((0, 0, 0, 0))
+
+				self.pages.append(page)
+				self.penY = 0
+
+		page = self.pages[-1]
+
+		# max against the empty page copies the glyph's pixels as they are, a normal blit would blend them
+		page.blit(rendered, (self.penX, self.penY), special_flags=pg.BLEND_RGBA_MAX)
+
+		glyph = page.subsurface((self.penX, self.penY, width, height))
+
+		if self.color.a < 255:
+			glyph.set_alpha(self.color.a)
+
+		self.penX += width
+
+		self.glyphs[char] = (glyph, advance)
+		self.surfaces[char] = glyph
+		self.advances[char] = advance
+		self.offsets[char] = offset
+		self.extents[char] = max(advance, width + offset)
+
+		return self.glyphs[char]
+
+	def addGlyphs(self, text: str):
+		for char in text:
+			if not char in self.glyphs:
+				self._addGlyph(char)
+
+	def glyph(self, char: str) -> tuple[pg.Surface, int]:
+		glyph = self.glyphs.get(char)
+
+		if glyph is None:
+			glyph = self._addGlyph(char)
+
+		return glyph
+
+	def size(self, text: str) -> tuple[int, int]:
+		if not text:
+			return (0, self.lineHeight)
+
+		try:
+			return (sum(map(self.advances.__getitem__, text[:-1])) + self.extents[text[-1]], self.lineHeight)
+		except KeyError:
+			self.addGlyphs(text)
+
+			return self.size(text)
+
+	# (glyph, position) pairs for Surface.blits(), starting at x, y
+	def layout(self, text: str, x: int, y: int) -> list[tuple[pg.Surface, tuple[int, int]]]:
+		surfaces = self.surfaces
+		offsets = self.offsets
+
+		try:
+			return [(surfaces[char], (penX + offsets[char], y)) for char, penX in zip(text, accumulate(map(self.advances.__getitem__, text), initial=x))]
+		except KeyError:
+			self.addGlyphs(text)
+
+			return self.layout(text, x, y)
+
+	def draw(self, surface: pg.Surface, text: str, pos: tuple[int, int]):
+		surface.blits(self.layout(text, pos[0], pos[1]), False)
@@ -1,18 +1,19 @@
 import pygame as pg
+from pg_extended.Util.Mipmap import Mipmap
 
+# mipmap=True smoothscales from the nearest larger level of the image's Mipmap instead of the full size image
 class ImgManipulation:
 	# deforms the image to perfectly fit in the container
 	@staticmethod
-	def squish(image: pg.Surface, containerSize: tuple[int | float, int | float] | list[int | float], smoothscale: bool = True, scalePercent: int | None = 100) -> pg.Surface:
+	def squish(image: pg.Surface, containerSize: tuple[int | float, int | float] | list[int | float], smoothscale: bool = True, scalePercent: int | None = 100, mipmap: bool = False) -> pg.Surface:
 		if smoothscale:
-			return pg.transform.smoothscale(
-				image,
-				(
-					containerSize[0] * (scalePercent / 100),
-					containerSize[1] * (scalePercent / 100)
-				)
+			newSize = (
+				containerSize[0] * (scalePercent / 100),
+				containerSize[1] * (scalePercent / 100)
 			)
 
+			return pg.transform.smoothscale(Mipmap.of(image).forSize(newSize) if mipmap else image, newSize)
+
 		return pg.transform.scale(
 			image,
 			(
@@ -23,7 +24,7 @@ class ImgManipulation:
 
 	# resizes the image to the smallest possible fit while preserving the original aspect ratio
 	@staticmethod
-	def fit(image: pg.Surface, containerSize: tuple[int | float, int | float] | list[int | float], smoothscale: bool = True, scalePercent: int | None = 100) -> pg.Surface:
+	def fit(image: pg.Surface, containerSize: tuple[int | float, int | float] | list[int | float], smoothscale: bool = True, scalePercent: int | None = 100, mipmap: bool = False) -> pg.Surface:
 		containerWidth, containerHeight = containerSize
 
 		imageWidth, imageHeight = image.get_width(), image.get_height()
@@ -34,13 +35,13 @@ class ImgManipulation:
 		newHeight = int(imageHeight * scale)
 
 		if smoothscale:
-			return pg.transform.smoothscale(image, (newWidth, newHeight))
+			return pg.transform.smoothscale(Mipmap.of(image).forSize((newWidth, newHeight)) if mipmap else image, (newWidth, newHeight))
 
 		return pg.transform.scale(image, (newWidth, newHeight))
 
 	# resizes the image to the largest possible fit while preserving the original aspect ratio
 	@staticmethod
-	def fill(image: pg.Surface, containerSize: tuple[int | float, int | float] | list[int | float], smoothscale: bool = True, scalePercent: int | None = 100) -> pg.Surface:
+	def fill(image: pg.Surface, containerSize: tuple[int | float, int | float] | list[int | float], smoothscale: bool = True, scalePercent: int | None = 100, mipmap: bool = False) -> pg.Surface:
 		containerWidth, containerHeight = containerSize
 
 		imageWidth, imageHeight = image.get_width(), image.get_height()
@@ -51,7 +52,7 @@ class ImgManipulation:
 		newHeight = int(imageHeight * scale)
 
 		if smoothscale:
-			return pg.transform.smoothscale(image, (newWidth, newHeight))
+			return pg.transform.smoothscale(Mipmap.of(image).forSize((newWidth, newHeight)) if mipmap else image, (newWidth, newHeight))
 
 		return pg.transform.scale(image, (newWidth, newHeight))
 
@@ -71,6 +72,117 @@ class ImgManipulation:
 
 		return result
 
+	# repeats image over an area, pieces along the right and bottom edges are cropped subsurfaces so nothing is allocated
+	@staticmethod
+	def tile(image: pg.Surface, area: tuple[int, int, int, int]) -> list[tuple[pg.Surface, tuple[int, int]]]:
+		x, y, w, h = area
+		tileWidth, tileHeight = image.get_size()
+
+		if w <= 0 or h <= 0 or tileWidth <= 0 or tileHeight <= 0:
+			return []
+
+		pieces = []
+
+		for tileY in range(0, h, tileHeight):
+			for tileX in range(0, w, tileWidth):
+				pieceWidth, pieceHeight = min(tileWidth, w - tileX), min(tileHeight, h - tileY)
+				piece = image if (pieceWidth, pieceHeight) == (tileWidth, tileHeight) else image.subsurface((0, 0, pieceWidth, pieceHeight))
+
+				pieces.append((piece, (x + tileX, y + tileY)))
+
+		return pieces
+
+	# splits the image into a 3x3 grid by insets (left, top, right, bottom) and lays it out over a container, returning
+	# (surface, offset) pieces for Surface.blits. corners are subsurfaces of the image and never scaled, edges are
+	# scaled (or tiled) only along their length and the centre fills the rest, so the image isn't distorted.
+	# corners are cropped when the container is smaller than the insets
+	@staticmethod
+	def nineSlice(image: pg.Surface, containerSize: tuple[int | float, int | float] | list[int | float], insets: tuple[int, int, int, int], smoothscale: bool = True, tile: bool = False) -> list[tuple[pg.Surface, tuple[int, int]]]:
+		imageWidth, imageHeight = image.get_size()
+		width, height = int(containerSize[0]), int(containerSize[1])
+		left, top, right, bottom = insets
+
+		if left + right > imageWidth or top + bottom > imageHeight:
+			raise ValueError(f'nine slice insets {insets} don\'t fit the {imageWidth}x{imageHeight} image.')
+
+		# destination insets, shrunk proportionally when the container can't fit them
+		dstLeft = min(left, (width * left) // (left + right)) if left + right > width else left
+		dstRight = min(right, width - dstLeft) if left + right > width else right
+		dstTop = min(top, (height * top) // (top + bottom)) if top + bottom > height else top
+		dstBottom = min(bottom, height - dstTop) if top + bottom > height else bottom
+
+		srcMidWidth, srcMidHeight = imageWidth - left - right, imageHeight - top - bottom
+		dstMidWidth, dstMidHeight = width - dstLeft - dstRight, height - dstTop - dstBottom
+
+		scale = pg.transform.smoothscale if smoothscale else pg.transform.scale
+
+		def stretch(srcRect: tuple[int, int, int, int], dstRect: tuple[int, int, int, int]) -> list[tuple[pg.Surface, tuple[int, int]]]:
+			if srcRect[2] <= 0 or srcRect[3] <= 0 or dstRect[2] <= 0 or dstRect[3] <= 0:
+				return []
+
+			piece = image.subsurface(srcRect)
+
+			if tile:
+				return ImgManipulation.tile(piece, dstRect)
+
+			if srcRect[2:] != dstRect[2:]:
+				piece = scale(piece, dstRect[2:])
+
+			return [(piece, dstRect[:2])]
+
+		# crop along the axis an edge doesn't stretch on, the edge is then only scaled along its length
+		return [
+			*stretch((0, 0, dstLeft, dstTop), (0, 0, dstLeft, dstTop)),
+			*stretch((left, 0, srcMidWidth, dstTop), (dstLeft, 0, dstMidWidth, dstTop)),
+			*stretch((imageWidth - dstRight, 0, dstRight, dstTop), (width - dstRight, 0, dstRight, dstTop)),
+			*stretch((0, top, dstLeft, srcMidHeight), (0, dstTop, dstLeft, dstMidHeight)),
+			*stretch((left, top, srcMidWidth, srcMidHeight), (dstLeft, dstTop, dstMidWidth, dstMidHeight)),
+			*stretch((imageWidth - dstRight, top, dstRight, srcMidHeight), (width - dstRight, dstTop, dstRight, dstMidHeight)),
+			*stretch((0, imageHeight - dstBottom, dstLeft, dstBottom), (0, height - dstBottom, dstLeft, dstBottom)),
+			*stretch((left, imageHeight - dstBottom, srcMidWidth, dstBottom), (dstLeft, height - dstBottom, dstMidWidth, dstBottom)),
+			*stretch((imageWidth - dstRight, imageHeight - dstBottom, dstRight, dstBottom), (width - dstRight, height - dstBottom, dstRight, dstBottom))
+		]
+
+	# a rounded rect shape, optionally inside a border ring, ready to be blitted. opaque shapes use a colorkey for the corners,
+	# which blits faster than per pixel alpha. the border is drawn opaque and a translucent fill is blended over it,
+	# the same result as drawing the border and then the fill onto the screen
+	@staticmethod
+	def roundedRect(size: tuple[int, int], color: pg.Color, radius: float = 0, borderWidth: int = 0, borderColor: pg.Color | None = None) -> pg.Surface:
+		w, h = size
+		color = pg.Color(color)
+		radius = int(radius or 0)
+
+		innerRect = (borderWidth, borderWidth, max(0, w - (borderWidth * 2)), max(0, h - (borderWidth * 2)))
+
+		if borderWidth > 0:
+			borderColor = pg.Color(borderColor)
+			borderColor.a = 255
+
+		if color.a == 255:
+			used = (tuple(color)[:3], tuple(borderColor)[:3] if borderWidth > 0 else None)
+			colorkey = next(key for key in ((255, 0, 255), (0, 255, 0), (0, 0, 255)) if not key in used)
+
+			surface = pg.Surface((w, h))
+			surface.fill(colorkey)
+		else:
+			colorkey = None
+			surface = pg.Surface((w, h), pg.SRCALPHA)
+
+		if borderWidth > 0:
+			pg.draw.rect(surface, borderColor, (0, 0, w, h), border_radius=radius)
+
+		if color.a == 255 or borderWidth <= 0:
+			pg.draw.rect(surface, color, innerRect, border_radius=radius)
+		else:
+			fill = pg.Surface(innerRect[2:], pg.SRCALPHA)
+			pg.draw.rect(fill, color, (0, 0, *innerRect[2:]), border_radius=radius)
+			surface.blit(fill, innerRect[:2])
+
+		if colorkey is not None:
+			surface.set_colorkey(colorkey, pg.RLEACCEL)
+
+		return surface
+
 	# make a 2xn or nx2 pixel surface with provided colors that can later be smoothscaled to get a color gradient
 	@staticmethod
 	def getGradient(colors: list[pg.Color | tuple[int, int, int] | tuple[int, int, int, int]], sizes: list[int], direction: str, thickness: int = 2) -> pg.Surface:
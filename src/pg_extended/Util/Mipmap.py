@@ -0,0 +1,50 @@
+from __future__ import annotations
+from threading import Lock
+from weakref import WeakKeyDictionary
+import pygame as pg
+
+# pyramid of successively halved versions of an image, built lazily. downscaling starts from the smallest level that
+# is still at least the target size, so the cost follows the output size instead of the source size
+class Mipmap:
+	__slots__ = ('levels', 'lock', '__weakref__')
+
+	# source image -> its pyramid, shared by everything scaling the same image and dropped together with it
+	pyramids: WeakKeyDictionary[pg.Surface, Mipmap] = WeakKeyDictionary()
+	pyramidsLock = Lock()
+
+	def __init__(self, image: pg.Surface):
+		self.levels: list[pg.Surface] = [image]
+		# levels can be requested from worker threads, see Section.asyncBackground
+		self.lock = Lock()
+
+	@staticmethod
+	def of(image: pg.Surface) -> Mipmap:
+		with Mipmap.pyramidsLock:
+			mipmap = Mipmap.pyramids.get(image)
+
+			if mipmap is None:
+				mipmap = Mipmap.pyramids[image] = Mipmap(image)
+
+		return mipmap
+
+	# the smallest level at least as big as size on both axes, level 0 (the source) when nothing smaller fits
+	def forSize(self, size: tuple[int | float, int | float]) -> pg.Surface:
+		targetWidth, targetHeight = max(1, int(size[0])), max(1, int(size[1]))
+
+		with self.lock:
+			level = 0
+
+			while True:
+				width, height = self.levels[level].get_size()
+
+				if width // 2 < targetWidth or height // 2 < targetHeight:
+					return self.levels[level]
+
+				if level + 1 == len(self.levels):
+					self.levels.append(pg.transform.smoothscale(self.levels[level], (width // 2, height // 2)))
+
+				level += 1
+
+	def clear(self):
+		with self.lock:
+			del self.levels[1:]
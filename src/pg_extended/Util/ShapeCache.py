@@ -0,0 +1,29 @@
+from __future__ import annotations
+import pygame as pg
+from pg_extended.Util.ImgManipulation import ImgManipulation
+from pg_extended.Util.SurfaceCache import SurfaceCache
+
+# rasterizes solid colour shapes once, drawing one is then a single blit instead of pg.draw calls every frame.
+# returned surfaces are shared between everything drawing the same shape and must not be drawn on
+class ShapeCache(SurfaceCache):
+	# shared cache used by elements that aren't given one
+	default: ShapeCache = None
+
+	def __init__(self, maxBytes: int = 16 * 1024 * 1024):
+		super().__init__(maxBytes)
+
+	# see ImgManipulation.roundedRect()
+	def rect(self, size: tuple[int, int], color: pg.Color, radius: float = 0, borderWidth: int = 0, borderColor: pg.Color | None = None) -> pg.Surface:
+		key = (
+			'rect', int(size[0]), int(size[1]), int(pg.Color(color)), int(radius or 0),
+			borderWidth, int(pg.Color(borderColor)) if borderWidth > 0 else None
+		)
+
+		surface = self.get(key)
+
+		if surface is None:
+			surface = self.put(key, ImgManipulation.roundedRect((key[1], key[2]), color, radius, borderWidth, borderColor))
+
+		return surface
+
+ShapeCache.default = ShapeCache()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+from typing import Any, Callable
+from collections import OrderedDict
+import pygame as pg
+
+# least recently used cache for processed surfaces with a memory budget in bytes. keys can hold the source
+# surface itself, surfaces hash by identity and the key keeps the source alive for as long as the entry exists
+class SurfaceCache:
+	# shared cache used by elements that aren't given one
+	default: SurfaceCache = None
+
+	def __init__(self, maxBytes: int = 64 * 1024 * 1024):
+		if maxBytes < 0:
+			raise ValueError('maxBytes must be greater than or equal to 0.')
+
+		self.maxBytes = maxBytes
+
+		# key -> (surface, size in bytes), oldest first
+		self.entries: OrderedDict[Any, tuple[pg.Surface, int]] = OrderedDict()
+		self.bytes = 0
+
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+	def __len__(self) -> int:
+		return len(self.entries)
+
+	def __contains__(self, key: Any) -> bool:
+		return key in self.entries
+
+	@staticmethod
+	def surfaceBytes(surface: pg.Surface) -> int:
+		return surface.get_pitch() * surface.get_height()
+
+	def hitRate(self) -> float:
+		lookups = self.hits + self.misses
+
+		return self.hits / lookups if lookups else 0.0
+
+	def get(self, key: Any) -> pg.Surface | None:
+		entry = self.entries.get(key)
+
+		if entry is None:
+			self.misses += 1
+			return None
+
+		self.entries.move_to_end(key)
+		self.hits += 1
+
+		return entry[0]
+
+	# stores the surface and evicts the least recently used entries until the cache fits its budget again,
+	# a surface bigger than the whole budget is returned without being stored
+	def put(self, key: Any, surface: pg.Surface) -> pg.Surface:
+		size = self.surfaceBytes(surface)
+
+		if size > self.maxBytes:
+			return surface
+
+		self.discard(key)
+
+		self.entries[key] = (surface, size)
+		self.bytes += size
+
+		self._trim()
+
+		return surface
+
+	def getOrCreate(self, key: Any, create: Callable[[], pg.Surface]) -> pg.Surface:
+		surface = self.get(key)
+
+		if surface is None:
+			surface = self.put(key, create())
+
+		return surface
+
+	def discard(self, key: Any):
+		entry = self.entries.pop(key, None)
+
+		if entry is not None:
+			self.bytes -= entry[1]
+
+	# drops every entry whose key matches, e.g. everything made from a source surface that has been drawn on
+	def discardWhere(self, predicate: Callable[[Any], bool]):
+		for key in [key for key in self.entries if predicate(key)]:
+			self.discard(key)
+
+	def setBudget(self, maxBytes: int):
+		if maxBytes < 0:
+			raise ValueError('maxBytes must be greater than or equal to 0.')
+
+		self.maxBytes = maxBytes
+
+		self._trim()
+
+	def _trim(self):
+		while self.bytes > self.maxBytes:
+			_, (_, evictedSize) = self.entries.popitem(last=False)
+			self.bytes -= evictedSize
+			self.evictions += 1
+
+	def clear(self):
+		self.entries.clear()
+		self.bytes = 0
+
+	def resetStats(self):
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+SurfaceCache.default = SurfaceCache()
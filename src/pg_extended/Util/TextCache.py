@@ -0,0 +1,31 @@
+from __future__ import annotations
+import pygame as pg
+from pg_extended.Util.SurfaceCache import SurfaceCache
+
+# rendered text surfaces shared by everything drawing the same string with the same font and colour, so a table full
+# of repeated cell values renders each distinct value once. fonts are keyed by identity, see FontRegistry.
+# returned surfaces are shared and must not be drawn on
+class TextCache(SurfaceCache):
+	# shared cache used by text elements that aren't given one
+	default: TextCache = None
+
+	def __init__(self, maxBytes: int = 16 * 1024 * 1024):
+		super().__init__(maxBytes)
+
+	# font.render() with a translucent colour applied as surface alpha, the way TextBox draws it
+	def render(self, font: pg.font.Font, text: str, color: pg.Color, antialias: bool = True) -> pg.Surface:
+		key = (font, text, int(color), antialias)
+
+		surface = self.get(key)
+
+		if surface is None:
+			surface = font.render(text, antialias, color)
+
+			if color.a < 255:
+				surface.set_alpha(color.a)
+
+			self.put(key, surface)
+
+		return surface
+
+TextCache.default = TextCache()
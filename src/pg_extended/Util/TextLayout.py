@@ -0,0 +1,187 @@
+from __future__ import annotations
+from weakref import WeakKeyDictionary
+import pygame as pg
+
+# word wrapping for one font. every paragraph keeps its latest breaks together with the range of widths they hold for,
+# so a resize only re-flows the paragraphs whose breaks actually change. paragraphs that fit aren't broken at all
+class TextLayout:
+	# font -> its layout, shared by every text element using the font and dropped together with it
+	layouts: WeakKeyDictionary[pg.font.Font, TextLayout] = WeakKeyDictionary()
+
+	# paragraphs with cached breaks / measured strings before the cache is cleared
+	maxBreaks = 65536
+	maxWords = 262144
+	# breaks kept per paragraph, so resizing back and forth doesn't re-flow
+	breaksPerParagraph = 4
+
+	def __init__(self, font: pg.font.Font):
+		self.font = font
+
+		self.wordWidths: dict[str, int] = {}
+		# paragraph -> its latest breaks, most recently used first, see _wrapParagraph()
+		self.breaks: dict[str, list[tuple[tuple[str, ...], tuple[int, ...], int, int]]] = {}
+
+		self.spaceWidth = self.font.size(' ')[0]
+
+	@staticmethod
+	def of(font: pg.font.Font) -> TextLayout:
+		layout = TextLayout.layouts.get(font)
+
+		if layout is None:
+			layout = TextLayout.layouts[font] = TextLayout(font)
+
+		return layout
+
+	def measure(self, word: str) -> int:
+		width = self.wordWidths.get(word)
+
+		if width is None:
+			if len(self.wordWidths) >= self.maxWords:
+				self.wordWidths.clear()
+
+			width = self.wordWidths[word] = self.font.size(word)[0]
+
+		return width
+
+	# splits a word too long for a line into pieces that fit, at least one character each
+	def _breakWord(self, word: str, width: int) -> list[str]:
+		pieces = []
+		start = 0
+
+		while start < len(word):
+			end = start + 1
+
+			while end < len(word) and self.font.size(word[start:end + 1])[0] <= width:
+				end += 1
+
+			pieces.append(word[start:end])
+			start = end
+
+		return pieces
+
+	# greedy word wrap, returns the lines, their widths and the range of widths [low, high) the same breaks hold for.
+	# lines are filled by summing word widths and then measured once, dropping words while kerning makes them too wide.
+	# the range uses the same sums as the fill: low is the widest line (summed or measured) and high the narrowest sum
+	# of a broken line with its next word. breaks that needed words dropped or split hold only for the exact width
+	def _wrapParagraph(self, paragraph: str, width: int) -> tuple[tuple[str, ...], tuple[int, ...], int, int]:
+		words = paragraph.split(' ')
+		wordWidths = [self.measure(word) for word in words]
+		spaceWidth = self.spaceWidth
+
+		lines = []
+		widths = []
+		low = 0
+		high = 1 << 30
+		exactOnly = False
+
+		i = 0
+
+		while i < len(words):
+			if wordWidths[i] > width and len(words[i]) > 1:
+				# pieces of a broken word depend on the exact width
+				exactOnly = True
+
+				*full, rest = self._breakWord(words[i], width)
+
+				lines.extend(full)
+				widths.extend(self.font.size(piece)[0] for piece in full)
+
+				words[i] = rest
+				wordWidths[i] = self.font.size(rest)[0]
+
+			estimate = wordWidths[i]
+			j = i + 1
+
+			while j < len(words) and estimate + spaceWidth + wordWidths[j] <= width:
+				estimate += spaceWidth + wordWidths[j]
+				j += 1
+
+			line = ' '.join(words[i:j])
+			lineWidth = self.font.size(line)[0]
+
+			while lineWidth > width and j - 1 > i:
+				exactOnly = True
+
+				j -= 1
+				estimate -= spaceWidth + wordWidths[j]
+				line = ' '.join(words[i:j])
+				lineWidth = self.font.size(line)[0]
+
+			lines.append(line)
+			widths.append(lineWidth)
+
+			low = max(low, lineWidth, estimate)
+
+			if j < len(words):
+				high = min(high, estimate + spaceWidth + wordWidths[j])
+
+			i = j
+
+		# a single character wider than the line also leaves low above the width
+		if exactOnly or low > width:
+			return (tuple(lines), tuple(widths), width, width + 1)
+
+		return (tuple(lines), tuple(widths), low, high)
+
+	# the lines of one paragraph (text without line breaks) and their widths at a width, None doesn't wrap
+	def wrapParagraph(self, paragraph: str, width: int | None) -> tuple[tuple[str, ...], tuple[int, ...]]:
+		paragraphWidth = self.measure(paragraph)
+
+		if width is None or paragraphWidth <= width:
+			return ((paragraph,), (paragraphWidth,))
+
+		width = int(width)
+		entries = self.breaks.get(paragraph)
+
+		if entries is None:
+			if len(self.breaks) >= self.maxBreaks:
+				self.breaks.clear()
+
+			entries = self.breaks[paragraph] = []
+
+		for i, entry in enumerate(entries):
+			if entry[2] <= width < entry[3]:
+				# most recently used first, see wrap()
+				entries.insert(0, entries.pop(i))
+				return entry[:2]
+
+		entry = self._wrapParagraph(paragraph, width)
+
+		entries.insert(0, entry)
+		del entries[self.breaksPerParagraph:]
+
+		return entry[:2]
+
+	# wrapParagraph() over every paragraph, with the common cases inlined since it runs for each paragraph on every resize
+	def wrap(self, text: str, width: int | None) -> tuple[list[str], list[int]]:
+		lines = []
+		widths = []
+
+		measured = self.wordWidths
+		breaks = self.breaks
+
+		if width is not None:
+			width = int(width)
+
+		for paragraph in text.split('\n'):
+			paragraphWidth = measured.get(paragraph)
+
+			if paragraphWidth is None:
+				paragraphWidth = self.measure(paragraph)
+
+			if width is None or paragraphWidth <= width:
+				lines.append(paragraph)
+				widths.append(paragraphWidth)
+				continue
+
+			entries = breaks.get(paragraph)
+
+			if entries and entries[0][2] <= width < entries[0][3]:
+				paragraphLines, paragraphWidths = entries[0][:2]
+			else:
+				paragraphLines, paragraphWidths = self.wrapParagraph(paragraph, width)
+
+			lines.extend(paragraphLines)
+			widths.extend(paragraphWidths)
+
+		return (lines, widths)
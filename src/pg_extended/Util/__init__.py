@@ -1,2 +1,9 @@
+from pg_extended.Util.Mipmap import Mipmap
 from pg_extended.Util.ImgManipulation import ImgManipulation
 from pg_extended.Util.Misc import Misc
+from pg_extended.Util.SurfaceCache import SurfaceCache
+from pg_extended.Util.ShapeCache import ShapeCache
+from pg_extended.Util.FontRegistry import FontRegistry
+from pg_extended.Util.TextCache import TextCache
+from pg_extended.Util.GlyphAtlas import GlyphAtlas
+from pg_extended.Util.TextLayout import TextLayout
@@ -1,4 +1,5 @@
 from pg_extended.Types import CallableLike
+from pg_extended.Core import Observable, DimensionStore, AnimationClock, CallbackQueue
 import pg_extended as pgx
 
 from .SystemManager import SystemManager
@@ -7,8 +8,12 @@ from .MainLoop import MainLoop
 from .Lifecycle import Lifecycle
 from .Utility import Utility
 
-class Window(SystemManager, EventManager, MainLoop, Lifecycle, Utility):
-	def __init__(self, title: str, screenRes: list[int] | tuple[int, int], customLoopProcess: CallableLike | None = None, customUpdateProcess: CallableLike | None = None, customEventHandler: CallableLike | None = None, customDrawProcess: CallableLike | None = None, fps : int | None = 60):
+class Window(SystemManager, EventManager, MainLoop, Lifecycle, Utility, Observable):
+	# screenResized() notifies these, see Observable
+	NOTIFIED_ATTRIBUTES = ('screenWidth', 'screenHeight')
+
+	def __init__(self, title: str, screenRes: list[int] | tuple[int, int], customLoopProcess: CallableLike | None = None, customUpdateProcess: CallableLike | None = None, customEventHandler: CallableLike | None = None, customDrawProcess: CallableLike | None = None, fps : int | None = 60, animationClock: AnimationClock | None = None):
+		self.attributeWatchers = None
 		self.title: str = title
 		self.screenRes: list[int] | tuple[int, int] = screenRes
 		self.customLoopProcess: CallableLike | None = customLoopProcess
@@ -26,5 +31,16 @@ class Window(SystemManager, EventManager, MainLoop, Lifecycle, Utility):
 		self.customDynamicValues: dict[str, pgx.Core.DynamicValue] = {}
 		self.lazyDynamicValues: dict[str, pgx.Core.DynamicValue] = {}
 		self.customAnimatedValues: dict[str, pgx.Core.AnimatedValue] = {}
+		self.dimensionStore: DimensionStore = DimensionStore()
+
+		# an extra clock for this window to drive, values only follow it when they're given it too. the default clock is
+		# always driven as well, see animationClocks(). for reproducible headless runs use AnimationClock.setDefault()
+		# before starting any animations, or AnimationClock.default.setMode('fixed')
+		self.animationClock: AnimationClock | None = animationClock
+		self.callbackQueue: CallbackQueue = CallbackQueue.default
 		self.customData: dict = {}
 		self.firstUpdate = True
+
+		# scene rendering hooks read by resetUI(), unused until a renderer is attached
+		self.activeScene = None
+		self.viewPort = None
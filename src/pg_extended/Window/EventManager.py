@@ -1,4 +1,5 @@
 import pygame as pg
+from pg_extended.Core import FrameEpoch
 
 CURSOR_CONSTANTS = {
 	None: pg.SYSTEM_CURSOR_ARROW,
@@ -17,6 +18,9 @@ class EventManager:
 			return None
 
 		for event in pg.event.get():
+			# every event gets its own epoch, values read while handling it see what earlier events changed
+			FrameEpoch.advance()
+
 			if self.customEventHandler is not None:
 				self.customEventHandler(event)
 
@@ -1,7 +1,8 @@
 import pygame as pg
 
 class Lifecycle:
-	def openWindow(self):
+	# frames limits the run to that many frames, with a fixed step clock and fps=0 this replays a scene as fast as possible
+	def openWindow(self, frames: int | None = None):
 		self.time = pg.time
 		self.clock = self.time.Clock()
 		self.currentFPS: int = self.clock.get_fps()
@@ -15,6 +16,9 @@ class Lifecycle:
 		if ((not receivedWidth == self.screenWidth) or (not receivedHeight == self.screenHeight)):
 			self.screenWidth, self.screenHeight = receivedWidth, receivedHeight
 
+			self.notifyAttribute('screenWidth')
+			self.notifyAttribute('screenHeight')
+
 		self.running = True
 		self.secondResize = False
 
@@ -25,10 +29,19 @@ class Lifecycle:
 		while self.running:
 			self.updateLoop()
 
+			if frames is not None:
+				frames -= 1
+
+				if frames <= 0:
+					break
+
 		self.closeWindow()
 
 	def closeWindow(self):
 		self.running = False
+		for clock in self.animationClocks():
+			clock.stop()
+		self.callbackQueue.shutdown()
 		self.deactivateSystems('all')
 
 		del self.screen
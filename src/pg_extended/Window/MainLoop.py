@@ -1,13 +1,30 @@
 import pygame as pg
+from pg_extended.Core import FrameEpoch
 
 class MainLoop:
 	def updateLoop(self):
+		FrameEpoch.advance()
+
+		# deferred callbacks and pool results from the previous frame
+		self.callbackQueue.flush()
+
 		self.handleEvents()
 
+		# event handlers may have changed what values read, so the update pass gets its own epoch
+		FrameEpoch.advance()
+
+		clocks = self.animationClocks()
+
+		for clock in clocks:
+			clock.tick()
+
 		if self.secondResize or self.screenResized():
 			self.secondResize = not self.secondResize
 			self.resetUI()
 
+			# the update pass below resolves again after the resize, like it did before memoization
+			FrameEpoch.advance()
+
 		self.currentFPS = self.clock.get_fps()
 
 		self.screen.fill((0, 0, 0))
@@ -15,6 +32,11 @@ class MainLoop:
 		for dvKey in self.customDynamicValues:
 			self.customDynamicValues[dvKey].resolveValue()
 
+		for clock in clocks:
+			clock.step()
+
+		# the clock only steps playing animations, idle ones follow endpoints that moved. already stepped values are
+		# cached for this epoch, so this only costs the resting endpoint of the idle ones
 		for avKey in self.customAnimatedValues:
 			self.customAnimatedValues[avKey].resolveValue()
 
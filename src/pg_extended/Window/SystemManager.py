@@ -93,3 +93,6 @@ class SystemManager:
 		for systemID in self.activeSystems:
 			if self.activeSystems[systemID].locked:
 				self.activeSystems[systemID].initiate(surface)
+
+				# percents of the window resolve together in the window's store from here on
+				self.activeSystems[systemID].convertDimensions(self.dimensionStore, self)
@@ -6,6 +6,16 @@ class Utility:
 		self.title = title
 		pg.display.set_caption(self.title)
 
+	# the clocks this window ticks and steps: the default one, which every value without its own clock runs on, and
+	# the window's own clock when it was given one
+	def animationClocks(self) -> tuple[pgx.Core.AnimationClock, ...]:
+		default = pgx.Core.AnimationClock.default
+
+		if self.animationClock is None or self.animationClock is default:
+			return (default,)
+
+		return (default, self.animationClock)
+
 	def screenResized(self) -> bool:
 		if not self.running:
 			return None
@@ -15,6 +25,10 @@ class Utility:
 
 		if (self.screenWidth != tmpSW) or (self.screenHeight != tmpSH):
 			self.screenWidth, self.screenHeight = self.screen.get_width(), self.screen.get_height()
+
+			self.notifyAttribute('screenWidth')
+			self.notifyAttribute('screenHeight')
+
 			return True
 
 		return False
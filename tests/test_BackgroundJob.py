@@ -0,0 +1,58 @@
+import time
+import threading
+import unittest
+from pg_extended.Core import BackgroundJob, CallbackQueue
+
+def wait(queue: CallbackQueue, count: int = 1):
+	deadline = time.monotonic() + 5
+
+	while len(queue.results) < count and time.monotonic() < deadline:
+		time.sleep(0.001)
+
+class TestBackgroundJob(unittest.TestCase):
+	def setUp(self):
+		self.queue = CallbackQueue(1)
+		self.applied = []
+		self.job = BackgroundJob(lambda key, result: self.applied.append((key, result)), queue=self.queue)
+
+	def tearDown(self):
+		self.queue.shutdown(wait=True)
+
+	def test_latestRequestWins(self):
+		release = threading.Event()
+
+		self.job.request('a', lambda: release.wait() and 'a', {})
+		self.job.request('b', lambda: 'b', {})
+		self.job.request('c', lambda: 'c', {})
+
+		release.set()
+		wait(self.queue)
+		self.queue.flush()
+		wait(self.queue)
+		self.queue.flush()
+
+		self.assertEqual(self.applied, [('a', 'a'), ('c', 'c')])
+		self.assertFalse(self.job.running)
+		self.assertEqual(self.queue.running, 0)
+
+	def test_shutdownResetsJobs(self):
+		release = threading.Event()
+
+		self.job.request('a', lambda: release.wait() and 'a', {})
+		self.job.request('b', lambda: 'b', {})
+		self.queue.shutdown()
+
+		self.assertFalse(self.job.running)
+		self.assertIsNone(self.job.pending)
+
+		# the job submitted before the shutdown finishes late, its result is dropped
+		release.set()
+		self.job.request('c', lambda: 'c', {})
+		wait(self.queue, 2)
+		self.queue.flush()
+
+		self.assertEqual(self.applied, [('c', 'c')])
+		self.assertEqual(self.queue.running, 0)
+
+if __name__ == '__main__':
+	unittest.main()
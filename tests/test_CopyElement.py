@@ -0,0 +1,59 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg
+import pg_extended as pgx
+from pg_extended.Core import DynamicValue
+from pg_extended.UI.CopyElement import CopyElement
+
+class TestCopyElement(unittest.TestCase):
+	def section(self) -> pgx.Section:
+		return pgx.Section({'x': 0, 'y': 0, 'width': 40, 'height': 30}, pg.Surface((12, 12)), 0, 'nineSlice', nineSliceInsets=4)
+
+	def test_sectionKeepsNineSliceTiling(self):
+		section = self.section()
+		section.nineSliceTile = True
+
+		copied = CopyElement.copySection(section)
+
+		self.assertEqual(copied.nineSliceInsets, (4, 4, 4, 4))
+		self.assertTrue(copied.nineSliceTile)
+
+	def test_asyncBackgroundIsCopied(self):
+		section = self.section()
+		circle = pgx.Circle({'x': 0, 'y': 0, 'radius': 10}, pg.Surface((12, 12)))
+		section.asyncBackground = True
+		circle.asyncBackground = True
+
+		self.assertTrue(CopyElement.copySection(section).asyncBackground)
+		self.assertTrue(CopyElement.copyCircle(circle).asyncBackground)
+
+	def test_mipmapSettingIsCopied(self):
+		section = self.section()
+		circle = pgx.Circle({'x': 0, 'y': 0, 'radius': 10}, pg.Surface((12, 12)))
+		section.backgroundMipmap = False
+		circle.backgroundMipmap = False
+
+		self.assertFalse(CopyElement.copySection(section).backgroundMipmap)
+		self.assertFalse(CopyElement.copyCircle(circle).backgroundMipmap)
+
+	def test_textBoxKeepsLayout(self):
+		section = pgx.Section({'x': 0, 'y': 0, 'width': 60, 'height': 80}, pg.Color(0, 0, 0))
+		textBox = pgx.TextBox(section, 'one two three four five', None, pg.Color(255, 255, 255), DynamicValue(12))
+		textBox.multiline = True
+		textBox.wrap = False
+		textBox.lineSpacing = 1.5
+		textBox.update()
+
+		copied = CopyElement.copyTextBox(textBox)
+
+		self.assertTrue(copied.multiline)
+		self.assertFalse(copied.wrap)
+		self.assertEqual(copied.lineSpacing, 1.5)
+		self.assertEqual(copied.lines, textBox.lines)
+		self.assertEqual(copied.lineHeight, textBox.lineHeight)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,97 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg
+import pg_extended as pgx
+from pg_extended.Core import DynamicValue, DimensionStore, StoreDimension, FrameEpoch
+
+class TestDimensionStore(unittest.TestCase):
+	def setUp(self):
+		self.window = pgx.Window('test', (800, 600))
+		self.store = DimensionStore()
+
+	def resize(self, width: int):
+		self.window.screenWidth = width
+		self.window.notifyAttribute('screenWidth')
+		FrameEpoch.advance()
+
+	def section(self, width) -> pgx.Section:
+		return pgx.Section({'x': 0, 'y': 0, 'width': width, 'height': 10}, pg.Color(0, 0, 0))
+
+	def test_viewsReadResolvedValues(self):
+		parent = self.section(DynamicValue(self.window, 'screenWidth', percent=50))
+		child = self.section(DynamicValue(parent, 'width', percent=50))
+
+		self.store.convertArea(parent, self.window)
+		self.store.convertArea(child, self.window)
+
+		self.resize(1000)
+		parent.update()
+		child.update()
+
+		self.assertEqual(parent.width, 500)
+		self.assertEqual(child.width, 250)
+
+	def test_convertKeepsFlags(self):
+		reactive = self.store.convert(DynamicValue(self.window, 'screenWidth', reactive=True))
+		volatile = self.store.convert(DynamicValue(self.window, 'screenWidth', volatile=True))
+
+		self.assertIsInstance(reactive, StoreDimension)
+		self.assertTrue(reactive.reactive)
+		self.assertTrue(volatile.volatile)
+
+		# a volatile view sees a change within the same frame epoch
+		volatile.resolveValue()
+		self.window.screenWidth = 900
+		volatile.resolveValue()
+
+		self.assertEqual(volatile.value, 900)
+
+	def test_removeElementFreesEntries(self):
+		system = pgx.System(preLoadState=True)
+		width = DynamicValue(self.window, 'screenWidth', percent=25)
+		section = self.section(width)
+		kept = self.section(DynamicValue(self.window, 'screenHeight', percent=50))
+
+		system.addElement(section, 'section')
+		system.addElement(kept, 'kept')
+		system.convertDimensions(self.store, self.window)
+
+		self.assertEqual(len(self.store), 2)
+
+		system.removeElement('section')
+
+		# the removed area gets its own value back and the store drops the entry
+		self.assertIs(section.dimensions['width'], width)
+		self.assertEqual(len(self.store), 1)
+		self.assertEqual(len(self.store.sources), 1)
+
+		self.resize(1000)
+		kept.update()
+
+		self.assertEqual(kept.width, 300)
+
+	def test_compactKeepsReferencedEntries(self):
+		parent = self.section(DynamicValue(self.window, 'screenWidth', percent=50))
+		child = self.section(DynamicValue(parent, 'width', percent=50))
+
+		self.store.convertArea(parent, self.window)
+		self.store.convertArea(child, self.window)
+		self.store.releaseArea(parent)
+
+		# the child is still a percent of the parent's entry
+		self.assertEqual(len(self.store), 2)
+
+		self.resize(1200)
+		child.update()
+
+		self.assertEqual(child.width, 300)
+
+		self.store.releaseArea(child)
+
+		self.assertEqual(len(self.store), 0)
+
+if __name__ == '__main__':
+	unittest.main()
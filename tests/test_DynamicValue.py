@@ -0,0 +1,135 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg
+import pg_extended as pgx
+from pg_extended.Core import DynamicValue, FrameEpoch, Callback
+
+class TestReactive(unittest.TestCase):
+	def setUp(self):
+		self.window = pgx.Window('test', (800, 600))
+
+	def resize(self, width: int):
+		self.window.screenWidth = width
+		self.window.notifyAttribute('screenWidth')
+
+	def test_notifiedAttributeIsTracked(self):
+		value = DynamicValue(self.window, 'screenWidth', percent=50, reactive=True)
+
+		self.assertTrue(value.tracked)
+		self.assertEqual(value.value, 400)
+
+		self.resize(1000)
+		value.resolveValue()
+
+		self.assertEqual(value.value, 500)
+
+	def test_otherAttributesArePolled(self):
+		fps = DynamicValue(self.window, 'fps', reactive=True)
+		section = pgx.Section({'x': 0, 'y': 0, 'width': 10, 'height': 10}, pg.Color(0, 0, 0))
+		radius = DynamicValue(section, 'borderRadius', reactive=True)
+
+		self.assertFalse(fps.tracked)
+		self.assertFalse(radius.tracked)
+
+		self.window.fps = 30
+		section.borderRadius = 9
+		fps.resolveValue()
+		radius.resolveValue()
+
+		self.assertEqual(fps.value, 30)
+		self.assertEqual(radius.value, 9)
+
+	def test_removeElementReleasesWatchers(self):
+		system = pgx.System(preLoadState=True)
+		width = DynamicValue(self.window, 'screenWidth', percent=25, reactive=True)
+		section = pgx.Section({'x': 0, 'y': 0, 'width': width, 'height': 10}, pg.Color(0, 0, 0))
+
+		system.addElement(section, 'section')
+
+		self.assertIn(width, self.window.attributeWatchers['screenWidth'])
+
+		system.removeElement('section')
+
+		self.assertNotIn(width, self.window.attributeWatchers['screenWidth'])
+
+		# a released value still follows its source
+		self.resize(1200)
+		width.resolveValue()
+
+		self.assertEqual(width.value, 300)
+
+	def test_releasedSourceIsPulledByDependants(self):
+		source = DynamicValue(self.window, 'screenWidth', reactive=True)
+		dependant = DynamicValue(source, percent=50, reactive=True)
+
+		self.assertIn(source, dependant.sources)
+
+		source.release()
+		self.resize(700)
+		dependant.resolveValue()
+
+		self.assertEqual(dependant.value, 350)
+
+class Holder:
+	def __init__(self):
+		self.v = 0
+
+class TestMemoization(unittest.TestCase):
+	def test_cachedWithinEpoch(self):
+		holder = Holder()
+		value = DynamicValue(holder, 'v')
+
+		FrameEpoch.advance()
+		value.resolveValue()
+		holder.v = 5
+		value.resolveValue()
+
+		self.assertEqual(value.value, 0)
+
+		FrameEpoch.advance()
+		value.resolveValue()
+
+		self.assertEqual(value.value, 5)
+
+	def test_callbackArgsAreFreshPerCall(self):
+		holder = Holder()
+		received = []
+		callback = Callback(('mouseDrag',), lambda v: received.append(v), {'v': DynamicValue(holder, 'v')})
+
+		FrameEpoch.advance()
+
+		for v in range(3):
+			holder.v = v
+			callback.call()
+
+		self.assertEqual(received, [0, 1, 2])
+
+	def test_eventsGetTheirOwnEpoch(self):
+		holder = Holder()
+		value = DynamicValue(holder, 'v')
+		seen = []
+
+		def handler(event: pg.Event):
+			holder.v += 1
+			value.resolveValue()
+			seen.append(value.value)
+
+		window = pgx.Window('test', (200, 100), customEventHandler=handler)
+		window.running = True
+
+		pg.display.set_mode((200, 100))
+		pg.event.clear()
+
+		for _ in range(3):
+			# quit events skip the cursor update, which the dummy video driver has no support for
+			pg.event.post(pg.Event(pg.QUIT))
+
+		window.handleEvents()
+
+		self.assertEqual(seen, [1, 2, 3])
+
+if __name__ == '__main__':
+	unittest.main()
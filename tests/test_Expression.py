@@ -0,0 +1,46 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg
+import pg_extended as pgx
+from pg_extended.Core import DynamicValue, Expression, RectArea, CircleArea, AnimatedValue, FrameEpoch
+
+class TestExpression(unittest.TestCase):
+	def setUp(self):
+		self.window = pgx.Window('test', (800, 600))
+
+	def test_compiledMatchesArithmetic(self):
+		area = RectArea({'x': 10, 'y': 20, 'width': 300, 'height': 40})
+		value = DynamicValue(DynamicValue(area, 'x') + DynamicValue(area, 'width') / 20 - Expression.attr(area, 'y'))
+
+		self.assertEqual(value.value, 10 + 300 / 20 - 20)
+
+	def test_expressionAsDimension(self):
+		half = DynamicValue(self.window, 'screenWidth', percent=50)
+		area = RectArea({'x': half - 100, 'y': 0, 'width': half + 10, 'height': 10})
+		circle = CircleArea({'x': 0, 'y': 0, 'radius': DynamicValue(area, 'width') / 2})
+
+		self.assertEqual(area.width, 410)
+		self.assertEqual(area.x, 300)
+		self.assertEqual(circle.radius, 205)
+
+		self.window.screenWidth = 1000
+		FrameEpoch.advance()
+		area.update()
+		circle.update()
+
+		self.assertEqual(area.width, 510)
+		self.assertEqual(circle.radius, 255)
+
+	def test_expressionInElementsAndEndpoints(self):
+		half = DynamicValue(self.window, 'screenWidth', percent=50)
+		section = pgx.Section({'x': 0, 'y': 0, 'width': half * 2, 'height': 20}, pg.Color(0, 0, 0))
+		animated = AnimatedValue([half - 50, half + 50], 100)
+
+		self.assertEqual(section.width, 800)
+		self.assertEqual(animated.value, 350)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,65 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg
+import pg_extended as pgx
+from pg_extended.Core import DynamicValue, FrameEpoch
+
+class TestUpdateOrder(unittest.TestCase):
+	def setUp(self):
+		self.window = pgx.Window('test', (800, 600))
+		self.system = pgx.System(pg.Surface((800, 600)))
+
+	def resize(self, width: int):
+		self.window.screenWidth = width
+		self.window.notifyAttribute('screenWidth')
+		FrameEpoch.advance()
+
+	def test_dimensionReadsItsOwnArea(self):
+		circle = pgx.Circle({'x': 0, 'y': 0, 'radius': DynamicValue(self.window, 'screenWidth', percent=10)}, pg.Color(0, 0, 0))
+		circle.dimensions['x'] = DynamicValue(lambda circle: circle.radius * 2, args={'circle': circle})
+
+		self.system.addElement(circle, 'circle')
+		self.system.getUpdateOrder()
+
+		self.assertEqual(circle.dimensionOrder.index('radius') < circle.dimensionOrder.index('x'), True)
+
+		self.resize(1000)
+		self.system.lazyUpdate()
+
+		self.assertEqual(circle.radius, 100)
+		self.assertEqual(circle.x, 200)
+
+	def test_elementsFollowWhatTheyRead(self):
+		child = pgx.Section({'x': 0, 'y': 0, 'width': 10, 'height': 10}, pg.Color(0, 0, 0))
+		parent = pgx.Section({'x': 0, 'y': 0, 'width': DynamicValue(self.window, 'screenWidth', percent=50), 'height': 10}, pg.Color(0, 0, 0))
+		child.dimensions['width'] = DynamicValue(parent, 'width', percent=50)
+
+		self.system.addElement(child, 'child')
+		self.system.addElement(parent, 'parent')
+
+		self.assertEqual(self.system.getUpdateOrder(), ['parent', 'child'])
+		self.assertIsNone(parent.dimensionOrder)
+
+		self.resize(1000)
+		self.system.lazyUpdate()
+
+		self.assertEqual(child.width, 250)
+
+	def test_sliderDragElementOnResize(self):
+		section = pgx.Section({'x': DynamicValue(self.window, 'screenWidth', percent=10), 'y': 0, 'width': 200, 'height': 20}, pg.Color(0, 0, 0))
+		knob = pgx.Circle({'x': 0, 'y': 0, 'radius': DynamicValue(self.window, 'screenWidth', percent=1)}, pg.Color(0, 0, 0))
+		slider = pgx.Slider('horizontal', section, knob, (0, 100), 1, pg.Color(0, 0, 0))
+
+		self.system.addElement(slider, 'slider')
+		self.resize(1000)
+		self.system.lazyUpdate()
+
+		# value 0 puts the knob's center one radius into the track, with this frame's radius
+		self.assertEqual(knob.radius, 10)
+		self.assertEqual(knob.x, section.x + 10)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,45 @@
+import os
+import random
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg
+from pg_extended.Util.TextLayout import TextLayout
+
+class TestTextLayout(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		pg.font.init()
+
+	def test_cachedBreaksMatchFreshWrap(self):
+		rng = random.Random(0)
+		# kerning pairs (Wa, AV, To, ...) make summed word widths differ from measured lines
+		words = ['lorem', 'ipsum', 'dolor', 'sit', 'Wa', 'AV', 'To', 'x', 'Yo', 'LT', 'amet', 'consectetur', 'WAVE']
+
+		for fontSize in (16, 23, 40):
+			font = pg.font.Font(None, fontSize)
+			text = '\n'.join(' '.join(rng.choice(words) for _ in range(rng.randint(1, 40))) for _ in range(20))
+
+			cached = TextLayout(font)
+
+			for _ in range(400):
+				width = rng.randint(10, 600)
+
+				self.assertEqual(cached.wrap(text, width), TextLayout(font).wrap(text, width), f'size {fontSize}, width {width}')
+
+	def test_linesFitWidth(self):
+		font = pg.font.Font(None, 30)
+		layout = TextLayout(font)
+
+		for width in range(40, 400, 7):
+			lines, widths = layout.wrap('lorem Wa x sit amet AV To dolor consectetur', width)
+
+			for line, lineWidth in zip(lines, widths):
+				self.assertEqual(font.size(line)[0], lineWidth)
+
+				if ' ' in line:
+					self.assertLessEqual(lineWidth, width)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,77 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg
+import pg_extended as pgx
+from pg_extended.Core import DynamicValue, AnimatedValue, AnimationClock
+
+class Holder:
+	def __init__(self):
+		self.v = 0
+
+def headlessWindow(*args, **kwargs) -> pgx.Window:
+	window = pgx.Window(*args, **kwargs)
+	# the dummy video driver has no system cursors
+	window.setCursor = lambda cursor: None
+
+	return window
+
+class TestMainLoop(unittest.TestCase):
+	def test_idleAnimatedValueFollowsEndpoint(self):
+		holder = Holder()
+		window = headlessWindow('test', (200, 100), fps=0)
+		animated = AnimatedValue([DynamicValue(holder, 'v'), 100], 1000)
+		seen = []
+
+		def loop():
+			seen.append(animated.value)
+			holder.v += 10
+
+		window.customAnimatedValues['animated'] = animated
+		window.customLoopProcess = loop
+		window.openWindow(frames=3)
+
+		self.assertEqual(seen, [0, 10, 20])
+
+class TestAnimationClock(unittest.TestCase):
+	def setUp(self):
+		self.previousDefault = AnimationClock.default
+		AnimationClock.default = AnimationClock('fixed', 100)
+
+	def tearDown(self):
+		AnimationClock.default = self.previousDefault
+
+	def test_ownClockKeepsDefaultRunning(self):
+		own = AnimationClock('fixed', 10)
+		window = headlessWindow('test', (200, 100), fps=0, animationClock=own)
+		onDefault = AnimatedValue([0, 1000], 1000)
+		onOwn = AnimatedValue([0, 1000], 1000, clock=own)
+		seen = []
+
+		window.customLoopProcess = lambda: seen.append((round(onDefault.value), round(onOwn.value)))
+
+		onDefault.trigger()
+		onOwn.trigger()
+		window.openWindow(frames=3)
+
+		self.assertEqual(seen, [(100, 10), (200, 20), (300, 30)])
+
+	def test_setDefaultAfterCreatingValues(self):
+		animated = AnimatedValue([0, 1], 10)
+		pgx.Window('test', (200, 100))
+		replacement = AnimationClock('manual')
+
+		AnimationClock.setDefault(replacement)
+
+		animated.trigger()
+
+		self.assertIs(animated.clock, replacement)
+
+		# an animation is running on it now, its values would be left behind
+		with self.assertRaises(ValueError):
+			AnimationClock.setDefault(AnimationClock('manual'))
+
+if __name__ == '__main__':
+	unittest.main()